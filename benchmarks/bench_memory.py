@@ -0,0 +1,100 @@
+"""
+Peak RSS of load -> validate -> signals -> simulation, default vs compact dtypes.
+
+Each mode runs in a fresh subprocess so that peak RSS is not shared.
+Usage: python -m benchmarks.bench_memory [--rows N] [--pairs N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import numpy as np
+from benchmarks.synthetic import make_price_data
+
+
+def run_pipeline(path: str, compact: bool) -> dict:
+    from config import config
+    from core.backtester import Backtester
+    from core.data_loader import DataLoader
+    from strategies.sma_cross import SMACrossStrategy
+    from utils.profiling import current_rss, peak_rss
+
+    config.compact_dtypes = compact
+    # Keep every derived file next to the temporary cache and leave the
+    # snapshot write out of the measured peak
+    config.data_dir = os.path.dirname(path)
+    config.use_snapshot = False
+    baseline = current_rss()
+
+    loader = DataLoader(exchange=None)
+    loader.data_path = path
+    price_data = loader.load_data()
+    after_load = peak_rss()
+
+    strategy = SMACrossStrategy(price_data)
+    portfolio = Backtester(strategy, price_data).run()
+    portfolio.value()
+
+    return {
+        "mode": "compact" if compact else "default",
+        "price_mb": price_data.memory_usage().sum() / 2**20,
+        "peak_after_load_mb": (after_load - baseline) / 2**20,
+        "peak_total_mb": (peak_rss() - baseline) / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=40_320)  # four weeks of 1m bars
+    parser.add_argument("--pairs", type=int, default=120)
+    parser.add_argument(
+        "--child", nargs=2, metavar=("PATH", "MODE"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.child:
+        path, mode = args.child
+        print(json.dumps(run_pipeline(path, mode == "compact")))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        price_data = make_price_data(args.rows, args.pairs)
+        # Each mode reads a cache written in its own dtype, as DataLoader does
+        paths = {
+            "default": os.path.join(tmp, "default.parquet"),
+            "compact": os.path.join(tmp, "compact.parquet"),
+        }
+        price_data.to_parquet(paths["default"])
+        price_data.astype(np.float32).to_parquet(paths["compact"])
+        del price_data
+
+        print(f"{args.rows} rows x {args.pairs} pairs")
+        print(
+            f"{'mode':>8} {'prices [MiB]':>13} {'peak load [MiB]':>16} {'peak total [MiB]':>17}"
+        )
+        for mode, path in paths.items():
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.bench_memory",
+                    "--child",
+                    path,
+                    mode,
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{result['mode']:>8} {result['price_mb']:>13.1f} "
+                f"{result['peak_after_load_mb']:>16.1f} {result['peak_total_mb']:>17.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Per-stage timing and memory of the backtest pipeline on synthetic data.
+
+Times data validation and, for every configured strategy, signal
+generation, the backtest, metrics and saving results. Each stage is timed
+as the best of --repeat runs; a separate run under tracemalloc records the
+peak memory each stage allocates, so tracing does not skew the timings.
+The results are written as JSON, and --baseline compares them with an
+earlier file, exiting with 1 when a stage got slower than --tolerance. The
+baseline is never overwritten by its own comparison run.
+
+Usage: python -m benchmarks.bench_pipeline [--rows N] [--pairs N] [--seed N]
+       [--output benchmarks/baseline.json] [--baseline OLD.json]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+import vectorbt as vbt
+from benchmarks.synthetic import make_price_data
+from config import config
+from core.backtester import Backtester, wait_for_artifacts
+from core.data_loader import DataLoader
+from core.indicator_cache import get_indicator_cache
+from core.metrics import calculate_metrics
+
+
+def pipeline_stages(price_data: pd.DataFrame, strategy_classes: list) -> list:
+    """
+    (name, callable) of every stage. Stages of a strategy reuse the output
+    of the previous ones, so they must run in order.
+    """
+    loader = DataLoader(exchange=None)
+    stages = [("DataLoader._validate_data", lambda: loader._validate_data(price_data))]
+    state = {}
+
+    def run(strategy_cls):
+        state["strategy"] = strategy_cls(price_data)
+        state["backtester"] = Backtester(state["strategy"], price_data)
+        state["portfolio"] = state["backtester"].run()
+
+    def save(strategy_cls):
+        state["backtester"].save_results(
+            state["portfolio"], strategy_cls.__name__.lower()
+        )
+        wait_for_artifacts()
+
+    for strategy_cls in strategy_classes:
+        name = strategy_cls.__name__
+        stages += [
+            (
+                f"{name}.generate_signals",
+                lambda cls=strategy_cls: cls(price_data).generate_signals(),
+            ),
+            (f"{name}.Backtester.run", lambda cls=strategy_cls: run(cls)),
+            (
+                f"{name}.calculate_metrics",
+                lambda: calculate_metrics(state["portfolio"]),
+            ),
+            (f"{name}.save_results", lambda cls=strategy_cls: save(cls)),
+        ]
+    return stages
+
+
+def _run_stage(func):
+    # Indicators would otherwise be served from the previous stage's cache
+    get_indicator_cache().clear()
+    func()
+
+
+def measure_stages(price_data: pd.DataFrame, strategy_classes: list, repeat: int):
+    """Best-of-``repeat`` wall and CPU time and traced peak memory per stage."""
+    results = {}
+    stages = pipeline_stages(price_data, strategy_classes)
+    for _ in range(repeat):
+        for name, func in stages:
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            _run_stage(func)
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            best = results.setdefault(name, {"wall_s": wall, "cpu_s": cpu})
+            if wall < best["wall_s"]:
+                best.update(wall_s=wall, cpu_s=cpu)
+
+    tracemalloc.start()
+    try:
+        for name, func in stages:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            _run_stage(func)
+            _, peak = tracemalloc.get_traced_memory()
+            results[name]["peak_alloc_mb"] = (peak - baseline) / 2**20
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(stages: dict, baseline: dict, tolerance: float) -> list:
+    """Print wall time ratios against a baseline and return the regressed stages."""
+    regressions = []
+    print(f"{'stage':<48} {'base [s]':>9} {'now [s]':>9} {'ratio':>7}")
+    for name, record in stages.items():
+        base = baseline["stages"].get(name)
+        if base is None:
+            print(f"{name:<48} {'-':>9} {record['wall_s']:>9.4f}")
+            continue
+        ratio = record["wall_s"] / base["wall_s"] if base["wall_s"] else np.inf
+        flag = " !" if ratio > tolerance else ""
+        print(
+            f"{name:<48} {base['wall_s']:>9.4f} {record['wall_s']:>9.4f} "
+            f"{ratio:>6.2f}x{flag}"
+        )
+        if ratio > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_080)  # one week of 1m bars
+    parser.add_argument("--pairs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmarks/baseline.json")
+    parser.add_argument("--baseline", help="earlier output to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.25,
+        help="wall time ratio above which a stage counts as a regression",
+    )
+    args = parser.parse_args()
+
+    # Read the baseline before anything is written, as the default output
+    # is the checked-in baseline itself
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    price_data = make_price_data(args.rows, args.pairs, seed=args.seed)
+    with tempfile.TemporaryDirectory() as tmp, contextlib.chdir(tmp):
+        stages = measure_stages(price_data, config.strategies, args.repeat)
+
+    report = {
+        "meta": {
+            "rows": args.rows,
+            "pairs": args.pairs,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "commit": _git_commit(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "vectorbt": vbt.__version__,
+        },
+        "stages": stages,
+    }
+    if baseline is not None and os.path.realpath(args.output) == os.path.realpath(
+        args.baseline
+    ):
+        print(f"Not overwriting the baseline {args.baseline}, pass another --output")
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Stage timings written to {args.output}")
+
+    if baseline is not None:
+        if compare(stages, baseline, args.tolerance):
+            sys.exit(1)
+    else:
+        for name, record in stages.items():
+            print(
+                f"{name:<48} {record['wall_s']:>9.4f}s wall {record['cpu_s']:>9.4f}s cpu "
+                f"{record['peak_alloc_mb']:>9.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark SMACrossStrategy.generate_signals against the per-symbol ta loop.
+
+Usage: python -m benchmarks.bench_sma_cross [--rows N] [--pairs 10 100 500]
+"""
+
+import argparse
+import time
+import pandas as pd
+import ta
+from benchmarks.synthetic import make_price_data
+from strategies.sma_cross import SMACrossStrategy
+
+
+def legacy_generate_signals(strategy: SMACrossStrategy) -> pd.DataFrame:
+    """Reference implementation: one pair of ta.SMAIndicator objects per symbol."""
+    close_df = strategy.get_close_price()
+    signals = pd.DataFrame(index=close_df.index, columns=close_df.columns, data=0)
+
+    for symbol in close_df.columns:
+        close = close_df[symbol]
+        fast_sma = ta.trend.SMAIndicator(
+            close, window=strategy.fast_period
+        ).sma_indicator()
+        slow_sma = ta.trend.SMAIndicator(
+            close, window=strategy.slow_period
+        ).sma_indicator()
+        signals.loc[fast_sma > slow_sma, symbol] = 1
+        signals.loc[fast_sma < slow_sma, symbol] = -1
+
+    return strategy.normalize_signals(signals)
+
+
+def _best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=40_320)  # four weeks of 1m bars
+    parser.add_argument("--pairs", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'pairs':>6} {'legacy [s]':>12} {'vectorized [s]':>15} {'speedup':>8}")
+    for n_pairs in args.pairs:
+        price_data = make_price_data(args.rows, n_pairs)
+        strategy = SMACrossStrategy(price_data)
+
+        expected = legacy_generate_signals(strategy)
+        assert strategy.generate_signals().equals(expected), "signal mismatch"
+
+        legacy = _best_of(lambda: legacy_generate_signals(strategy), args.repeat)
+        vectorized = _best_of(strategy.generate_signals, args.repeat)
+        print(
+            f"{n_pairs:>6} {legacy:>12.4f} {vectorized:>15.4f} {legacy / vectorized:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
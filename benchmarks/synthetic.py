@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+
+def make_price_data(
+    n_rows: int, n_pairs: int, seed: int = 0, freq: str = "1min"
+) -> pd.DataFrame:
+    """
+    Build a synthetic multi-pair OHLCV frame in the loader's output layout.
+
+    Prices follow an independent geometric random walk per pair and volume is
+    drawn from a log-normal distribution, so results are deterministic for a
+    given seed.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of bars.
+    n_pairs : int
+        Number of trading pairs.
+    seed : int, optional
+        Seed for the random generator. Defaults to 0.
+    freq : str, optional
+        Bar frequency of the DatetimeIndex. Defaults to "1min".
+
+    Returns
+    -------
+    pd.DataFrame
+        OHLCV data with ("pair", "ohlcv") MultiIndex columns.
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2025-01-01", periods=n_rows, freq=freq, name="timestamp")
+    pairs = [f"P{i:04d}/BTC" for i in range(n_pairs)]
+
+    returns = rng.normal(0.0, 0.001, size=(n_rows, n_pairs))
+    close = 100.0 * np.exp(np.cumsum(returns, axis=0))
+    open_ = np.vstack([close[:1], close[:-1]])
+    spread = np.abs(rng.normal(0.0, 0.0005, size=(n_rows, n_pairs))) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.lognormal(5.0, 1.0, size=(n_rows, n_pairs))
+
+    fields = ["open", "high", "low", "close", "volume"]
+    data = np.stack([open_, high, low, close, volume], axis=2).reshape(n_rows, -1)
+    columns = pd.MultiIndex.from_product([pairs, fields], names=["pair", "ohlcv"])
+    return pd.DataFrame(data, index=index, columns=columns)
@@ -4,6 +4,7 @@ from strategies.rsi_bb import RSIBBStrategy
 from strategies.vwap_reversion import VWAPReversionStrategy
 from strategies.volume_spike_breakout import VolumeSpikeBreakoutStrategy
 from exchanges.binance import BinanceExchange
+from core.metrics import DEFAULT_METRICS
 
 
 @dataclass
@@ -19,14 +20,96 @@ class Config:
     end_date: str = "2025-02-28"
     fetch_delay_seconds: int = 0.5  # delay between paginated API requests
 
+    # Fetching: "sync" pages one pair at a time, "async" fetches pairs concurrently
+    fetch_mode: str = "sync"
+    fetch_rate_limit: float = 10.0  # requests per second across all pairs (async)
+    fetch_concurrency: int = 8  # pairs fetched at the same time (async)
+    fetch_max_retries: int = 5  # retries per request on network errors (async)
+    fetch_backoff_seconds: float = 1.0  # base delay of the exponential backoff
+
+    # Optional subset of pairs and [window_start, window_end) slice of the cached
+    # period to backtest; None means everything
+    pairs: list = None
+    window_start: str = None
+    window_end: str = None
+
     # Backtest parameters
     commission: float = 0.001  # 0.1%
     slippage: float = 0.0005  # 0.05%
 
+    # Metrics reported per pair, any of core.metrics.METRICS: the defaults
+    # plus "Total Trades" and "Profit Factor"
+    metrics: tuple = DEFAULT_METRICS
+
+    # Compact mode: float32 OHLCV and int8 signals end-to-end (halves price memory)
+    compact_dtypes: bool = False
+
+    # Write every strategy's signals to logs/<strategy>_signals.parquet (zstd)
+    # for debugging; off by default because the dump costs more than the
+    # simulation on large runs
+    dump_signals: bool = False
+
+    # Report artifacts rendered next to each metrics CSV, any of "equity",
+    # "heatmap" and "html"; empty for sweeps and CI. They are drawn on this
+    # many background threads while the next backtest runs (0 renders inline)
+    report_artifacts: tuple = ("equity", "heatmap", "html")
+    render_workers: int = 1
+    # Equity curves in HTML reports keep at most this many points per trace,
+    # picked to preserve each bucket's min and max (None keeps every bar);
+    # report_webgl draws them as WebGL (Scattergl) traces
+    report_max_points: int = 5_000
+    report_webgl: bool = False
+
+    # Parallel execution: 1 runs strategies sequentially, None uses one
+    # worker process per strategy (capped at the CPU count)
+    max_workers: int = 1
+
+    # Batched mode: simulate all strategies as groups of one vectorbt
+    # portfolio with (strategy, pair) columns and compare them in memory
+    batch_strategies: bool = False
+
+    # Walk-forward mode: optimize each strategy's param_grids entry on rolling
+    # train windows of this many rows and score the chosen parameters on the
+    # test windows that follow; None disables it
+    walk_forward_train_rows: int = None
+    walk_forward_test_rows: int = None
+    walk_forward_objective: str = "sharpe_ratio"  # vbt.Portfolio method to maximize
+
+    # Streaming mode: backtest the cached history in blocks of this many rows,
+    # carrying indicator warm-up and portfolio state across blocks, so memory
+    # is bounded by the block size; None loads the whole history
+    chunk_rows: int = None
+
+    # Rolling indicators shared between strategies and sweep combinations,
+    # evicted least recently used beyond the budget; set a directory to also
+    # keep them on disk across runs
+    indicator_cache_mb: int = 512
+    indicator_cache_dir: str = None
+
+    # Directory of the content-addressed backtest result cache: strategies
+    # whose data, code, parameters and costs are unchanged reuse the stored
+    # signals, orders and metrics instead of rerunning; None disables it
+    result_cache_dir: str = None
+
+    # Instrumentation: every run writes wall/CPU time, memory and sizes of
+    # each stage to this JSON report (None disables it); set profile_strategy
+    # to a strategy name, e.g. "SMACrossStrategy", to capture its backtest
+    # with profiler "cprofile" (logs/<name>.prof) or "pyinstrument"
+    run_report: str = "logs/run_report.json"
+    profile_strategy: str = None
+    profiler: str = "cprofile"
+
     # Paths and formats
     data_dir: str = "data/"
     results_dir: str = "results/"
     data_format: str = "parquet"
+    # "file" caches one file per data_file; "incremental" keeps a per-pair,
+    # month-partitioned store under data_dir/store and fetches only missing ranges
+    cache_mode: str = "file"
+    # Keep a memory-mapped Arrow snapshot of the validated frame and skip
+    # revalidation while its source checksum matches
+    use_snapshot: bool = True
+    parquet_row_group_size: int = 10_080  # one week of 1m bars per row group
     data_file_template: str = (
         "{base_currency}_{timeframe}_{start_date}_{end_date}_{num_pairs}.{data_format}"
     )
@@ -34,11 +117,15 @@ class Config:
     # Strategies
     strategies: list = None  # Will be initialized in __post_init__
 
+    # Parameter grids per strategy class, e.g.
+    # {SMACrossStrategy: {"fast_period": [5, 10, 20], "slow_period": [30, 50]}}
+    param_grids: dict = None  # Will be initialized in __post_init__
+
     # Supported exchanges
     supported_exchanges: dict = None  # Will be initialized in __post_init__
 
     def __post_init__(self):
-        """Initialize strategies and supported exchanges with default values."""
+        """Initialize strategies, parameter grids and supported exchanges with default values."""
         if self.strategies is None:
             self.strategies = [
                 SMACrossStrategy,
@@ -46,6 +133,8 @@ class Config:
                 VWAPReversionStrategy,
                 VolumeSpikeBreakoutStrategy,
             ]
+        if self.param_grids is None:
+            self.param_grids = {}
         if self.supported_exchanges is None:
             self.supported_exchanges = {"binance": BinanceExchange}
 
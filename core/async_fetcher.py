@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import random
+import time
+import ccxt
+import pandas as pd
+from core.ohlcv_buffer import OHLCVBuffer
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Global request rate limiter shared by all concurrent fetches.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``;
+    each request consumes one token and waits while the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self):
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class AsyncOHLCVFetcher:
+    """
+    Download paginated OHLCV history for many pairs concurrently.
+
+    Pages of a single pair are fetched sequentially (each page starts after
+    the last candle of the previous one), while up to ``max_concurrency``
+    pairs are in flight at once. Every request goes through a shared
+    ``TokenBucket`` and network errors are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        client,
+        rate_limit: float = 10.0,
+        max_concurrency: int = 8,
+        max_retries: int = 5,
+        backoff_seconds: float = 1.0,
+        page_limit: int = 1000,
+    ):
+        """
+        Parameters
+        ----------
+        client
+            A ccxt.async_support exchange (or any object exposing async
+            ``fetch_ohlcv`` and ``close``).
+        rate_limit : float, optional
+            Maximum requests per second across all pairs. Defaults to 10.
+        max_concurrency : int, optional
+            Maximum number of pairs fetched at the same time. Defaults to 8.
+        max_retries : int, optional
+            Retries per request on network errors. Defaults to 5.
+        backoff_seconds : float, optional
+            Base delay of the exponential backoff. Defaults to 1 second.
+        page_limit : int, optional
+            Candles requested per page. Defaults to 1000.
+        """
+        self.client = client
+        self.bucket = TokenBucket(rate_limit, capacity=max_concurrency)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.page_limit = page_limit
+
+    async def _request_page(self, pair: str, timeframe: str, since: int) -> list:
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            try:
+                return await self.client.fetch_ohlcv(
+                    pair, timeframe, since=since, limit=self.page_limit
+                )
+            except ccxt.NetworkError as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.backoff_seconds * 2**attempt * (1 + random.random() / 2)
+                logger.warning(
+                    f"[{pair}] Network error: {e}. Retry {attempt + 1}/"
+                    f"{self.max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+    async def fetch_pair(self, pair: str, timeframe: str, start, end) -> pd.DataFrame:
+        """
+        Fetch the ``[start, end)`` history of one pair with time-based
+        pagination.
+
+        Returns
+        -------
+        pd.DataFrame
+            OHLCV data indexed by timestamp, without duplicate candles, or an
+            empty DataFrame if the exchange returned nothing.
+        """
+        step = ccxt.Exchange.parse_timeframe(timeframe) * 1000
+        since = int(pd.Timestamp(start).timestamp() * 1000)
+        end_ts = int(pd.Timestamp(end).timestamp() * 1000)
+
+        buffer = OHLCVBuffer(since, end_ts, step)
+        while since < end_ts:
+            ohlcv = await self._request_page(pair, timeframe, since)
+            if not ohlcv:
+                logger.warning(f"[{pair}] Empty fetch. Stopping.")
+                break
+            next_since = buffer.append(ohlcv) + step
+            if next_since <= since:
+                logger.warning(f"[{pair}] Stuck pagination at {since}. Breaking.")
+                break
+            since = next_since
+
+        if not buffer.size:
+            logger.warning(f"[{pair}] No data fetched.")
+            return pd.DataFrame()
+
+        df = buffer.to_frame()
+        logger.info(
+            f"[{pair}] Finished fetch: {len(df)} rows from {df.index.min()} to {df.index.max()}"
+        )
+        return df
+
+    async def fetch_ranges(self, ranges: list[tuple], timeframe: str) -> list:
+        """
+        Fetch several (pair, start, end) ranges concurrently and close the
+        client afterwards.
+
+        Returns
+        -------
+        list
+            One DataFrame per range, or the exception raised after all
+            retries were exhausted.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(pair, start, end):
+            async with semaphore:
+                return await self.fetch_pair(pair, timeframe, start, end)
+
+        try:
+            return await asyncio.gather(
+                *(bounded(*request) for request in ranges), return_exceptions=True
+            )
+        finally:
+            await self.client.close()
+
+    async def fetch_pairs(
+        self, pairs: list[str], timeframe: str, start, end
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Fetch the same period for several pairs concurrently.
+
+        Returns
+        -------
+        dict[str, pd.DataFrame]
+            Frames keyed by pair in the order of ``pairs``. Pairs that failed
+            after all retries are logged and left out.
+        """
+        results = await self.fetch_ranges(
+            [(pair, start, end) for pair in pairs], timeframe
+        )
+        data = {}
+        for pair, result in zip(pairs, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Skipping {pair}: {result}")
+                continue
+            data[pair] = result
+        return data
+
+    def run(self, pairs: list[str], timeframe: str, start, end) -> dict:
+        """Blocking wrapper around ``fetch_pairs`` for synchronous callers."""
+        return asyncio.run(self.fetch_pairs(pairs, timeframe, start, end))
+
+    def run_ranges(self, ranges: list[tuple], timeframe: str) -> list:
+        """Blocking wrapper around ``fetch_ranges`` for synchronous callers."""
+        return asyncio.run(self.fetch_ranges(ranges, timeframe))
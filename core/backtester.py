@@ -1,22 +1,74 @@
+import contextlib
 import os
 import logging
+import numpy as np
 import pandas as pd
 import vectorbt as vbt
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from matplotlib.figure import Figure
+from core.downsample import minmax_downsample
 from core.metrics import calculate_metrics
+from core.results_store import ResultsStore
+from core.sweep import combination_label
+from utils.profiling import profile, stage
 from config import config
-import glob
 import plotly.graph_objs as go
 import plotly.io as pio
 
 logger = logging.getLogger(__name__)
 
+# Report artifacts save_results can render besides the metrics CSV
+ARTIFACTS = ("equity", "heatmap", "html")
+
+_render_pool = None
+_pending_renders = []
+
+
+def _submit_render(func, *args):
+    """Run a render job on the background pool, or inline without workers."""
+    global _render_pool
+    if not config.render_workers:
+        func(*args)
+        return
+    if _render_pool is None:
+        _render_pool = ThreadPoolExecutor(
+            max_workers=config.render_workers, thread_name_prefix="render"
+        )
+    _pending_renders.append(_render_pool.submit(func, *args))
+
+
+def wait_for_artifacts():
+    """Block until every artifact submitted by ``save_results`` is written."""
+    while _pending_renders:
+        _pending_renders.pop(0).result()
+
+
+class PortfolioSeries:
+    """
+    Series the report artifacts are drawn from, computed on first use and
+    shared by all artifacts of one portfolio.
+    """
+
+    def __init__(self, portfolio):
+        self.portfolio = portfolio
+
+    @cached_property
+    def total_equity(self) -> pd.DataFrame:
+        return Backtester._total_equity(self.portfolio)
+
+    @cached_property
+    def total_return(self) -> pd.Series:
+        return self.portfolio.total_return()
+
 
 class Backtester:
 
     def __init__(self, strategy, price_data: pd.DataFrame):
         self.strategy = strategy
         self.price_data = price_data
+        # int8 signals of the last run, aligned to the price index
+        self.signals = None
 
     def run(self):
         """
@@ -26,44 +78,45 @@ class Backtester:
             vbt.Portfolio: The backtest results or None if an error occurred.
         """
         logger.info("Running generate_signals()")
-        signals = self.strategy.generate_signals()
+        sizes = {
+            "strategy": self.strategy.name,
+            "rows": self.price_data.shape[0],
+            "pairs": self.price_data.columns.get_level_values(0).nunique(),
+        }
+        with stage("generate_signals", **sizes):
+            signals = self.strategy.generate_signals()
 
         if signals is None or signals.empty:
             logger.warning("No signals generated by the strategy")
             return None
 
-        # Ensure signals have same index as price data
-        signals = signals.reindex(self.price_data.index).fillna(0).astype(int)
-
+        # Signals normalized by the strategy already share the price index;
+        # anything else is aligned once, keeping them int8
         if not signals.index.equals(self.price_data.index):
-            logger.error("Signal and price_data index mismatch after reindexing")
-            return None
+            signals = signals.reindex(self.price_data.index, fill_value=0)
+        if not (signals.dtypes == np.int8).all():
+            signals = signals.fillna(0).astype(np.int8)
 
-        # Save signals for debugging
-        os.makedirs("logs", exist_ok=True)
-        debug_path = os.path.join(
-            "logs", f"{self.strategy.__class__.__name__.lower()}_signals.csv"
-        )
-        signals.to_csv(debug_path)
-        logger.info(f"Signals saved to {debug_path}")
+        self.signals = signals
+        if config.dump_signals:
+            self._dump_signals(signals)
 
         close = self.price_data.xs("close", level="ohlcv", axis=1)
+        close = self._broadcast_close(close, signals.columns)
         logger.info("Running portfolio simulation via VectorBT")
         try:
-            entries = (signals == 1).astype(bool)
-            exits = (signals == -1).astype(bool)
-
-            assert entries.index.equals(close.index)
-            assert entries.columns.equals(close.columns)
-
-            portfolio = vbt.Portfolio.from_signals(
-                close=close,
-                entries=entries,
-                exits=exits,
-                fees=float(config.commission),
-                slippage=float(config.slippage),
-                freq=config.timeframe,
-            )
+            # Bool masks straight from the signal array; vectorbt takes the
+            # index and columns from close, so no frames are built around them
+            values = signals.to_numpy()
+            with stage("simulate", columns=values.shape[1], **sizes):
+                portfolio = vbt.Portfolio.from_signals(
+                    close=close,
+                    entries=values == 1,
+                    exits=values == -1,
+                    fees=float(config.commission),
+                    slippage=float(config.slippage),
+                    freq=config.timeframe,
+                )
 
             logger.info("Portfolio simulation completed")
             return portfolio
@@ -71,80 +124,174 @@ class Backtester:
             logger.exception("Error during portfolio simulation")
             return None
 
-    def save_results(self, portfolio, strategy_name: str):
-        """Main method to save all result artifacts."""
+    def _dump_signals(self, signals: pd.DataFrame):
+        """Save signals for debugging as a zstd-compressed parquet file."""
+        os.makedirs("logs", exist_ok=True)
+        path = os.path.join("logs", f"{self.strategy.name.lower()}_signals.parquet")
+        signals.to_parquet(path, compression="zstd")
+        logger.info(f"Signals saved to {path}")
+
+    @staticmethod
+    def _broadcast_close(close: pd.DataFrame, columns: pd.Index) -> pd.DataFrame:
+        """
+        Tile close prices to match signal columns with extra parameter levels.
+
+        Parameter sweeps produce signals with (param..., pair) columns; each
+        column takes the close series of its pair so that every combination
+        runs inside the same simulation.
+        """
+        if columns.equals(close.columns):
+            return close
+
+        pairs = columns.get_level_values(close.columns.name)
+        indexer = close.columns.get_indexer(pairs)
+        if (indexer < 0).any():
+            missing = sorted(set(pairs[indexer < 0]))
+            raise ValueError(f"Signals reference pairs without prices: {missing}")
+
+        return pd.DataFrame(
+            close.to_numpy()[:, indexer], index=close.index, columns=columns
+        )
+
+    def save_results(self, portfolio, strategy_name: str, artifacts=None):
+        """
+        Save the metrics and render the requested report artifacts.
+
+        Metrics are written right away and returned. Plots and HTML reports
+        are rendered in a background thread so the next backtest can start;
+        call ``wait_for_artifacts`` before reading them.
+
+        Parameters
+        ----------
+        portfolio : vbt.Portfolio
+            Portfolio to report on.
+        strategy_name : str
+            Prefix of the files written under ``results/``.
+        artifacts : iterable of str, optional
+            Subset of ``ARTIFACTS`` to render; defaults to
+            ``config.report_artifacts``.
+
+        Returns
+        -------
+        pd.DataFrame
+            The metrics frame, or None if they could not be calculated.
+        """
         if portfolio is None:
             logger.warning("No portfolio to save results for")
-            return
+            return None
 
-        logger.info("Saving portfolio metrics and equity curve")
-        self._save_metrics(portfolio, strategy_name)
-        self._save_equity_curve(portfolio, strategy_name)
-        self._save_heatmap(portfolio, strategy_name)
-        self._save_interactive_report(portfolio, strategy_name)
+        artifacts = tuple(config.report_artifacts if artifacts is None else artifacts)
+        unknown = sorted(set(artifacts) - set(ARTIFACTS))
+        if unknown:
+            raise ValueError(f"Unknown report artifacts {unknown}, use {ARTIFACTS}")
+
+        logger.info("Saving portfolio metrics")
+        metrics = self._save_metrics(portfolio, strategy_name)
+        if artifacts:
+            _submit_render(
+                self._render_artifacts,
+                PortfolioSeries(portfolio),
+                strategy_name,
+                artifacts,
+            )
+        return metrics
+
+    def _render_artifacts(self, series, strategy_name: str, artifacts: tuple):
+        """Render artifacts one after another, sharing the portfolio series."""
+        renderers = {
+            "equity": self._save_equity_curve,
+            "heatmap": self._save_heatmap,
+            "html": self._save_interactive_report,
+        }
+        for artifact in artifacts:
+            with stage(f"artifact_{artifact}", strategy=strategy_name):
+                renderers[artifact](series, strategy_name)
 
     def _save_metrics(self, portfolio, strategy_name: str):
-        """Calculate and save portfolio metrics as CSV."""
+        """Calculate portfolio metrics and append them to the results store."""
         try:
-            metrics = calculate_metrics(portfolio)
-            os.makedirs("results", exist_ok=True)
-            path = f"results/{strategy_name}_metrics.csv"
-            metrics.to_csv(path)
-            logger.info(f"Metrics saved to {path}")
+            with stage("metrics", strategy=strategy_name):
+                metrics = calculate_metrics(portfolio)
+            ResultsStore.in_dir("results").append(metrics, self.strategy.name)
+            return metrics
         except Exception:
             logger.exception("Error calculating or saving metrics")
+            return None
 
-    def _save_equity_curve(self, portfolio, strategy_name: str):
+    @staticmethod
+    def _total_equity(portfolio) -> pd.DataFrame:
+        """
+        Portfolio value summed over pairs: a single "Total Equity" column, or
+        one column per parameter combination for sweeps, whose columns are
+        (param..., pair).
+        """
+        value = portfolio.value()
+        if value.columns.nlevels == 1:
+            return value.sum(axis=1).to_frame("Total Equity")
+
+        params = list(range(value.columns.nlevels - 1))
+        total_equity = value.T.groupby(level=params, sort=False).sum().T
+        names = value.columns.names[:-1]
+        total_equity.columns = [
+            combination_label(names, np.atleast_1d(combo))
+            for combo in total_equity.columns
+        ]
+        return total_equity
+
+    def _save_equity_curve(self, series, strategy_name: str):
         """Plot and save equity curve as PNG."""
         try:
-            total_equity = portfolio.value().sum(axis=1)
-            plt.figure(figsize=(10, 6))
-            plt.plot(total_equity, label="Total Equity", color="blue")
-            plt.title(f"Equity Curve - {strategy_name}")
-            plt.xlabel("Time")
-            plt.ylabel("Equity")
-            plt.legend()
-            plt.grid(True)
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
+            for label, equity in series.total_equity.items():
+                ax.plot(equity, label=label)
+            ax.set_title(f"Equity Curve - {strategy_name}")
+            ax.set_xlabel("Time")
+            ax.set_ylabel("Equity")
+            ax.legend()
+            ax.grid(True)
             os.makedirs("results/screenshots", exist_ok=True)
             path = f"results/screenshots/{strategy_name}_equity.png"
-            plt.savefig(path)
-            plt.close()
+            fig.savefig(path)
             logger.info(f"Equity curve saved to {path}")
         except Exception:
             logger.exception("Error saving equity curve")
 
-    def _save_heatmap(self, portfolio, strategy_name: str):
+    def _save_heatmap(self, series, strategy_name: str):
         """Plot and save total return per symbol as heatmap (bar plot)."""
         try:
-            total_return = portfolio.total_return()
-            fig, ax = plt.subplots(figsize=(12, 6))
-            total_return.plot(kind="bar", ax=ax, color="skyblue")
+            fig = Figure(figsize=(12, 6))
+            ax = fig.subplots()
+            series.total_return.plot(kind="bar", ax=ax, color="skyblue")
             ax.set_title(f"Total Return per Symbol - {strategy_name}")
             ax.set_xlabel("Symbol")
             ax.set_ylabel("Return (%)")
             ax.grid(True)
-            plt.tight_layout()
+            fig.tight_layout()
+            os.makedirs("results/screenshots", exist_ok=True)
             path = f"results/screenshots/{strategy_name}_heatmap.png"
-            plt.savefig(path)
-            plt.close()
+            fig.savefig(path)
             logger.info(f"Heatmap saved to {path}")
         except Exception:
             logger.exception("Error saving heatmap")
 
-    def _save_interactive_report(self, portfolio, strategy_name: str):
+    def _save_interactive_report(self, series, strategy_name: str):
         """Generate and save an interactive HTML report."""
         try:
-            total_equity = portfolio.value().sum(axis=1)
-
+            # Long histories are cut to a point budget that keeps every
+            # bucket's extremes, and WebGL traces keep large plots responsive
+            trace = go.Scattergl if config.report_webgl else go.Scatter
             fig_equity = go.Figure()
-            fig_equity.add_trace(
-                go.Scatter(
-                    x=total_equity.index,
-                    y=total_equity.values,
-                    mode="lines",
-                    name="Total Equity",
+            for label, equity in series.total_equity.items():
+                equity = minmax_downsample(equity, config.report_max_points)
+                fig_equity.add_trace(
+                    trace(
+                        x=equity.index,
+                        y=equity.values,
+                        mode="lines",
+                        name=label,
+                    )
                 )
-            )
             fig_equity.update_layout(
                 title=f"Equity Curve - {strategy_name}",
                 xaxis_title="Time",
@@ -161,13 +308,19 @@ class Backtester:
 
     @classmethod
     def compare_strategies_metrics(
-        cls, results_dir="results", output_file="strategy_comparison.csv"
+        cls, results_dir="results", output_file="strategy_comparison.csv", metrics=None
     ):
         """
         Load, compare, and visualize strategy metrics.
+
+        ``metrics`` takes per-pair metrics indexed by strategy name, e.g. from
+        a batched run; when None the latest metrics of every strategy are
+        queried from the results store in ``results_dir``.
         """
         logger.info("Comparing strategy metrics...")
-        metrics_dfs = cls._load_all_metrics(results_dir)
+        if metrics is None:
+            metrics = ResultsStore.in_dir(results_dir).load()
+        metrics_dfs = metrics
         if metrics_dfs.empty:
             logger.warning("No metrics found for comparison.")
             return pd.DataFrame()
@@ -177,28 +330,6 @@ class Backtester:
 
         return metrics_dfs
 
-    @staticmethod
-    def _load_all_metrics(results_dir: str) -> pd.DataFrame:
-        """
-        Load all *_metrics.csv files from directory.
-        """
-        metrics_files = glob.glob(os.path.join(results_dir, "*_metrics.csv"))
-        all_metrics = []
-
-        for file in metrics_files:
-            try:
-                strategy_name = os.path.basename(file).replace("_metrics.csv", "")
-                df = pd.read_csv(file, index_col=0)
-                df["strategy"] = strategy_name
-                all_metrics.append(df)
-            except Exception as e:
-                logger.warning(f"Failed to read metrics from {file}: {e}")
-
-        if all_metrics:
-            combined = pd.concat(all_metrics)
-            return combined.set_index("strategy")
-        return pd.DataFrame()
-
     @staticmethod
     def _save_combined_metrics(df: pd.DataFrame, results_dir: str, output_file: str):
         """
@@ -227,34 +358,70 @@ class Backtester:
             # Sort values for plotting
             df = df.sort_values("Total Return [%]")
 
-            plt.figure(figsize=(10, 6))
-            plt.barh(df["strategy"], df["Total Return [%]"], color="skyblue")
-            plt.title("Total Return Comparison by Strategy")
-            plt.xlabel("Total Return [%]")
-            plt.tight_layout()
-            plt.savefig(plot_path)
-            plt.close()
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
+            ax.barh(df["strategy"], df["Total Return [%]"], color="skyblue")
+            ax.set_title("Total Return Comparison by Strategy")
+            ax.set_xlabel("Total Return [%]")
+            fig.tight_layout()
+            fig.savefig(plot_path)
             logger.info(f"Comparison chart saved to {plot_path}")
         except Exception as e:
             logger.warning(f"Failed to generate comparison chart: {e}")
 
 
-def run_strategy(strategy):
-    """Run backtest for a given strategy instance and save results."""
-    strategy_name = strategy.__class__.__name__
-
-    try:
-        logger.info(f"Starting backtest for {strategy_name}")
-
-        backtester = Backtester(strategy, strategy.price_data)
+def backtest_strategy(strategy):
+    """
+    Backtest a strategy instance, save its results and return the metrics.
+
+    With ``config.result_cache_dir`` set, a strategy whose data, code,
+    parameters and cost settings match an earlier run skips the backtest:
+    its cached metrics are appended to the results store and returned.
+    Report artifacts are only rendered for actual runs. Errors propagate.
+    """
+    from core.result_cache import get_result_cache
+
+    strategy_name = strategy.name
+    cache = get_result_cache()
+    key = cache.key(strategy) if cache is not None else None
+    if key is not None:
+        metrics = cache.load_metrics(key)
+        if metrics is not None:
+            logger.info(f"Using cached results for {strategy_name}")
+            ResultsStore.in_dir("results").append(metrics, strategy_name)
+            return metrics
+
+    logger.info(f"Starting backtest for {strategy_name}")
+    backtester = Backtester(strategy, strategy.price_data)
+    capture = (
+        profile(strategy_name, config.profiler)
+        if strategy_name == config.profile_strategy
+        else contextlib.nullcontext()
+    )
+    with capture:
         portfolio = backtester.run()
+        if portfolio is None:
+            raise RuntimeError("Backtest produced no portfolio")
 
         logger.info(f"Backtest completed for {strategy_name}, saving results")
-        backtester.save_results(portfolio, strategy_name.lower())
+        metrics = backtester.save_results(portfolio, strategy_name.lower())
+    if key is not None and metrics is not None:
+        cache.store(key, backtester.signals, portfolio, metrics)
+    return metrics
+
+
+def run_strategy(strategy):
+    """Run backtest for a given strategy instance, save results and return metrics."""
+    strategy_name = strategy.name
+
+    try:
+        metrics = backtest_strategy(strategy)
         logger.info(f"Results saved successfully for {strategy_name}")
+        return metrics
 
     except Exception as e:
         logger.error(
             f"Error running backtest for {strategy_name}: {e}",
             exc_info=True,
         )
+        return None
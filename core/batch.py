@@ -0,0 +1,111 @@
+import logging
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+import vectorbt as vbt
+from config import config
+from core.backtester import Backtester
+from core.metrics import calculate_metrics
+from core.sweep import ParameterSweep, combination_label, strategy_label
+from utils.utils import build_strategy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchResult:
+    """One grouped portfolio holding every strategy, with stats kept in memory."""
+
+    portfolio: vbt.Portfolio
+
+    def strategy_metrics(self) -> pd.DataFrame:
+        """
+        Metrics per strategy group. Each group trades its pairs with separate
+        cash, and its returns are those of the summed group value.
+        """
+        return calculate_metrics(self.portfolio, per_group=True)
+
+    def pair_metrics(self) -> pd.DataFrame:
+        """Metrics of every (strategy, pair) column."""
+        return calculate_metrics(self.portfolio)
+
+
+def _strategy_signals(strategy) -> tuple[np.ndarray, list, pd.Index]:
+    """
+    int8 signals of a strategy with the strategy label and pair of each
+    column. Sweep combinations become strategies of their own, labelled as
+    in the results store, e.g.
+    "SMACrossStrategySweep(fast_period=5, slow_period=30)".
+    """
+    signals = strategy.generate_signals()
+    if not signals.index.equals(strategy.price_data.index):
+        signals = signals.reindex(strategy.price_data.index, fill_value=0)
+    pairs = signals.columns.get_level_values(-1)
+
+    if isinstance(strategy, ParameterSweep):
+        names = signals.columns.names[:-1]
+        labels = [
+            strategy_label(strategy.name, combination_label(names, column[:-1]))
+            for column in signals.columns
+        ]
+    else:
+        labels = [strategy.name] * signals.shape[1]
+    return signals.to_numpy(dtype=np.int8), labels, pairs
+
+
+def run_strategies_batched(strategy_classes: list, price_data: pd.DataFrame):
+    """
+    Simulate all strategies in a single grouped portfolio.
+
+    The signals of every strategy are laid side by side in one int8 array
+    with (strategy, pair) columns, and a single
+    ``vbt.Portfolio.from_signals`` call with ``group_by="strategy"`` runs
+    them all. Per-strategy and per-pair stats then come from the same
+    portfolio instead of one simulation per strategy and a CSV round trip.
+
+    Parameters
+    ----------
+    strategy_classes : list
+        StrategyBase subclasses to run; parameter grids from
+        ``config.param_grids`` apply as usual.
+    price_data : pd.DataFrame
+        Validated OHLCV data with all fields the strategies need.
+
+    Returns
+    -------
+    BatchResult
+        The grouped portfolio, or None if no strategy produced signals.
+    """
+    blocks, labels, pairs = [], [], []
+    for strategy_cls in strategy_classes:
+        strategy = build_strategy(strategy_cls, price_data)
+        logger.info(f"Generating signals for {strategy.name}")
+        values, strategy_labels, strategy_pairs = _strategy_signals(strategy)
+        blocks.append(values)
+        labels.extend(strategy_labels)
+        pairs.extend(strategy_pairs)
+    if not labels:
+        logger.warning("No signals generated by the strategies")
+        return None
+
+    close = price_data.xs("close", level="ohlcv", axis=1)
+    columns = pd.MultiIndex.from_arrays(
+        [labels, pairs], names=["strategy", close.columns.name]
+    )
+    signals = np.hstack(blocks)
+    close = Backtester._broadcast_close(close, columns)
+
+    logger.info(
+        f"Running {len(strategy_classes)} strategies as one grouped portfolio "
+        f"with {signals.shape[1]} columns"
+    )
+    portfolio = vbt.Portfolio.from_signals(
+        close=close,
+        entries=signals == 1,
+        exits=signals == -1,
+        fees=float(config.commission),
+        slippage=float(config.slippage),
+        freq=config.timeframe,
+        group_by="strategy",
+    )
+    return BatchResult(portfolio=portfolio)
@@ -0,0 +1,514 @@
+import logging
+import os
+from dataclasses import dataclass
+from functools import cached_property
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import vectorbt as vbt
+from numba import njit
+from vectorbt.portfolio.enums import (
+    Direction,
+    OrderSide,
+    OrderStatus,
+    ProcessOrderState,
+    SizeType,
+    order_dt,
+)
+from vectorbt.portfolio.nb import execute_order_nb, order_nb
+from vectorbt.returns.nb import returns_nb
+from vectorbt.utils.datetime_ import freq_to_timedelta
+from vectorbt.utils.math_ import add_nb
+from config import config
+from core.backtester import Backtester
+from core.indicator_cache import private_indicator_cache
+from core.metrics import MetricInputs, metrics_frame
+from core.results_store import ResultsStore
+from core.snapshot import index_columns, select_columns
+from utils.utils import build_strategy
+
+logger = logging.getLogger(__name__)
+
+
+@njit(cache=True)
+def simulate_block_nb(
+    close,
+    signals,
+    row_offset,
+    fees,
+    slippage,
+    min_size,
+    cash,
+    position,
+    debt,
+    free_cash,
+    val_price,
+    value_cash,
+    value_assets,
+    peak_value,
+    max_drawdown,
+    exposure_rows,
+    value_out,
+    order_records,
+):
+    """
+    Simulate one time block of long-only signals, updating the carried state.
+
+    Follows ``simulate_from_signals_nb`` for the settings ``Backtester`` uses
+    (long only, all-in entries, no accumulation, no stops) and orders go
+    through the same ``execute_order_nb``, so fills match an in-memory
+    ``from_signals`` run bit for bit. ``value_cash`` and ``value_assets``
+    repeat the cumulative sums ``Portfolio.value()`` builds from the order
+    records, which is why they are carried apart from the simulated cash.
+
+    Returns the number of order records written.
+    """
+    oidx = 0
+    n_rows, n_cols = close.shape
+    for col in range(n_cols):
+        for i in range(n_rows):
+            price = close[i, col]
+            if not np.isnan(price):
+                val_price[col] = price
+
+            # Entries open a position with all cash, exits close it
+            signal = signals[i, col]
+            size = 0.0
+            direction = Direction.Both
+            if position[col] > 0:
+                if signal == -1:
+                    size = -abs(position[col])
+                    direction = Direction.LongOnly
+            elif position[col] == 0:
+                if signal == 1:
+                    size = np.inf
+
+            cash_flow = 0.0
+            asset_flow = 0.0
+            if size != 0:
+                value_now = cash[col]
+                if position[col] != 0:
+                    value_now += position[col] * val_price[col]
+                order = order_nb(
+                    size=size,
+                    price=price,
+                    size_type=SizeType.Amount,
+                    direction=direction,
+                    fees=fees,
+                    slippage=slippage,
+                    min_size=min_size,
+                )
+                state = ProcessOrderState(
+                    cash=cash[col],
+                    position=position[col],
+                    debt=debt[col],
+                    free_cash=free_cash[col],
+                    val_price=val_price[col],
+                    value=value_now,
+                    oidx=0,
+                    lidx=0,
+                )
+                exec_state, result = execute_order_nb(state, order)
+                cash[col] = exec_state.cash
+                position[col] = exec_state.position
+                debt[col] = exec_state.debt
+                free_cash[col] = exec_state.free_cash
+
+                if result.status == OrderStatus.Filled:
+                    filled = result.size
+                    if result.side == OrderSide.Sell:
+                        filled = -filled
+                    cash_flow = add_nb(0.0, -filled * result.price - result.fees)
+                    asset_flow = add_nb(0.0, filled)
+
+                    record = order_records[oidx]
+                    record["id"] = oidx
+                    record["col"] = col
+                    record["idx"] = row_offset + i
+                    record["size"] = result.size
+                    record["price"] = result.price
+                    record["fees"] = result.fees
+                    record["side"] = result.side
+                    oidx += 1
+
+            value_cash[col] = add_nb(value_cash[col], cash_flow)
+            value_assets[col] = add_nb(value_assets[col], asset_flow)
+            value = value_cash[col] + price * value_assets[col]
+            value_out[i, col] = value
+
+            if value_assets[col] != 0:
+                exposure_rows[col] += 1
+            if not np.isnan(value):
+                if np.isnan(peak_value[col]) or value > peak_value[col]:
+                    peak_value[col] = value
+                drawdown = value / peak_value[col] - 1
+                if np.isnan(max_drawdown[col]) or drawdown < max_drawdown[col]:
+                    max_drawdown[col] = drawdown
+    return oidx
+
+
+@dataclass
+class PortfolioState:
+    """Per-column portfolio state carried from one block to the next."""
+
+    cash: np.ndarray
+    position: np.ndarray
+    debt: np.ndarray
+    free_cash: np.ndarray
+    val_price: np.ndarray
+    value_cash: np.ndarray
+    value_assets: np.ndarray
+    peak_value: np.ndarray
+    max_drawdown: np.ndarray
+    exposure_rows: np.ndarray
+    # Value before the next block and running count, mean and sum of
+    # squared deviations of the returns
+    prev_value: np.ndarray
+    return_count: np.ndarray
+    return_mean: np.ndarray
+    return_m2: np.ndarray
+
+    @classmethod
+    def initial(cls, n_cols: int, init_cash: float) -> "PortfolioState":
+        cash = np.full(n_cols, float(init_cash))
+        return cls(
+            cash=cash,
+            position=np.zeros(n_cols),
+            debt=np.zeros(n_cols),
+            free_cash=cash.copy(),
+            val_price=np.full(n_cols, np.nan),
+            value_cash=cash.copy(),
+            value_assets=np.zeros(n_cols),
+            peak_value=np.full(n_cols, np.nan),
+            max_drawdown=np.full(n_cols, np.nan),
+            exposure_rows=np.zeros(n_cols, dtype=np.int64),
+            prev_value=cash.copy(),
+            return_count=np.zeros(n_cols, dtype=np.int64),
+            return_mean=np.zeros(n_cols),
+            return_m2=np.zeros(n_cols),
+        )
+
+    def add_returns(self, value: np.ndarray):
+        """
+        Fold the returns of one block of values into the running moments.
+
+        Returns are those of ``Portfolio.returns()``; block moments are merged
+        with the parallel variance update, so the Sharpe ratio needs neither
+        the whole series nor a second pass over it.
+        """
+        returns = returns_nb(value, self.prev_value)
+        self.prev_value = value[-1].copy()
+
+        count = np.count_nonzero(~np.isnan(returns), axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.nansum(returns, axis=0) / count
+            m2 = np.nansum((returns - mean) ** 2, axis=0)
+            total = self.return_count + count
+            delta = mean - self.return_mean
+            weight = count / total
+            merged_mean = self.return_mean + delta * weight
+            merged_m2 = self.return_m2 + m2 + delta**2 * self.return_count * weight
+        has_returns = count > 0
+        self.return_mean = np.where(has_returns, merged_mean, self.return_mean)
+        self.return_m2 = np.where(has_returns, merged_m2, self.return_m2)
+        self.return_count = total
+
+
+@dataclass
+class ChunkedResult:
+    """Summary of a chunked backtest; per-row values are streamed to disk."""
+
+    name: str
+    columns: pd.Index
+    n_rows: int
+    init_cash: float
+    state: PortfolioState
+    orders: pd.DataFrame
+
+    @property
+    def final_value(self) -> pd.Series:
+        return pd.Series(
+            self.state.value_cash + self.state.val_price * self.state.value_assets,
+            index=self.columns,
+        )
+
+    def metrics(self, metrics=None) -> pd.DataFrame:
+        """
+        Metrics of the streamed run, computed by ``core.metrics``.
+
+        Parameters
+        ----------
+        metrics : iterable of str, optional
+            Names from ``METRICS``. Defaults to ``config.metrics``.
+        """
+        return metrics_frame(_StreamedInputs(self), self.columns, metrics)
+
+
+class _StreamedInputs(MetricInputs):
+    """
+    Metric inputs of a chunked run: summaries from its final state and
+    trades rebuilt from its order records.
+    """
+
+    def __init__(self, result: ChunkedResult):
+        self.result = result
+        state = result.state
+        self.n_cols = len(result.columns)
+        self.init_cash = np.full(self.n_cols, result.init_cash)
+        self.final_value = result.final_value.to_numpy()
+        self.return_moments = (state.return_count, state.return_mean, state.return_m2)
+        self.ann_factor = freq_to_timedelta(
+            vbt.settings.returns["year_freq"]
+        ) / freq_to_timedelta(config.timeframe)
+        self.max_drawdown = state.max_drawdown
+        self.exposure = state.exposure_rows / result.n_rows
+
+    @cached_property
+    def trades(self) -> np.ndarray:
+        """
+        Column and PnL of every trade, open ones included.
+
+        Entries buy with all cash and exits sell the whole position, so in
+        the column-major records every buy is closed by the sell that
+        follows it in the same column; open trades are valued at the last
+        close, without exit fees, as vbt does.
+        """
+        orders = self.result.orders
+        cols = orders["col"].to_numpy()
+        side = orders["side"].to_numpy()
+        price = orders["price"].to_numpy()
+        fees = orders["fees"].to_numpy()
+
+        entries = np.flatnonzero(side == OrderSide.Buy)
+        following = np.minimum(entries + 1, len(orders) - 1)
+        closed = (
+            (entries + 1 < len(orders))
+            & (cols[following] == cols[entries])
+            & (side[following] == OrderSide.Sell)
+        )
+        exit_price = np.where(
+            closed, price[following], self.result.state.val_price[cols[entries]]
+        )
+        exit_fees = np.where(closed, fees[following], 0.0)
+
+        trades = np.empty(len(entries), dtype=[("col", np.int64), ("pnl", np.float64)])
+        trades["col"] = cols[entries]
+        trades["pnl"] = (
+            orders["size"].to_numpy()[entries] * (exit_price - price[entries])
+            - fees[entries]
+            - exit_fees
+        )
+        return trades
+
+
+class ChunkedBacktester:
+    """
+    Backtest a strategy over a cached price file one time block at a time.
+
+    Blocks of ``chunk_rows`` rows are streamed from the validated parquet
+    cache. Each block is prefixed with the last ``warmup_period`` rows of
+    history so rolling indicators see the same window as in a full run, and
+    recursive indicators continue from the strategy's ``final_state`` of the
+    previous block. Cash and positions are carried across block boundaries
+    by ``simulate_block_nb``. Peak memory depends on the block size, not on the
+    length of the history.
+    """
+
+    def __init__(
+        self,
+        strategy_cls,
+        data_path: str,
+        chunk_rows: int,
+        pairs=None,
+        start=None,
+        end=None,
+    ):
+        if chunk_rows <= 0:
+            raise ValueError(f"chunk_rows must be positive, got {chunk_rows}")
+        self.strategy_cls = strategy_cls
+        self.data_path = data_path
+        self.chunk_rows = chunk_rows
+        self.pairs = pairs
+        self.start = start
+        self.end = end
+
+    def iter_blocks(self):
+        """Yield price frames of about ``chunk_rows`` rows in time order."""
+        dataset = ds.dataset(self.data_path, format="parquet")
+        fields = set(self.strategy_cls.required_fields) | {"close"}
+        columns = select_columns(dataset.schema.names, self.pairs, fields)
+        (index_name,) = index_columns(dataset.schema)
+
+        condition = None
+        if self.start is not None:
+            condition = ds.field(index_name) >= pd.Timestamp(self.start)
+        if self.end is not None:
+            upper = ds.field(index_name) < pd.Timestamp(self.end)
+            condition = upper if condition is None else condition & upper
+
+        # Parquet batches stop at row group boundaries; regroup them to the
+        # requested block size
+        pending, n_pending = [], 0
+        for batch in dataset.to_batches(
+            columns=columns + [index_name],
+            filter=condition,
+            batch_size=self.chunk_rows,
+        ):
+            pending.append(batch)
+            n_pending += batch.num_rows
+            if n_pending >= self.chunk_rows:
+                yield pa.Table.from_batches(pending).to_pandas()
+                pending, n_pending = [], 0
+        if n_pending:
+            yield pa.Table.from_batches(pending).to_pandas()
+
+    def run(self, value_path: str = None) -> ChunkedResult:
+        """
+        Run the backtest block by block.
+
+        Parameters
+        ----------
+        value_path : str, optional
+            Parquet file receiving the per-column portfolio value, written
+            one block at a time. Skipped when None.
+
+        Returns
+        -------
+        ChunkedResult
+            Final state, order records and streamed metrics, or None if the
+            file has no rows in the selected window.
+        """
+        init_cash = float(vbt.settings.portfolio["init_cash"])
+        min_size = float(vbt.settings.portfolio["min_size"])
+        name = None
+        warmup = 0
+        history = None
+        signal_state = None
+        state = None
+        columns = None
+        writer = None
+        order_blocks = []
+        n_rows = 0
+
+        try:
+            for block in self.iter_blocks():
+                frame = block if history is None else pd.concat([history, block])
+                # Every block has its own fingerprint, so its indicators would
+                # only crowd the shared cache
+                with private_indicator_cache():
+                    strategy = build_strategy(self.strategy_cls, frame)
+                    strategy.initial_state = signal_state
+                    if state is None:
+                        name = strategy.name
+                        warmup = strategy.warmup_period
+
+                    signals = strategy.generate_signals()
+                signals = signals.iloc[len(frame) - len(block) :]
+                signal_state = strategy.final_state
+                close = Backtester._broadcast_close(
+                    block.xs("close", level="ohlcv", axis=1), signals.columns
+                )
+                if state is None:
+                    columns = signals.columns
+                    state = PortfolioState.initial(len(columns), init_cash)
+                    logger.info(
+                        f"Chunked backtest of {name}: {len(columns)} columns, "
+                        f"{self.chunk_rows} rows per block, {warmup} warm-up rows"
+                    )
+
+                signal_values = signals.to_numpy(dtype=np.int8)
+                value = np.empty(signal_values.shape)
+                records = np.empty(np.count_nonzero(signal_values), dtype=order_dt)
+                n_orders = simulate_block_nb(
+                    close.to_numpy(dtype=np.float64),
+                    signal_values,
+                    n_rows,
+                    float(config.commission),
+                    float(config.slippage),
+                    min_size,
+                    state.cash,
+                    state.position,
+                    state.debt,
+                    state.free_cash,
+                    state.val_price,
+                    state.value_cash,
+                    state.value_assets,
+                    state.peak_value,
+                    state.max_drawdown,
+                    state.exposure_rows,
+                    value,
+                    records,
+                )
+                order_blocks.append(records[:n_orders])
+                state.add_returns(value)
+
+                if value_path is not None:
+                    table = pa.Table.from_pandas(
+                        pd.DataFrame(value, index=block.index, columns=columns)
+                    )
+                    if writer is None:
+                        writer = pq.ParquetWriter(value_path, table.schema)
+                    writer.write_table(table)
+
+                n_rows += len(block)
+                history = frame.iloc[-warmup:] if warmup else None
+                logger.debug(f"Processed {n_rows} rows, {n_orders} orders in block")
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if state is None:
+            logger.warning(f"No rows to backtest in {self.data_path}")
+            return None
+
+        # Order records in the column-major order vbt uses
+        records = np.concatenate(order_blocks)
+        records = records[np.lexsort((records["idx"], records["col"]))]
+        records["id"] = np.arange(len(records))
+        orders = pd.DataFrame.from_records(records)
+
+        return ChunkedResult(
+            name=name,
+            columns=columns,
+            n_rows=n_rows,
+            init_cash=init_cash,
+            state=state,
+            orders=orders,
+        )
+
+
+def run_strategy_chunked(strategy_cls, data_path: str):
+    """Run a chunked backtest for a strategy class, save results and return metrics."""
+    try:
+        backtester = ChunkedBacktester(
+            strategy_cls,
+            data_path,
+            config.chunk_rows,
+            pairs=config.pairs,
+            start=config.window_start,
+            end=config.window_end,
+        )
+        os.makedirs("results", exist_ok=True)
+        # The strategy name (e.g. a sweep) is only known once the run starts
+        partial_path = f"results/{strategy_cls.__name__.lower()}_value.partial"
+        result = backtester.run(value_path=partial_path)
+        if result is None:
+            return None
+
+        value_path = f"results/{result.name.lower()}_value.parquet"
+        os.replace(partial_path, value_path)
+        orders_path = f"results/{result.name.lower()}_orders.parquet"
+        result.orders.to_parquet(orders_path)
+        metrics = result.metrics()
+        ResultsStore.in_dir("results").append(metrics, result.name)
+        logger.info(f"Values saved to {value_path}, orders to {orders_path}")
+        return metrics
+
+    except Exception as e:
+        logger.error(
+            f"Error running chunked backtest for {strategy_cls.__name__}: {e}",
+            exc_info=True,
+        )
+        return None
@@ -1,23 +1,50 @@
+import json
 import os
 import pandas as pd
 import numpy as np
 import pyarrow.parquet as pq
 import logging
 from core.exchange import ExchangeBase
+from core.async_fetcher import AsyncOHLCVFetcher
+from core.ohlcv_store import OHLCVStore
+from core.snapshot import (
+    file_fingerprint,
+    index_columns,
+    make_checksum,
+    read_snapshot,
+    select_columns,
+    write_snapshot,
+)
+from utils.profiling import measure, stage
 from config import config
 
 logger = logging.getLogger(__name__)
 
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _column_values(df: pd.DataFrame):
+    """
+    Yield the values of every column. Unlike ``df.to_numpy()`` this never
+    consolidates a frame built from many blocks (one per pair) into a copy.
+    """
+    for _, column in df.items():
+        yield column.to_numpy()
+
 
 class DataLoader:
     def __init__(self, exchange: ExchangeBase):
         self.exchange = exchange
         self.data_path = os.path.join(config.data_dir, config.data_file)
+        self.snapshot_path = os.path.splitext(self.data_path)[0] + ".validated.arrow"
+        self.verdict_path = os.path.splitext(self.data_path)[0] + ".verdict.json"
 
     def _replace_infinite_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Replace infinite values in a DataFrame with NaN.
 
+        The frame is only rewritten when it actually contains infinite values.
+
         Parameters
         ----------
         df: pd.DataFrame
@@ -28,8 +55,9 @@ class DataLoader:
         pd.DataFrame
             DataFrame with inf values replaced with NaN
         """
-        n_inf_before = np.isinf(df.values).sum()
-        df.replace([np.inf, -np.inf], np.nan, inplace=True)
+        n_inf_before = sum(int(np.isinf(values).sum()) for values in _column_values(df))
+        if n_inf_before:
+            df.replace([np.inf, -np.inf], np.nan, inplace=True)
         logger.debug(f"[VALIDATION] Replaced {n_inf_before} inf values with NaN")
         return df
 
@@ -37,7 +65,10 @@ class DataLoader:
         """
         Fill NaN values in a DataFrame with the value from the previous row.
 
-        This method works in-place.
+        This method works in-place. Leading NaNs are back-filled. NaNs are
+        counted once per column; after forward and backward filling only
+        columns that were entirely NaN can still contain missing values, so
+        no second count is needed.
 
         Parameters
         ----------
@@ -49,13 +80,18 @@ class DataLoader:
         pd.DataFrame
             DataFrame with NaN values filled with the previous row's value
         """
-        n_nan_before = df.isna().sum().sum()
+        nan_per_column = np.array(
+            [np.isnan(values).sum() for values in _column_values(df)], dtype=np.int64
+        )
+        n_nan_before = int(nan_per_column.sum())
         logger.debug(f"[VALIDATION] NaNs before filling: {n_nan_before}")
+        if not n_nan_before:
+            return df
 
         df.ffill(inplace=True)
         df.bfill(inplace=True)
 
-        n_nan_after = df.isna().sum().sum()
+        n_nan_after = int((nan_per_column == len(df)).sum()) * len(df)
         logger.debug(f"[VALIDATION] NaNs after filling: {n_nan_after}")
         return df
 
@@ -81,9 +117,15 @@ class DataLoader:
 
         if isinstance(df.columns, pd.MultiIndex) and "ohlcv" in df.columns.names:
             close_cols = df.xs("close", level="ohlcv", axis=1)
-            df = df[(close_cols >= 0).all(axis=1)]
+            keep = (close_cols.to_numpy() >= 0).all(axis=1)
         elif "close" in df.columns:
-            df = df[df["close"] >= 0]
+            keep = (df["close"] >= 0).to_numpy()
+        else:
+            keep = None
+
+        # Only slice (and copy) the frame when some rows are actually removed
+        if keep is not None and not keep.all():
+            df = df[keep]
 
         after_filtering = df.shape[0]
         logger.debug(
@@ -91,12 +133,13 @@ class DataLoader:
         )
         return df
 
-    def _final_checks(self, df: pd.DataFrame):
+    def _final_checks(self, df: pd.DataFrame, required_fields=OHLCV_FIELDS):
         """
         Perform final validation checks on the loaded data.
 
         These checks ensure that the DataFrame has the correct shape and
-        structure, and that it contains the required columns.
+        structure, and that it contains the required columns (all OHLCV
+        fields unless a projected load asked for fewer).
 
         Raises
         ------
@@ -110,14 +153,14 @@ class DataLoader:
             raise ValueError("Loaded data is empty after filtering")
         if not pd.api.types.is_datetime64_any_dtype(df.index):
             raise ValueError("Index must be datetime")
-        if df.isnull().any().any():
+        if any(np.isnan(values).any() for values in _column_values(df)):
             raise ValueError("Data contains remaining missing values")
         if not isinstance(df.columns, pd.MultiIndex):
             raise ValueError("Data must have MultiIndex columns")
         if df.columns.names != ["pair", "ohlcv"]:
             raise ValueError(f"Incorrect MultiIndex column names: {df.columns.names}")
 
-        required_cols = {"open", "high", "low", "close", "volume"}
+        required_cols = set(required_fields)
         cols = set(df.columns.get_level_values(1))
         if not required_cols.issubset(cols):
             missing_cols = required_cols - cols
@@ -146,45 +189,40 @@ class DataLoader:
         pd.DataFrame
             Filtered DataFrame with low-quality assets removed.
         """
-        valid_pairs = []
+        close = df.xs("close", level="ohlcv", axis=1)
+        volume = df.xs("volume", level="ohlcv", axis=1)
+
+        # One vectorized pass per rule over all pairs
+        has_low_price = (close.to_numpy() <= price_threshold).any(axis=0)
+        zero_volume_share = (volume.to_numpy() == 0).mean(axis=0)
+        too_many_zero_volume = zero_volume_share > zero_volume_ratio
+
+        for pair in close.columns[has_low_price]:
+            logger.debug(f"[FILTER] {pair}: contains close <= {price_threshold}")
+        for pair, share in zip(
+            volume.columns[too_many_zero_volume],
+            zero_volume_share[too_many_zero_volume],
+        ):
+            logger.debug(f"[FILTER] {pair}: {share:.2%} zero-volume rows")
+
+        valid_pairs = close.columns[~has_low_price & ~too_many_zero_volume]
         all_pairs = df.columns.get_level_values("pair").unique()
-
-        for pair in all_pairs:
-            close = df[(pair, "close")]
-            volume = df[(pair, "volume")]
-
-            # Check for very low prices
-            low_price_mask = close <= price_threshold
-
-            # Check for excessive zero volume
-            zero_volume_mask = volume == 0
-            zero_volume_ratio_actual = zero_volume_mask.sum() / len(volume)
-
-            if low_price_mask.any():
-                logger.debug(f"[FILTER] {pair}: contains close <= {price_threshold}")
-            if zero_volume_ratio_actual > zero_volume_ratio:
-                logger.debug(
-                    f"[FILTER] {pair}: {zero_volume_ratio_actual:.2%} zero-volume rows"
-                )
-
-            if (
-                not low_price_mask.any()
-                and zero_volume_ratio_actual <= zero_volume_ratio
-            ):
-                valid_pairs.append(pair)
-
-        filtered_df = df.loc[:, df.columns.get_level_values("pair").isin(valid_pairs)]
         logger.info(
             f"[FILTER] Kept {len(valid_pairs)} valid pairs out of {len(all_pairs)}"
         )
-        return filtered_df
+        if len(valid_pairs) == len(all_pairs):
+            return df
+        return df.loc[:, df.columns.get_level_values("pair").isin(valid_pairs)]
 
-    def _validate_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _validate_data(
+        self, df: pd.DataFrame, required_fields=OHLCV_FIELDS
+    ) -> pd.DataFrame:
         """
         Validate loaded data by applying filters and checks.
 
         Performs the following validation steps:
 
+        0. Casts all fields to float32 if ``config.compact_dtypes`` is set.
         1. Replaces infinite values with NaN.
         2. Fills NaN values with the value from the previous row.
         3. Filters out rows with negative close values.
@@ -196,33 +234,361 @@ class DataLoader:
         ----------
         df: pd.DataFrame
             DataFrame to validate
+        required_fields: iterable of str, optional
+            OHLCV fields that must be present. Defaults to all five.
 
         Returns
         -------
         pd.DataFrame
             Validated DataFrame
         """
-        logger.info(f"[VALIDATION] Initial shape: {df.shape}")
+        with stage(
+            "validate",
+            rows=df.shape[0],
+            pairs=df.columns.get_level_values(0).nunique(),
+        ):
+            logger.info(f"[VALIDATION] Initial shape: {df.shape}")
+
+            if config.compact_dtypes and not (df.dtypes == np.float32).all():
+                with measure("cast_float32", logger, "[VALIDATION]"):
+                    df = df.astype(np.float32)
+
+            steps = [
+                self._replace_infinite_values,
+                self._fill_missing_values,
+                self._filter_negative_close,
+                self._filter_low_quality_assets,
+            ]
+            for step in steps:
+                with measure(step.__name__.lstrip("_"), logger, "[VALIDATION]"):
+                    df = step(df)
+
+            logger.info(f"[VALIDATION] Shape after filtering: {df.shape}")
+
+            with measure("final_checks", logger, "[VALIDATION]"):
+                self._final_checks(df, required_fields)
+            logger.info(
+                f"[VALIDATION] Final shape after validation: {df.shape}, "
+                f"{df.memory_usage(index=True).sum() / 2**20:.1f} MiB"
+            )
+
+            return df
+
+    def _fetch_pairs(self, pairs: list[str]) -> dict[str, pd.DataFrame]:
+        """Fetch OHLCV data for each pair one after another."""
+        data = {}
+        for pair in pairs:
+            try:
+                logger.info(
+                    f"Loading data is from {config.start_date} to {config.end_date}"
+                )
+                df = self.exchange.fetch_full_ohlcv(
+                    pair,
+                    config.timeframe,
+                    config.start_date,
+                    config.end_date,
+                    config.fetch_delay_seconds,
+                )
+                data[pair] = df
+            except ValueError as e:
+                logger.warning(f"Skipping {pair}: {e}")
+                continue
+        return data
+
+    def _create_async_fetcher(self) -> AsyncOHLCVFetcher:
+        """
+        Async fetcher for the exchange, or None if it has no async client.
+        It pages with the exchange's ``page_limit``, like the sync fetch.
+        """
+        try:
+            client = self.exchange.create_async_client()
+        except ValueError as e:
+            logger.warning(f"{e}, falling back to sync fetching")
+            return None
+
+        return AsyncOHLCVFetcher(
+            client,
+            rate_limit=config.fetch_rate_limit,
+            max_concurrency=config.fetch_concurrency,
+            max_retries=config.fetch_max_retries,
+            backoff_seconds=config.fetch_backoff_seconds,
+            page_limit=getattr(self.exchange, "page_limit", 1000),
+        )
+
+    def _fetch_pairs_async(self, pairs: list[str]) -> dict[str, pd.DataFrame]:
+        """Fetch OHLCV data for all pairs concurrently with AsyncOHLCVFetcher."""
+        fetcher = self._create_async_fetcher()
+        if fetcher is None:
+            return self._fetch_pairs(pairs)
+
+        logger.info(
+            f"Loading data is from {config.start_date} to {config.end_date} "
+            f"with up to {config.fetch_concurrency} concurrent pairs"
+        )
+        return fetcher.run(pairs, config.timeframe, config.start_date, config.end_date)
+
+    def _fetch_ranges(self, ranges: list[tuple]) -> list:
+        """
+        Fetch (pair, start, end) ranges, returning a DataFrame or the raised
+        exception for each range.
+        """
+        fetcher = self._create_async_fetcher() if config.fetch_mode == "async" else None
+        if fetcher is not None:
+            return fetcher.run_ranges(ranges, config.timeframe)
+
+        results = []
+        for pair, start, end in ranges:
+            try:
+                results.append(
+                    self.exchange.fetch_full_ohlcv(
+                        pair, config.timeframe, start, end, config.fetch_delay_seconds
+                    )
+                )
+            except ValueError as e:
+                results.append(e)
+        return results
+
+    def _load_incremental(self, selection: dict) -> pd.DataFrame:
+        """
+        Load the configured window from the per-pair OHLCVStore, fetching
+        only the ranges that are not stored yet.
+
+        The pair list stored with the last fetch is reused while it covers
+        the whole window, so a fully stored window needs no network access.
+        """
+        store = OHLCVStore(os.path.join(config.data_dir, "store"), config.timeframe)
+        start, end = pd.Timestamp(config.start_date), pd.Timestamp(config.end_date)
+        pairs = store.pair_list(config.base_currency, config.num_pairs)
+        if pairs is None or any(
+            store.missing_ranges(pair, start, end) for pair in pairs
+        ):
+            pairs = self.exchange.get_top_pairs(config.base_currency, config.num_pairs)
+            store.save_pair_list(config.base_currency, config.num_pairs, pairs)
+
+        gaps = [
+            (pair, gap_start, gap_end)
+            for pair in pairs
+            for gap_start, gap_end in store.missing_ranges(pair, start, end)
+        ]
+        logger.info(
+            f"[STORE] {len(gaps)} missing ranges to fetch for {len(pairs)} pairs"
+        )
+        if gaps:
+            for (pair, gap_start, gap_end), result in zip(
+                gaps, self._fetch_ranges(gaps)
+            ):
+                if isinstance(result, Exception):
+                    logger.warning(
+                        f"Skipping {pair} range {gap_start} - {gap_end}: {result}"
+                    )
+                    continue
+                store.write(pair, result, gap_start, gap_end)
+
+        checksum = self._snapshot_checksum(
+            store.manifest_fingerprint(), pairs, str(start), str(end)
+        )
+        df = self._read_snapshot(checksum, selection)
+        if df is not None:
+            return df
 
-        df = self._replace_infinite_values(df)
-        df = self._fill_missing_values(df)
-        df = self._filter_negative_close(df)
-        df = self._filter_low_quality_assets(df)
+        data = {}
+        for pair in pairs:
+            df = store.read(pair, start, end)
+            if not df.empty:
+                data[pair] = df
 
-        logger.info(f"[VALIDATION] Shape after filtering: {df.shape}")
+        if not data:
+            raise ValueError("No valid data available in the OHLCV store")
 
-        self._final_checks(df)
-        logger.info(f"[VALIDATION] Final shape after validation: {df.shape}")
+        combined_df = self._combine_pairs(data)
+        logger.info(f"Combined data shape before validation: {combined_df.shape}")
+        combined_df = self._validate_data(combined_df)
+        self._write_snapshot(combined_df, checksum)
+        return self._project(combined_df, **selection)
+
+    def _snapshot_checksum(self, *source) -> str:
+        """Checksum of the data source plus the settings that shape validation."""
+        return make_checksum(source, config.compact_dtypes)
+
+    def _read_snapshot(self, checksum: str, selection: dict):
+        if not config.use_snapshot:
+            return None
+        return read_snapshot(self.snapshot_path, checksum, **selection)
+
+    def _write_snapshot(self, df: pd.DataFrame, checksum: str):
+        if config.use_snapshot:
+            write_snapshot(df, self.snapshot_path, checksum)
 
+    def _combine_pairs(self, data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Combine per-pair OHLCV frames into one frame with ("pair", "ohlcv")
+        MultiIndex columns.
+        """
+        frames = []
+        for pair, df in data.items():
+            df.columns = pd.MultiIndex.from_product(
+                [[pair], df.columns], names=["pair", "ohlcv"]
+            )
+            frames.append(df)
+            logger.debug(f"Fetched {pair} with shape {df.shape}")
+            logger.info(
+                f"{pair} has {len(df)} rows, from {df.index.min()} to {df.index.max()}"
+            )
+        return pd.concat(frames, axis=1)
+
+    @staticmethod
+    def _project(
+        df: pd.DataFrame, pairs=None, fields=None, start=None, end=None
+    ) -> pd.DataFrame:
+        """Select pairs, fields and the [start, end) window of an in-memory frame."""
+        if start is not None or end is not None:
+            lo = 0 if start is None else df.index.searchsorted(pd.Timestamp(start))
+            hi = len(df) if end is None else df.index.searchsorted(pd.Timestamp(end))
+            df = df.iloc[lo:hi]
+        if pairs is not None or fields is not None:
+            mask = np.ones(df.shape[1], dtype=bool)
+            if pairs is not None:
+                mask &= df.columns.get_level_values("pair").isin(pairs)
+            if fields is not None:
+                mask &= df.columns.get_level_values("ohlcv").isin(fields)
+            df = df.loc[:, mask]
+        return df
+
+    def _read_parquet(self, pairs=None, fields=None, start=None, end=None):
+        """
+        Read the cached parquet file with column selection and a time filter
+        pushed down to the reader, so unselected columns and row groups
+        outside the window are never decoded.
+        """
+        schema = pq.read_schema(self.data_path)
+        columns = select_columns(schema.names, pairs, fields)
+
+        filters = []
+        (index_name,) = index_columns(schema)
+        if start is not None:
+            filters.append((index_name, ">=", pd.Timestamp(start)))
+        if end is not None:
+            filters.append((index_name, "<", pd.Timestamp(end)))
+
+        logger.info(
+            f"Loading {len(columns)} of {len(schema.names)} cached columns "
+            f"from {self.data_path} with filters {filters}"
+        )
+        table = pq.read_table(
+            self.data_path,
+            columns=columns,
+            filters=filters or None,
+            use_pandas_metadata=True,
+        )
+        return table.to_pandas()
+
+    def _read_verdict(self, checksum: str):
+        """Stored validation verdict of the parquet cache, if still current."""
+        if not os.path.exists(self.verdict_path):
+            return None
+        with open(self.verdict_path) as f:
+            verdict = json.load(f)
+        if verdict["checksum"] != checksum:
+            logger.info(f"Validation verdict {self.verdict_path} is stale")
+            return None
+        return verdict
+
+    def _write_verdict(
+        self, checksum: str, raw_index: pd.Index, df: pd.DataFrame, clean: bool
+    ):
+        """
+        Record what full-history validation did to the parquet cache: the
+        pairs it kept, the rows it dropped and whether it had to replace
+        infinite or missing values.
+        """
+        verdict = {
+            "checksum": checksum,
+            "clean": clean,
+            "pairs": df.columns.get_level_values("pair").unique().tolist(),
+            "dropped_rows": [str(ts) for ts in raw_index.difference(df.index)],
+        }
+        tmp_path = f"{self.verdict_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(verdict, f)
+        os.replace(tmp_path, self.verdict_path)
+
+    def _read_validated_window(self, verdict: dict, selection: dict):
+        """
+        Push the selection down into the parquet read and apply the stored
+        verdict of the full history instead of validating the window alone,
+        whose pair filters would see only part of the data.
+        """
+        pairs = verdict["pairs"]
+        if selection["pairs"] is not None:
+            pairs = [pair for pair in pairs if pair in selection["pairs"]]
+        df = self._read_parquet(
+            pairs=pairs,
+            fields=selection["fields"],
+            start=selection["start"],
+            end=selection["end"],
+        )
+        if verdict["dropped_rows"]:
+            df = df[~df.index.isin(pd.DatetimeIndex(verdict["dropped_rows"]))]
+        if config.compact_dtypes and not (df.dtypes == np.float32).all():
+            df = df.astype(np.float32)
+        self._final_checks(df, selection["fields"] or OHLCV_FIELDS)
         return df
 
-    def load_data(self) -> pd.DataFrame:
+    def _load_cached(self, selection: dict, projected: bool) -> pd.DataFrame:
+        checksum = self._snapshot_checksum(file_fingerprint(self.data_path))
+        df = self._read_snapshot(checksum, selection)
+        if df is not None:
+            return df
+
+        if projected and not config.use_snapshot:
+            verdict = self._read_verdict(checksum)
+            # Pushed-down reads cannot repeat the forward fill across the
+            # window start, so only clean files take this path
+            if verdict is not None and verdict["clean"]:
+                return self._read_validated_window(verdict, selection)
+
+        logger.info(f"Loading cached data from {self.data_path}")
+        raw = pq.read_table(self.data_path).to_pandas()
+        logger.debug(f"Loaded columns: {raw.columns}")
+        clean = not any((~np.isfinite(values)).any() for values in _column_values(raw))
+        raw_index = raw.index
+        df = self._validate_data(raw)
+        self._write_snapshot(df, checksum)
+        if not config.use_snapshot:
+            self._write_verdict(checksum, raw_index, df, clean)
+        return self._project(df, **selection)
+
+    def load_data(self, pairs=None, fields=None, start=None, end=None) -> pd.DataFrame:
         """
         Load price data from the local cache or fetch from the exchange.
 
         This method attempts to load price data from a cached file in Parquet format.
         If the cached file does not exist or the data format is not Parquet, it fetches
         the OHLCV data for the top trading pairs from the exchange, validates, and caches it.
+        With ``config.cache_mode == "incremental"`` the per-pair OHLCVStore is used
+        instead and only missing time ranges are fetched.
+
+        Validated data is also written as a memory-mapped Arrow snapshot; while
+        the checksum of its source matches, later loads map the snapshot and
+        skip validation entirely.
+
+        Pair, field and time filters are applied as early as possible: as column
+        and row slices of the mapped snapshot, or pushed down into the parquet
+        read when snapshots are disabled. The pushed-down read applies the
+        verdict of a full-history validation (kept pairs, dropped rows),
+        stored next to the cache by the first full load, so both paths
+        return the same data.
+
+        Parameters
+        ----------
+        pairs : iterable of str, optional
+            Trading pairs to load. Defaults to all cached pairs.
+        fields : iterable of str, optional
+            OHLCV fields to load, e.g. ``("close",)``. Defaults to all five.
+        start : str or pd.Timestamp, optional
+            Inclusive start of the time window.
+        end : str or pd.Timestamp, optional
+            Exclusive end of the time window.
 
         Returns
         -------
@@ -235,54 +601,46 @@ class DataLoader:
         ValueError
             If no valid data is fetched from the exchange.
         """
+        selection = {"pairs": pairs, "fields": fields, "start": start, "end": end}
+        projected = any(value is not None for value in selection.values())
+
+        if config.cache_mode == "incremental":
+            return self._load_incremental(selection)
 
         if os.path.exists(self.data_path) and config.data_format == "parquet":
-            logger.info(f"Loading cached data from {self.data_path}")
-            df = pq.read_table(self.data_path).to_pandas()
-            logger.debug(f"Loaded columns: {df.columns}")
-            df = self._validate_data(df)
-            return df
+            return self._load_cached(selection, projected)
 
         logger.info(f"Fetching data from exchange to save at {self.data_path}")
         pairs = self.exchange.get_top_pairs(config.base_currency, config.num_pairs)
         logger.info(f"Fetching data for {len(pairs)} pairs: {pairs}")
 
-        data = {}
-        for pair in pairs:
-            try:
-                logger.info(
-                    f"Loading data is from {config.start_date} to {config.end_date}"
-                )
-                df = self.exchange.fetch_full_ohlcv(
-                    pair,
-                    config.timeframe,
-                    config.start_date,
-                    config.end_date,
-                    config.fetch_delay_seconds,
-                )
-                df.columns = pd.MultiIndex.from_product(
-                    [[pair], df.columns], names=["pair", "ohlcv"]
-                )
-                data[pair] = df
-                logger.debug(f"Fetched {pair} with shape {df.shape}")
-                logger.info(
-                    f"{pair} has {len(df)} rows, from {df.index.min()} to {df.index.max()}"
-                )
-            except ValueError as e:
-                logger.warning(f"Skipping {pair}: {e}")
-                continue
+        if config.fetch_mode == "async":
+            data = self._fetch_pairs_async(pairs)
+        else:
+            data = self._fetch_pairs(pairs)
 
         if not data:
             raise ValueError("No valid data fetched from exchange")
 
-        combined_df = pd.concat(data.values(), axis=1)
+        combined_df = self._combine_pairs(data)
         logger.info(f"Combined data shape before validation: {combined_df.shape}")
         combined_df = self._validate_data(combined_df)
 
         os.makedirs(config.data_dir, exist_ok=True)
         if config.data_format == "parquet":
-            combined_df.to_parquet(self.data_path, compression="snappy")
+            # Row groups let time-window reads skip whole blocks of the file
+            combined_df.to_parquet(
+                self.data_path,
+                compression="snappy",
+                row_group_size=config.parquet_row_group_size,
+            )
             logger.info(f"Data saved to {self.data_path}")
+            checksum = self._snapshot_checksum(file_fingerprint(self.data_path))
+            self._write_snapshot(combined_df, checksum)
+            if not config.use_snapshot:
+                # The file holds validated data, so validating it again would
+                # keep every pair and row
+                self._write_verdict(checksum, combined_df.index, combined_df, True)
 
             # Save as CSV for debugging
             csv_path = self.data_path.replace(".parquet", ".csv")
@@ -292,4 +650,4 @@ class DataLoader:
             flat_df.to_csv(csv_path)
             logger.info(f"Data also saved to {csv_path} for debugging")
 
-        return combined_df
+        return self._project(combined_df, **selection)
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+
+def minmax_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Positions of the points kept when downsampling a series to a budget.
+
+    The first and last points are always kept. The points in between are
+    split into equal buckets, and each bucket keeps its minimum and its
+    maximum, so peaks and drawdowns survive however long the series is.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        1-D series to downsample.
+    max_points : int
+        Upper bound on the number of points kept, at least 4. None keeps
+        every point.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted, unique int64 positions into ``values``.
+    """
+    n = len(values)
+    if max_points is None or n <= max_points:
+        return np.arange(n)
+    if max_points < 4:
+        raise ValueError(f"max_points must be at least 4, got {max_points}")
+
+    interior = np.asarray(values[1:-1], dtype=np.float64)
+    bucket_size = -(-len(interior) // ((max_points - 2) // 2))
+    n_buckets = -(-len(interior) // bucket_size)
+    pad = n_buckets * bucket_size - len(interior)
+
+    # Pad the last bucket so that padding is never picked as min or max
+    lows = np.concatenate([interior, np.full(pad, np.inf)])
+    highs = np.concatenate([interior, np.full(pad, -np.inf)])
+    starts = np.arange(n_buckets) * bucket_size + 1
+    argmin = lows.reshape(n_buckets, bucket_size).argmin(axis=1)
+    argmax = highs.reshape(n_buckets, bucket_size).argmax(axis=1)
+
+    return np.unique(np.concatenate([[0], starts + argmin, starts + argmax, [n - 1]]))
+
+
+def minmax_downsample(series: pd.Series, max_points: int) -> pd.Series:
+    """Downsample a series to at most ``max_points``, see ``minmax_indices``."""
+    return series.iloc[minmax_indices(series.to_numpy(), max_points)]
@@ -21,3 +21,12 @@ class ExchangeBase(ABC):
     def get_top_pairs(self, base_currency: str, limit: int) -> list[str]:
         """Return a list of top trading pairs by liquidity."""
         pass
+
+    def create_async_client(self):
+        """
+        Return a ccxt.async_support client for concurrent fetching.
+
+        Raises ValueError for exchanges without an async client; DataLoader
+        then falls back to sync fetching.
+        """
+        raise ValueError(f"{self.__class__.__name__} does not support async fetching")
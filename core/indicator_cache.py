@@ -0,0 +1,199 @@
+import contextlib
+import hashlib
+import logging
+import os
+import weakref
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+ROLLING_STATS = ("mean", "sum", "std", "min", "max")
+
+# Fingerprints by (id() of the price frame, field), dropped with the frame
+_fingerprints = {}
+
+
+def _forget(frame_id: int):
+    for key in [key for key in _fingerprints if key[0] == frame_id]:
+        del _fingerprints[key]
+
+
+def data_fingerprint(price_data: pd.DataFrame, field: str) -> str:
+    """
+    Content hash of one OHLCV field of a price frame: index, pairs and values.
+
+    Hashing costs one pass over the field and is memoized per frame object,
+    so strategies sharing the same ``price_data`` pay for it once. Frames
+    must not be modified in place once fingerprinted.
+    """
+    key = (id(price_data), field)
+    fingerprint = _fingerprints.get(key)
+    if fingerprint is not None:
+        return fingerprint
+
+    frame = price_data.xs(field, level="ohlcv", axis=1)
+    digest = hashlib.sha1()
+    digest.update(repr((frame.shape, frame.columns.tolist())).encode())
+    digest.update(pd.util.hash_pandas_object(frame.index).to_numpy().data)
+    for _, values in frame.items():
+        digest.update(np.ascontiguousarray(values.to_numpy()).data)
+    fingerprint = digest.hexdigest()
+
+    if not any(frame_id == id(price_data) for frame_id, _ in _fingerprints):
+        weakref.finalize(price_data, _forget, id(price_data))
+    _fingerprints[key] = fingerprint
+    return fingerprint
+
+
+class IndicatorCache:
+    """
+    Memoize indicator frames computed from price data.
+
+    Entries are keyed by (indicator, field, window, data fingerprint) and kept
+    in memory up to ``max_bytes``, evicting the least recently used first.
+    With ``cache_dir`` set, every computed entry is also written to disk as
+    parquet and reloaded on a memory miss, so later runs over the same data
+    skip the computation.
+    """
+
+    def __init__(self, max_bytes: int, cache_dir: str = None):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def clear(self):
+        """Drop all in-memory entries; files on disk are kept."""
+        self._entries.clear()
+        self.nbytes = 0
+
+    def get(self, key, compute):
+        """
+        Return the cached frame for ``key``, calling ``compute()`` on a miss.
+
+        Callers share the returned frame and must not modify it in place.
+        """
+        frame = self._entries.get(key)
+        if frame is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return frame
+
+        self.misses += 1
+        frame = self._load(key)
+        if frame is None:
+            frame = compute()
+            self._dump(key, frame)
+        self._store(key, frame)
+        return frame
+
+    def _store(self, key, frame: pd.DataFrame):
+        size = int(frame.memory_usage(index=False).sum())
+        if size > self.max_bytes:
+            logger.debug(f"Indicator {key[:3]} exceeds the cache budget, not cached")
+            return
+
+        self._entries[key] = frame
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self.nbytes -= int(evicted.memory_usage(index=False).sum())
+            logger.debug(f"Evicted indicator {evicted_key[:3]} from cache")
+
+    def _path(self, key) -> str:
+        name = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.parquet")
+
+    def _load(self, key):
+        if self.cache_dir is None or not os.path.exists(self._path(key)):
+            return None
+        return pd.read_parquet(self._path(key))
+
+    def _dump(self, key, frame: pd.DataFrame):
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        frame.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+
+    def rolling(
+        self, price_data: pd.DataFrame, field: str, window: int, stat: str = "mean"
+    ) -> pd.DataFrame:
+        """
+        Rolling statistic of one OHLCV field for all pairs.
+
+        Parameters
+        ----------
+        price_data : pd.DataFrame
+            Price data with (pair, ohlcv) MultiIndex columns.
+        field : str
+            OHLCV field to roll over, e.g. "close".
+        window : int
+            Rolling window length in rows.
+        stat : str, optional
+            One of ``ROLLING_STATS``. Defaults to "mean". "std" uses the
+            pandas default ``ddof=1``.
+
+        Returns
+        -------
+        pd.DataFrame
+            The statistic indexed like the price data, one column per pair.
+        """
+        if stat not in ROLLING_STATS:
+            raise ValueError(f"Unsupported rolling statistic '{stat}'")
+
+        key = (f"rolling_{stat}", field, window, data_fingerprint(price_data, field))
+        return self.get(
+            key,
+            lambda: getattr(
+                price_data.xs(field, level="ohlcv", axis=1).rolling(window), stat
+            )(),
+        )
+
+
+_default_cache = None
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """Process-wide cache sized from ``config.indicator_cache_mb``."""
+    global _default_cache
+    if _default_cache is None:
+        from config import config
+
+        _default_cache = IndicatorCache(
+            max_bytes=config.indicator_cache_mb * 1024**2,
+            cache_dir=config.indicator_cache_dir,
+        )
+    return _default_cache
+
+
+@contextlib.contextmanager
+def private_indicator_cache():
+    """
+    Route ``get_indicator_cache()`` to a fresh in-memory cache until exit.
+
+    Strategies built on a short-lived frame, such as one block of a chunked
+    run, still share indicators with each other, but the entries are
+    dropped on exit instead of filling the process-wide cache.
+    """
+    global _default_cache
+    from config import config
+
+    previous = _default_cache
+    _default_cache = IndicatorCache(max_bytes=config.indicator_cache_mb * 1024**2)
+    try:
+        yield _default_cache
+    finally:
+        _default_cache = previous
@@ -0,0 +1,197 @@
+import hashlib
+import importlib.util
+import inspect
+import logging
+import os
+import sys
+import numba
+import numpy as np
+import pandas as pd
+from numba import njit, prange
+from numba.core.registry import CPUDispatcher
+
+logger = logging.getLogger(__name__)
+
+KERNEL_FIELDS = ("open", "high", "low", "close", "volume")
+
+# Parallel dispatchers per kernel, built once per process
+_dispatchers = {}
+
+# numba only caches functions whose callees are module globals, so the
+# dispatcher of an importable kernel is written out as a module of its own
+_DISPATCHER_SOURCE = """\
+# Generated by core.kernels for {module}.{name}
+from numba import njit, prange
+from {module} import {name} as kernel
+
+
+@njit(parallel=True, cache=True)
+def dispatch(open_, high, low, close, volume, params, out):
+    for col in prange(close.shape[1]):
+        kernel(
+            open_[:, col],
+            high[:, col],
+            low[:, col],
+            close[:, col],
+            volume[:, col],
+            params,
+            out[:, col],
+        )
+"""
+
+
+def _make_dispatcher(kernel):
+    # Fallback for kernels that cannot be imported by name; a closure over
+    # the kernel is recompiled in every process
+    @njit(parallel=True)
+    def dispatch(open_, high, low, close, volume, params, out):
+        for col in prange(close.shape[1]):
+            kernel(
+                open_[:, col],
+                high[:, col],
+                low[:, col],
+                close[:, col],
+                volume[:, col],
+                params,
+                out[:, col],
+            )
+
+    return dispatch
+
+
+def dispatcher_dir() -> str:
+    """
+    Directory of the generated dispatcher modules: under ``NUMBA_CACHE_DIR``
+    when it is set, otherwise under ``config.data_dir``, never inside the
+    installed package.
+    """
+    from config import config
+
+    root = numba.config.CACHE_DIR or os.path.join(config.data_dir, "numba_cache")
+    return os.path.abspath(os.path.join(root, "kernel_dispatchers"))
+
+
+def _remove_stale(directory: str, prefix: str):
+    """Remove dispatcher modules and numba cache files starting with ``prefix``."""
+    for folder in (directory, os.path.join(directory, "__pycache__")):
+        if os.path.isdir(folder):
+            for name in os.listdir(folder):
+                if name.startswith(prefix):
+                    os.remove(os.path.join(folder, name))
+
+
+def _load_cached_dispatcher(kernel):
+    """
+    Dispatcher compiled with ``cache=True`` from a generated module, or None
+    when the kernel is not a module-level function or its source is not
+    available.
+    """
+    func = kernel.py_func
+    module, name = func.__module__, func.__qualname__
+    if module == "__main__" or getattr(sys.modules.get(module), name, None) is not kernel:
+        return None
+    try:
+        kernel_source = inspect.getsource(func)
+    except (OSError, TypeError):
+        return None
+
+    # A changed kernel gets a new module, so no stale machine code is
+    # reused, and the modules of its earlier versions are removed
+    source = _DISPATCHER_SOURCE.format(module=module, name=name)
+    digest = hashlib.sha1((source + kernel_source).encode()).hexdigest()[:16]
+    directory = dispatcher_dir()
+    prefix = f"{module.replace('.', '_')}__{name}__"
+    path = os.path.join(directory, f"{prefix}{digest}.py")
+    try:
+        if not os.path.exists(path):
+            os.makedirs(directory, exist_ok=True)
+            _remove_stale(directory, prefix)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write(source)
+            os.replace(tmp_path, path)
+    except OSError:
+        logger.debug(f"Cannot write a dispatcher for {name}, not caching it")
+        return None
+
+    module_name = f"_kernel_dispatch_{digest}"
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    dispatcher_module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = dispatcher_module
+    spec.loader.exec_module(dispatcher_module)
+    return dispatcher_module.dispatch
+
+
+def get_dispatcher(kernel):
+    """
+    Return the parallel column dispatcher for a numba signal kernel.
+
+    The dispatcher runs ``kernel`` on every pair column in a ``prange``
+    loop. It is built once per kernel and process. For kernels defined at
+    module level it is compiled with ``cache=True`` from a generated module
+    in ``dispatcher_dir()``, so later runs and pool workers load its
+    machine code instead of recompiling; kernels should add ``cache=True``
+    too. When that directory is not writable the dispatcher is compiled
+    per process instead. Other kernels (e.g. defined in a function or in ``__main__``) get
+    an uncached dispatcher compiled in every process. As with any numba
+    cache, changes to functions the kernel calls are not detected.
+    """
+    if not isinstance(kernel, CPUDispatcher):
+        raise TypeError(f"Signal kernel {kernel!r} must be compiled with numba.njit")
+
+    dispatcher = _dispatchers.get(kernel)
+    if dispatcher is None:
+        logger.debug(f"Building parallel dispatcher for {kernel.__name__}")
+        dispatcher = _load_cached_dispatcher(kernel) or _make_dispatcher(kernel)
+        _dispatchers[kernel] = dispatcher
+    return dispatcher
+
+
+def run_signal_kernel(
+    kernel, price_data: pd.DataFrame, params: tuple = (), fields=KERNEL_FIELDS
+) -> np.ndarray:
+    """
+    Run a signal kernel over all pairs of a price frame.
+
+    Parameters
+    ----------
+    kernel : numba.core.registry.CPUDispatcher
+        ``@njit`` function ``kernel(open, high, low, close, volume, params,
+        out)`` over one pair: 1-D time series in, int8 signals (1 entry,
+        -1 exit, 0 hold) written to the zero-filled ``out``.
+    price_data : pd.DataFrame
+        Price data with (pair, ohlcv) MultiIndex columns.
+    params : tuple, optional
+        Strategy parameters passed to the kernel unchanged.
+    fields : iterable of str, optional
+        OHLCV fields to extract. The others reach the kernel as empty arrays.
+        Pairs missing a requested field see NaN for it.
+
+    Returns
+    -------
+    np.ndarray
+        int8 signals of shape (time, pair) in the column order of the close
+        prices.
+    """
+    dispatcher = get_dispatcher(kernel)
+    close = price_data.xs("close", level="ohlcv", axis=1)
+    n_pairs = close.shape[1]
+
+    arrays = []
+    for field in KERNEL_FIELDS:
+        if field == "close":
+            values = close.to_numpy()
+        elif field in fields:
+            values = (
+                price_data.xs(field, level="ohlcv", axis=1)
+                .reindex(columns=close.columns)
+                .to_numpy()
+            )
+        else:
+            values = np.empty((0, n_pairs), dtype=close.dtypes.iloc[0])
+        # Column-major so every pair is a contiguous slice
+        arrays.append(np.asfortranarray(values))
+
+    out = np.zeros(close.shape, dtype=np.int8, order="F")
+    dispatcher(*arrays, tuple(params), out)
+    return out
@@ -1,47 +1,239 @@
+from functools import cached_property
 import numpy as np
 import pandas as pd
 import vectorbt as vbt
 
+# Metrics calculate_metrics reports when no selection is given
+DEFAULT_METRICS = (
+    "Total Return [%]",
+    "Sharpe Ratio",
+    "Max Drawdown [%]",
+    "Win Rate [%]",
+    "Expectancy",
+    "Exposure Time [%]",
+)
 
-def calculate_metrics(portfolio: vbt.Portfolio) -> pd.DataFrame:
-    # Get stats per column (per symbol)
+
+class MetricInputs:
+    """
+    Per-column summaries and trade records the metrics are computed from.
+
+    Subclasses provide ``n_cols``, ``init_cash``, ``final_value``,
+    ``return_moments``, ``ann_factor``, ``max_drawdown``, ``exposure`` and
+    ``trades``, either from a whole portfolio or from state accumulated
+    while streaming. Every array has one entry per column.
+    """
+
+    def trade_sum(self, mask: np.ndarray = None, weights: np.ndarray = None):
+        """Per-column sum of ``weights`` (or count) over trades selected by ``mask``."""
+        cols = self.trades["col"]
+        if mask is not None:
+            cols = cols[mask]
+            weights = None if weights is None else weights[mask]
+        return np.bincount(cols, weights=weights, minlength=self.n_cols).astype(float)
+
+    @cached_property
+    def trade_count(self) -> np.ndarray:
+        return self.trade_sum()
+
+
+class _PortfolioInputs(MetricInputs):
+    """
+    Inputs of a ``vbt.Portfolio``, each built on first use and shared by all
+    metrics. Grouped portfolios yield one column per group.
+    """
+
+    def __init__(self, portfolio: vbt.Portfolio):
+        self.portfolio = portfolio
+        self.n_cols = len(portfolio.wrapper.get_columns())
+
+    @cached_property
+    def value(self) -> np.ndarray:
+        return self.portfolio.value().to_numpy().reshape(-1, self.n_cols)
+
+    @cached_property
+    def groups(self) -> np.ndarray:
+        """Column index of the group of every portfolio column."""
+        grouper = self.portfolio.wrapper.grouper
+        if grouper.is_grouped():
+            return grouper.get_groups()
+        return np.arange(self.n_cols)
+
+    @cached_property
+    def init_cash(self) -> np.ndarray:
+        return np.broadcast_to(np.asarray(self.portfolio.init_cash), self.n_cols)
+
+    @property
+    def final_value(self) -> np.ndarray:
+        return self.value[-1]
+
+    @cached_property
+    def return_moments(self) -> tuple:
+        returns = self.portfolio.returns().to_numpy().reshape(-1, self.n_cols)
+        count = np.count_nonzero(~np.isnan(returns), axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.nansum(returns, axis=0) / count
+        m2 = np.nansum((returns - mean) ** 2, axis=0)
+        return count, mean, m2
+
+    @property
+    def ann_factor(self) -> float:
+        return self.portfolio.returns_acc.ann_factor
+
+    @property
+    def max_drawdown(self) -> np.ndarray:
+        value = self.value
+        return np.nanmin(value / np.fmax.accumulate(value, axis=0) - 1, axis=0)
+
+    @property
+    def exposure(self) -> np.ndarray:
+        # Groups report the share of bars their columns spend in a position
+        assets = self.portfolio.assets().to_numpy()
+        in_position = np.mean(assets.reshape(len(assets), -1) != 0, axis=0)
+        groups = self.groups
+        return np.bincount(groups, in_position, self.n_cols) / np.bincount(
+            groups, minlength=self.n_cols
+        )
+
+    @cached_property
+    def trades(self) -> np.ndarray:
+        """Trade records of all trades, open ones included."""
+        trades = self.portfolio.trades.records_arr
+        if self.portfolio.wrapper.grouper.is_grouped():
+            trades = trades.copy()
+            trades["col"] = self.groups[trades["col"]]
+        return trades
+
+
+def _total_return(inputs: MetricInputs) -> np.ndarray:
+    return (inputs.final_value - inputs.init_cash) / inputs.init_cash * 100
+
+
+def _sharpe_ratio(inputs: MetricInputs) -> np.ndarray:
+    # Same estimator as ReturnsAccessor.sharpe_ratio: no risk-free rate,
+    # ddof=1, annualized with the portfolio frequency
+    count, mean, m2 = inputs.return_moments
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = np.sqrt(m2 / (count - 1))
+        sharpe = mean / std * np.sqrt(inputs.ann_factor)
+    sharpe = np.where(std == 0, np.inf, sharpe)
+    return np.where(count < 2, np.nan, sharpe)
+
+
+def _max_drawdown(inputs: MetricInputs) -> np.ndarray:
+    return -inputs.max_drawdown * 100
+
+
+def _win_rate(inputs: MetricInputs) -> np.ndarray:
+    wins = inputs.trade_sum(inputs.trades["pnl"] > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return wins / inputs.trade_count * 100
+
+
+def _expectancy(inputs: MetricInputs) -> np.ndarray:
+    # Trades.expectancy: columns with only wins or only losses count the
+    # missing side as 0
+    pnl = inputs.trades["pnl"]
+    winning, losing = pnl > 0, pnl < 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        win_rate = inputs.trade_sum(winning) / inputs.trade_count
+        avg_win = inputs.trade_sum(winning, pnl) / inputs.trade_sum(winning)
+        avg_loss = inputs.trade_sum(losing, pnl) / inputs.trade_sum(losing)
+    has_trades = inputs.trade_count > 0
+    avg_win[np.isnan(avg_win) & has_trades] = 0.0
+    avg_loss[np.isnan(avg_loss) & has_trades] = 0.0
+    return win_rate * avg_win - (1 - win_rate) * np.abs(avg_loss)
+
+
+def _exposure_time(inputs: MetricInputs) -> np.ndarray:
+    return inputs.exposure * 100
+
+
+def _total_trades(inputs: MetricInputs) -> np.ndarray:
+    return inputs.trade_count
+
+
+def _profit_factor(inputs: MetricInputs) -> np.ndarray:
+    pnl = inputs.trades["pnl"]
+    total_win = inputs.trade_sum(pnl > 0, pnl)
+    total_loss = inputs.trade_sum(pnl < 0, pnl)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        profit_factor = total_win / np.abs(total_loss)
+    return np.where(inputs.trade_count > 0, profit_factor, np.nan)
+
+
+METRICS = {
+    "Total Return [%]": _total_return,
+    "Sharpe Ratio": _sharpe_ratio,
+    "Max Drawdown [%]": _max_drawdown,
+    "Win Rate [%]": _win_rate,
+    "Expectancy": _expectancy,
+    "Exposure Time [%]": _exposure_time,
+    "Total Trades": _total_trades,
+    "Profit Factor": _profit_factor,
+}
+
+
+def metrics_frame(inputs: MetricInputs, index: pd.Index, metrics=None) -> pd.DataFrame:
+    """
+    Compute the selected metrics from prepared inputs.
+
+    Parameters
+    ----------
+    inputs : MetricInputs
+        Summaries of ``len(index)`` columns.
+    index : pd.Index
+        Row labels of the result, one per column of the inputs.
+    metrics : iterable of str, optional
+        Names from ``METRICS`` to calculate. Defaults to ``config.metrics``.
+    """
+    if metrics is None:
+        from config import config
+
+        metrics = config.metrics
+    unknown = [name for name in metrics if name not in METRICS]
+    if unknown:
+        raise ValueError(f"Unknown metrics {unknown}, use {list(METRICS)}")
+
+    return pd.DataFrame(
+        {name: METRICS[name](inputs) for name in metrics},
+        index=index,
+        dtype=float,
+    )
+
+
+def calculate_metrics(
+    portfolio: vbt.Portfolio, metrics=None, per_group: bool = False
+) -> pd.DataFrame:
     """
     Calculate performance metrics for a given portfolio.
 
+    Only the requested metrics are computed, straight from the portfolio's
+    value and return arrays and its trade records, for all columns at once.
+    Values match the corresponding ``vbt.Portfolio`` methods (Max Drawdown
+    and Exposure Time are reported as positive percentages, trade metrics
+    include open trades).
+
     Parameters
     ----------
     portfolio : vbt.Portfolio
         A VectorBT Portfolio object containing backtesting results.
+    metrics : iterable of str, optional
+        Names from ``METRICS`` to calculate. Defaults to ``config.metrics``.
+    per_group : bool, optional
+        Report a grouped portfolio per group instead of per column. A group's
+        returns are those of its summed value and its trades are those of
+        all its columns.
 
     Returns
     -------
     pd.DataFrame
-        DataFrame containing calculated metrics including Total Return,
-        Sharpe Ratio, Max Drawdown, Win Rate, Expectancy, and Exposure Time.
-        Metrics that cannot be calculated are set to NaN.
+        One row per portfolio column (pair, or parameters and pair for
+        sweeps) or group, and one float column per metric. Metrics that are
+        undefined for a column, e.g. trade metrics without trades, are NaN.
     """
-
-    stats = portfolio.stats(group_by=False).to_frame().T
-
-    # Normalize percentage fields if missing
-    if "Total Return [%]" not in stats and "Total Return" in stats:
-        stats["Total Return [%]"] = stats["Total Return"] * 100
-
-    if "Max Drawdown [%]" not in stats and "Max Drawdown" in stats:
-        stats["Max Drawdown [%]"] = stats["Max Drawdown"] * 100
-
-    if "Exposure Time [%]" not in stats and "Exposure Time" in stats:
-        stats["Exposure Time [%]"] = stats["Exposure Time"] * 100
-
-    metrics = pd.DataFrame(
-        {
-            "Total Return [%]": stats.get("Total Return [%]", np.nan),
-            "Sharpe Ratio": stats.get("Sharpe Ratio", np.nan),
-            "Max Drawdown [%]": stats.get("Max Drawdown [%]", np.nan),
-            "Win Rate [%]": portfolio.trades.win_rate() * 100,
-            "Expectancy": portfolio.trades.expectancy(),
-            "Exposure Time [%]": stats.get("Exposure Time [%]", np.nan),
-        }
+    if not per_group and portfolio.wrapper.grouper.is_grouped():
+        portfolio = portfolio.regroup(False)
+    return metrics_frame(
+        _PortfolioInputs(portfolio), portfolio.wrapper.get_columns(), metrics
     )
-
-    return metrics
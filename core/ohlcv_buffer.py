@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+
+class OHLCVBuffer:
+    """
+    Collect raw ccxt OHLCV pages of ``[start_ms, end_ms)`` in one array.
+
+    The array is preallocated for one candle per ``step_ms`` of the range,
+    so a regular history is copied into it page by page without further
+    allocations, and it is converted to a DataFrame once at the end.
+    """
+
+    def __init__(self, start_ms: int, end_ms: int, step_ms: int):
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        capacity = max(-(-(end_ms - start_ms) // step_ms), 1)
+        self._data = np.empty((capacity, len(OHLCV_COLUMNS)))
+        self.size = 0
+
+    def append(self, page: list) -> int:
+        """
+        Add one page of ``[timestamp, open, high, low, close, volume]`` rows,
+        dropping candles outside the range.
+
+        Returns
+        -------
+        int
+            Timestamp of the last candle of the page in milliseconds, for
+            the next ``since``.
+        """
+        rows = np.asarray(page, dtype=float).reshape(-1, len(OHLCV_COLUMNS))
+        last_ts = int(rows[-1, 0])
+        timestamps = rows[:, 0]
+        rows = rows[(timestamps >= self.start_ms) & (timestamps < self.end_ms)]
+
+        size = self.size + len(rows)
+        if size > len(self._data):
+            # Only when the exchange returns more candles than the timeframe implies
+            grown = np.empty((max(size, 2 * len(self._data)), len(OHLCV_COLUMNS)))
+            grown[: self.size] = self._data[: self.size]
+            self._data = grown
+        self._data[self.size : size] = rows
+        self.size = size
+        return last_ts
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        OHLCV data indexed by timestamp in ascending order. Candles returned
+        by several pages keep their latest copy, which is the most recent
+        state of a candle that was still open.
+        """
+        data = self._data[: self.size]
+        timestamps = data[:, 0].astype(np.int64)
+        _, last = np.unique(timestamps[::-1], return_index=True)
+        keep = self.size - 1 - last
+        index = pd.DatetimeIndex(
+            pd.to_datetime(timestamps[keep], unit="ms"), name="timestamp"
+        )
+        return pd.DataFrame(data[keep, 1:], index=index, columns=OHLCV_COLUMNS[1:])
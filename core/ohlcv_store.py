@@ -0,0 +1,166 @@
+import json
+import logging
+import os
+import time
+import ccxt
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _to_ms(ts) -> int:
+    return int(pd.Timestamp(ts).timestamp() * 1000)
+
+
+def _merge_ranges(ranges: list) -> list:
+    """Merge overlapping or touching [start, end) millisecond ranges."""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+class OHLCVStore:
+    """
+    Append-only on-disk OHLCV store, partitioned per pair and per month.
+
+    Layout::
+
+        <root>/<timeframe>/manifest.json
+        <root>/<timeframe>/pairs.json
+        <root>/<timeframe>/<PAIR>/<YYYY-MM>.parquet
+
+    The manifest records, for every pair, the half-open [start, end) time
+    ranges already fetched from the exchange, so only the gaps of a new
+    request have to be downloaded. ``pairs.json`` keeps the last pair list
+    resolved for each base currency and pair count.
+    """
+
+    def __init__(self, root: str, timeframe: str):
+        self.path = os.path.join(root, timeframe)
+        self.step_ms = ccxt.Exchange.parse_timeframe(timeframe) * 1000
+        self.manifest_path = os.path.join(self.path, "manifest.json")
+        self.pairs_path = os.path.join(self.path, "pairs.json")
+        self._manifest = self._load_json(self.manifest_path)
+
+    @staticmethod
+    def _load_json(path: str) -> dict:
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def _save_json(self, path: str, data: dict):
+        os.makedirs(self.path, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def _save_manifest(self):
+        self._save_json(self.manifest_path, self._manifest)
+
+    def pair_list(self, base_currency: str, limit: int):
+        """Pairs last stored for ``base_currency`` and ``limit``, or None."""
+        return self._load_json(self.pairs_path).get(f"{base_currency}:{limit}")
+
+    def save_pair_list(self, base_currency: str, limit: int, pairs: list[str]):
+        """Remember the pairs resolved for ``base_currency`` and ``limit``."""
+        lists = self._load_json(self.pairs_path)
+        lists[f"{base_currency}:{limit}"] = list(pairs)
+        self._save_json(self.pairs_path, lists)
+
+    def manifest_fingerprint(self) -> str:
+        """Serialized manifest, which changes whenever new ranges are stored."""
+        return json.dumps(self._manifest, sort_keys=True)
+
+    def _pair_dir(self, pair: str) -> str:
+        return os.path.join(self.path, pair.replace("/", "-").replace(":", "_"))
+
+    def coverage(self, pair: str) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """Return the stored [start, end) ranges of a pair."""
+        return [
+            (pd.to_datetime(start, unit="ms"), pd.to_datetime(end, unit="ms"))
+            for start, end in self._manifest.get(pair, [])
+        ]
+
+    def missing_ranges(self, pair: str, start, end) -> list[tuple]:
+        """
+        Return the parts of [start, end) that are not stored yet for a pair.
+        """
+        start_ms, end_ms = _to_ms(start), _to_ms(end)
+        gaps = []
+        cursor = start_ms
+        for covered_start, covered_end in self._manifest.get(pair, []):
+            if covered_end <= cursor:
+                continue
+            if covered_start >= end_ms:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < end_ms:
+            gaps.append((cursor, end_ms))
+        return [
+            (pd.to_datetime(gap_start, unit="ms"), pd.to_datetime(gap_end, unit="ms"))
+            for gap_start, gap_end in gaps
+        ]
+
+    def write(self, pair: str, df: pd.DataFrame, start, end):
+        """
+        Merge freshly fetched rows into the monthly partitions of a pair.
+
+        The manifest marks [start, end) as covered up to the last candle
+        received, so a fetch that stopped early is retried next time. Rows
+        already stored for the same timestamp are replaced. An empty frame
+        must mean the exchange returned an empty page, not a failed fetch:
+        for a range that has already ended (pair not listed yet, or
+        delisted) it marks the whole range as covered, so it is not
+        requested again.
+        """
+        if df.empty:
+            if _to_ms(end) <= time.time() * 1000:
+                self._mark_covered(pair, _to_ms(start), _to_ms(end))
+            logger.debug(f"[STORE] {pair}: nothing to store for {start} - {end}")
+            return
+
+        pair_dir = self._pair_dir(pair)
+        os.makedirs(pair_dir, exist_ok=True)
+        df = df.sort_index()
+        months = df.index.strftime("%Y-%m")
+        for month, part in df.groupby(months):
+            path = os.path.join(pair_dir, f"{month}.parquet")
+            if os.path.exists(path):
+                part = pd.concat([pd.read_parquet(path), part])
+                part = part[~part.index.duplicated(keep="last")].sort_index()
+            part.to_parquet(path, compression="snappy")
+
+        last_ms = _to_ms(df.index.max())
+        self._mark_covered(
+            pair, _to_ms(start), min(_to_ms(end), last_ms + self.step_ms)
+        )
+        logger.debug(f"[STORE] {pair}: stored {len(df)} rows from {start} to {end}")
+
+    def _mark_covered(self, pair: str, start_ms: int, end_ms: int):
+        ranges = self._manifest.get(pair, []) + [[start_ms, end_ms]]
+        self._manifest[pair] = _merge_ranges(ranges)
+        self._save_manifest()
+
+    def read(self, pair: str, start, end) -> pd.DataFrame:
+        """Assemble the stored rows of a pair with start <= timestamp < end."""
+        pair_dir = self._pair_dir(pair)
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        months = pd.period_range(start, end, freq="M").strftime("%Y-%m")
+        parts = [
+            pd.read_parquet(path)
+            for path in (os.path.join(pair_dir, f"{month}.parquet") for month in months)
+            if os.path.exists(path)
+        ]
+        if not parts:
+            return pd.DataFrame()
+
+        df = pd.concat(parts)
+        return df[(df.index >= start) & (df.index < end)]
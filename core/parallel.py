@@ -0,0 +1,211 @@
+import logging
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from core.results_store import current_run_id
+from utils.profiling import get_run_report
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StrategyRunResult:
+    """Outcome of one strategy run in a worker process."""
+
+    name: str
+    metrics: pd.DataFrame = None
+    error: str = None
+    elapsed: float = 0.0
+    # Run report stages recorded in the worker
+    stages: list = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class SharedFrame:
+    """
+    A numeric DataFrame published through shared memory.
+
+    The values and the DatetimeIndex are copied once into shared-memory
+    blocks; worker processes rebuild the frame on top of those buffers with
+    ``attach`` instead of receiving a pickled copy per task.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        values = df.to_numpy()
+        index = df.index
+        if index.tz is not None:
+            index = index.tz_convert(None)
+        index_values = index.to_numpy()
+
+        self._blocks = [
+            self._publish(values),
+            self._publish(index_values),
+        ]
+        self.spec = {
+            "values": (self._blocks[0].name, values.shape, values.dtype.str),
+            "index": (self._blocks[1].name, index_values.shape, index_values.dtype.str),
+            "index_name": df.index.name,
+            "freq": df.index.freqstr,
+            "tz": str(df.index.tz) if df.index.tz is not None else None,
+            "columns": df.columns,
+        }
+
+    @staticmethod
+    def _publish(array: np.ndarray) -> shared_memory.SharedMemory:
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        return block
+
+    @staticmethod
+    def attach(spec: dict) -> tuple[pd.DataFrame, list]:
+        """
+        Rebuild the frame described by ``spec`` without copying the values.
+
+        Returns the frame and the shared-memory handles, which must stay
+        referenced for as long as the frame is in use.
+        """
+        handles = []
+        arrays = []
+        for key in ("values", "index"):
+            name, shape, dtype = spec[key]
+            block = shared_memory.SharedMemory(name=name)
+            handles.append(block)
+            arrays.append(np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf))
+
+        values, index_values = arrays
+        index = pd.DatetimeIndex(
+            index_values, name=spec["index_name"], freq=spec["freq"]
+        )
+        if spec["tz"] is not None:
+            index = index.tz_localize("UTC").tz_convert(spec["tz"])
+        df = pd.DataFrame(values, index=index, columns=spec["columns"], copy=False)
+        return df, handles
+
+    def close(self):
+        """Release and remove the shared-memory blocks."""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+
+# Per-process state populated by the pool initializer
+_worker_price_data = None
+_worker_handles = None
+
+
+def _init_worker(spec: dict, run_id: str):
+    global _worker_price_data, _worker_handles
+    from core.results_store import set_run_id
+    from utils.utils import setup_logging
+
+    setup_logging()
+    # Workers store their metrics under the run id of the parent
+    set_run_id(run_id)
+    _worker_price_data, _worker_handles = SharedFrame.attach(spec)
+
+
+def _run_in_worker(strategy_cls) -> StrategyRunResult:
+    from core.backtester import backtest_strategy, wait_for_artifacts
+    from utils.profiling import reset_run_report
+    from utils.utils import build_strategy
+
+    report = reset_run_report()
+    start = time.perf_counter()
+    name = strategy_cls.__name__
+    try:
+        strategy = build_strategy(strategy_cls, _worker_price_data)
+        name = strategy.name
+        metrics = backtest_strategy(strategy)
+        wait_for_artifacts()
+        return StrategyRunResult(
+            name=name,
+            metrics=metrics,
+            elapsed=time.perf_counter() - start,
+            stages=report.stages,
+        )
+    except Exception:
+        logger.error(f"Error running backtest for {name}", exc_info=True)
+        return StrategyRunResult(
+            name=name,
+            error=traceback.format_exc(),
+            elapsed=time.perf_counter() - start,
+            stages=report.stages,
+        )
+
+
+def run_strategies_parallel(
+    strategy_classes: list, price_data: pd.DataFrame, max_workers: int = None
+) -> list[StrategyRunResult]:
+    """
+    Run each strategy class in its own worker process.
+
+    The price frame is placed in shared memory once and attached by every
+    worker, so it is never pickled per task. Workers are started from a
+    forkserver rather than forked from this process, which may already run
+    numba or BLAS threads that a fork would leave in a locked state.
+
+    Parameters
+    ----------
+    strategy_classes : list
+        StrategyBase subclasses to run.
+    price_data : pd.DataFrame
+        Validated OHLCV data with MultiIndex columns.
+    max_workers : int, optional
+        Number of worker processes. Defaults to one per strategy, capped at
+        the CPU count.
+
+    Returns
+    -------
+    list[StrategyRunResult]
+        One result per entry of ``strategy_classes``, in submission order.
+    """
+    if max_workers is None:
+        max_workers = min(len(strategy_classes), os.cpu_count() or 1)
+    max_workers = max(1, max_workers)
+
+    logger.info(
+        f"Running {len(strategy_classes)} strategies on {max_workers} worker processes"
+    )
+    shared = SharedFrame(price_data)
+    results = [None] * len(strategy_classes)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=_init_worker,
+            initargs=(shared.spec, current_run_id()),
+        ) as pool:
+            futures = {
+                pool.submit(_run_in_worker, strategy_cls): position
+                for position, strategy_cls in enumerate(strategy_classes)
+            }
+            for future in as_completed(futures):
+                position = futures[future]
+                try:
+                    result = future.result()
+                except Exception:
+                    # The worker itself died (e.g. killed by the OS)
+                    result = StrategyRunResult(
+                        name=strategy_classes[position].__name__,
+                        error=traceback.format_exc(),
+                    )
+                results[position] = result
+                get_run_report().stages.extend(result.stages or [])
+                if result.ok:
+                    logger.info(f"{result.name} finished in {result.elapsed:.2f}s")
+                else:
+                    logger.error(f"{result.name} failed:\n{result.error}")
+    finally:
+        shared.close()
+
+    return results
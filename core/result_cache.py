@@ -0,0 +1,143 @@
+import hashlib
+import inspect
+import logging
+import os
+import shutil
+import uuid
+import pandas as pd
+import vectorbt as vbt
+from config import config
+from core.indicator_cache import data_fingerprint
+from strategies.base import StrategyBase
+
+logger = logging.getLogger(__name__)
+
+# Attributes set by StrategyBase that are inputs or state rather than parameters
+_NON_PARAMS = ("price_data", "initial_state", "final_state")
+
+# Modules that simulate portfolios and compute the cached metrics
+_ENGINE_SOURCES = tuple(
+    os.path.join(os.path.dirname(__file__), name)
+    for name in ("backtester.py", "chunked.py", "metrics.py")
+)
+
+
+def _strategy_sources(strategy) -> list[str]:
+    """Source files of every strategy class the signals depend on."""
+    classes = list(type(strategy).__mro__)
+    strategy_cls = getattr(strategy, "strategy_cls", None)
+    if strategy_cls is not None:
+        classes += strategy_cls.__mro__
+    files = {
+        inspect.getsourcefile(cls)
+        for cls in classes
+        if isinstance(cls, type) and issubclass(cls, StrategyBase)
+    }
+    return sorted(files)
+
+
+class ResultCache:
+    """
+    Content-addressed store of backtest results.
+
+    An entry is keyed by a hash of the price data the strategy reads, the
+    source files of its classes and of the simulation and metric modules,
+    its parameters, the commission, slippage and timeframe settings and the
+    metric selection, so any change to one of them misses the cache. Each
+    entry is a directory holding the int8 signals, the order records and
+    the metrics as parquet.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def key(self, strategy) -> str:
+        """
+        Cache key of a strategy instance, or None when the source of one of
+        its classes cannot be located (e.g. classes defined interactively).
+        """
+        try:
+            sources = _strategy_sources(strategy)
+        except (OSError, TypeError):
+            logger.debug(f"No source for {strategy.name}, result cache disabled")
+            return None
+
+        digest = hashlib.sha1()
+        fields = strategy.price_data.columns.get_level_values("ohlcv").unique()
+        for field in sorted(set(fields) & set(strategy.required_fields)):
+            digest.update(
+                f"{field}:{data_fingerprint(strategy.price_data, field)}".encode()
+            )
+        for path in (*sources, *_ENGINE_SOURCES):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        params = {
+            name: value
+            for name, value in vars(strategy).items()
+            if name not in _NON_PARAMS
+        }
+        digest.update(repr(sorted(params.items())).encode())
+        digest.update(
+            repr(
+                (
+                    float(config.commission),
+                    float(config.slippage),
+                    config.timeframe,
+                    tuple(config.metrics),
+                    vbt.__version__,
+                )
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def load_metrics(self, key: str):
+        """Metrics of a cached run, or None on a miss."""
+        path = os.path.join(self._path(key), "metrics.parquet")
+        if not os.path.exists(path):
+            return None
+        return pd.read_parquet(path)
+
+    def load_signals(self, key: str) -> pd.DataFrame:
+        return pd.read_parquet(os.path.join(self._path(key), "signals.parquet"))
+
+    def load_orders(self, key: str) -> pd.DataFrame:
+        return pd.read_parquet(os.path.join(self._path(key), "orders.parquet"))
+
+    def store(self, key: str, signals: pd.DataFrame, portfolio, metrics: pd.DataFrame):
+        """
+        Write an entry. Files go to a temporary directory that is renamed
+        into place, so readers never see a partial entry.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = os.path.join(self.cache_dir, f".{key}.{uuid.uuid4().hex}.tmp")
+        os.makedirs(tmp_path)
+        try:
+            signals.to_parquet(
+                os.path.join(tmp_path, "signals.parquet"), compression="zstd"
+            )
+            pd.DataFrame(portfolio.order_records).to_parquet(
+                os.path.join(tmp_path, "orders.parquet"), compression="zstd"
+            )
+            metrics.to_parquet(os.path.join(tmp_path, "metrics.parquet"))
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            # Another process stored the same key first
+            logger.debug(f"Result cache entry {key} already exists")
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+_default_cache = None
+
+
+def get_result_cache():
+    """Process-wide cache in ``config.result_cache_dir``, or None when disabled."""
+    global _default_cache
+    if config.result_cache_dir is None:
+        return None
+    if _default_cache is None or _default_cache.cache_dir != config.result_cache_dir:
+        _default_cache = ResultCache(config.result_cache_dir)
+    return _default_cache
@@ -0,0 +1,173 @@
+import contextlib
+import logging
+import os
+import sqlite3
+import time
+import uuid
+import numpy as np
+import pandas as pd
+from core.sweep import combination_label, strategy_label
+
+logger = logging.getLogger(__name__)
+
+STORE_FILE = "results.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    params TEXT NOT NULL,
+    pair TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL
+);
+CREATE INDEX IF NOT EXISTS metrics_strategy ON metrics (strategy, params, run_id);
+CREATE INDEX IF NOT EXISTS metrics_run ON metrics (run_id);
+"""
+
+_run_id = None
+
+
+def current_run_id() -> str:
+    """
+    Id of the current run, e.g. "20250301T120000-1a2b3c4d": its start time
+    followed by a random suffix, so ids sort by start time.
+    """
+    global _run_id
+    if _run_id is None:
+        _run_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    return _run_id
+
+
+def set_run_id(run_id: str):
+    """Adopt the run id of another process, e.g. in pool workers."""
+    global _run_id
+    _run_id = run_id
+
+
+class ResultsStore:
+    """
+    Append-only SQLite store of per-pair metrics.
+
+    Rows are keyed by run id, strategy, parameter combination and pair, one
+    row per metric, so the metric selection can change between runs. The
+    store is a single file, written by every strategy (also from worker
+    processes), and comparisons query it by index instead of scanning
+    per-strategy files.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @classmethod
+    def in_dir(cls, results_dir: str = "results") -> "ResultsStore":
+        return cls(os.path.join(results_dir, STORE_FILE))
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    def append(self, metrics: pd.DataFrame, strategy: str, run_id: str = None):
+        """
+        Append the metrics of one strategy run.
+
+        Parameters
+        ----------
+        metrics : pd.DataFrame
+            Metrics indexed by pair, or by (param..., pair) for sweeps.
+        strategy : str
+            Strategy name.
+        run_id : str, optional
+            Defaults to ``current_run_id()``.
+        """
+        run_id = current_run_id() if run_id is None else run_id
+        index = metrics.index
+        if index.nlevels > 1:
+            names = index.names[:-1]
+            params = [combination_label(names, key[:-1]) for key in index]
+        else:
+            params = [""] * len(index)
+        pairs = index.get_level_values(-1).astype(str)
+
+        n_metrics = metrics.shape[1]
+        rows = zip(
+            [run_id] * metrics.size,
+            [strategy] * metrics.size,
+            np.repeat(params, n_metrics),
+            np.repeat(pairs, n_metrics),
+            np.tile(metrics.columns.astype(str), len(index)),
+            metrics.to_numpy(dtype=float).ravel().tolist(),
+        )
+        # closing() releases the handle and its WAL lock even on errors; the
+        # inner block only commits or rolls back
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT INTO metrics VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+        logger.info(f"Metrics of {strategy} saved to {self.path} (run {run_id})")
+
+    def load(self, strategies=None, run_id: str = None) -> pd.DataFrame:
+        """
+        Metrics of the latest run of every strategy and parameter combination.
+
+        Parameters
+        ----------
+        strategies : iterable of str, optional
+            Only load these strategies.
+        run_id : str, optional
+            Load this run instead of the latest ones.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per pair, indexed by strategy; sweep combinations are
+            labelled like "SMACrossStrategySweep(fast_period=5)". Columns are
+            the pair and the metrics in stored order.
+        """
+        if not os.path.exists(self.path):
+            return pd.DataFrame()
+
+        conditions, args = [], []
+        if run_id is not None:
+            conditions.append("m.run_id = ?")
+            args.append(run_id)
+        else:
+            conditions.append(
+                "m.run_id = (SELECT MAX(run_id) FROM metrics l "
+                "WHERE l.strategy = m.strategy AND l.params = m.params)"
+            )
+        if strategies is not None:
+            strategies = list(strategies)
+            conditions.append(f"m.strategy IN ({', '.join('?' * len(strategies))})")
+            args.extend(strategies)
+
+        query = (
+            "SELECT m.strategy, m.params, m.pair, m.metric, m.value "
+            f"FROM metrics m WHERE {' AND '.join(conditions)} ORDER BY m.rowid"
+        )
+        with contextlib.closing(self._connect()) as connection, connection:
+            rows = pd.read_sql_query(query, connection, params=args)
+        if rows.empty:
+            return pd.DataFrame()
+
+        rows["strategy"] = [
+            strategy_label(strategy, params)
+            for strategy, params in zip(rows["strategy"], rows["params"])
+        ]
+        # A strategy run twice within one run keeps its last metrics
+        keys = ["strategy", "pair"]
+        rows = rows.drop_duplicates([*keys, "metric"], keep="last")
+        metrics = rows.set_index([*keys, "metric"])["value"].unstack("metric")
+        metrics = metrics.reindex(
+            index=pd.MultiIndex.from_frame(rows[keys].drop_duplicates()),
+            columns=rows["metric"].unique(),
+        )
+        metrics.columns.name = None
+        return metrics.reset_index(level="pair")
@@ -0,0 +1,135 @@
+import ast
+import hashlib
+import json
+import logging
+import os
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Bump when the validation pipeline changes so old snapshots are rebuilt
+SNAPSHOT_VERSION = 1
+CHECKSUM_KEY = b"vbt_snapshot_checksum"
+
+
+def make_checksum(*parts) -> str:
+    """Hash JSON-serializable key parts (source fingerprint, settings, ...)."""
+    payload = json.dumps([SNAPSHOT_VERSION, *parts], default=str, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def file_fingerprint(path: str) -> list:
+    """Cheap identity of a file: absolute path, size and modification time."""
+    stat = os.stat(path)
+    return [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
+
+
+def select_columns(names: list[str], pairs=None, fields=None) -> list[str]:
+    """
+    Pick the stored (pair, field) columns matching a pair/field selection.
+
+    pandas stores MultiIndex columns in Arrow and Parquet schemas as the
+    string form of the tuple, e.g. "('ETH/BTC', 'close')".
+    """
+    selected = []
+    for name in names:
+        if not name.startswith("("):
+            continue
+        pair, field = ast.literal_eval(name)
+        if (pairs is None or pair in pairs) and (fields is None or field in fields):
+            selected.append(name)
+    return selected
+
+
+def index_columns(schema: pa.Schema) -> list[str]:
+    """Names of the columns holding the pandas index."""
+    return [
+        column
+        for column in (schema.pandas_metadata or {}).get("index_columns", [])
+        if isinstance(column, str)
+    ]
+
+
+def write_snapshot(df: pd.DataFrame, path: str, checksum: str):
+    """
+    Write a validated frame as an uncompressed Arrow IPC file.
+
+    The checksum is stored in the schema metadata next to the pandas
+    metadata that restores the MultiIndex columns.
+    """
+    table = pa.Table.from_pandas(df)
+    metadata = dict(table.schema.metadata or {})
+    metadata[CHECKSUM_KEY] = checksum.encode()
+    table = table.replace_schema_metadata(metadata)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+    logger.info(f"[SNAPSHOT] Validated snapshot saved to {path}")
+
+
+def read_snapshot(
+    path: str,
+    checksum: str = None,
+    pairs=None,
+    fields=None,
+    start=None,
+    end=None,
+) -> pd.DataFrame:
+    """
+    Memory-map a validated snapshot, optionally projected.
+
+    Pair and field selections pick columns of the mapped table, and the
+    [start, end) time window becomes a zero-copy row slice found by binary
+    search on the sorted index, so unselected data is never touched.
+    Columns are converted without consolidation, so float columns without
+    nulls stay zero-copy views of the mapped file.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        The stored frame, or None if the file is missing or its checksum
+        does not match ``checksum``.
+    """
+    if not os.path.exists(path):
+        return None
+
+    reader = pa.ipc.open_file(pa.memory_map(path, "r"))
+    stored = (reader.schema.metadata or {}).get(CHECKSUM_KEY, b"").decode()
+    if checksum is not None and stored != checksum:
+        logger.info(f"[SNAPSHOT] Checksum mismatch for {path}, rebuilding")
+        return None
+
+    table = reader.read_all()
+    if pairs is not None or fields is not None:
+        columns = select_columns(table.schema.names, pairs, fields)
+        table = table.select(columns + index_columns(table.schema))
+    if start is not None or end is not None:
+        table = _slice_time(table, start, end)
+
+    df = table.to_pandas(split_blocks=True)
+    logger.info(f"[SNAPSHOT] Loaded validated snapshot {path} with shape {df.shape}")
+    return df
+
+
+def _slice_time(table: pa.Table, start=None, end=None) -> pa.Table:
+    """Zero-copy slice of the rows with start <= index < end."""
+    (index_name,) = index_columns(table.schema)
+    timestamps = table.column(index_name).to_numpy()
+    unit = np.datetime_data(timestamps.dtype)[0]
+    lo = 0
+    hi = len(timestamps)
+    if start is not None:
+        lo = np.searchsorted(
+            timestamps, pd.Timestamp(start).to_datetime64().astype(f"M8[{unit}]")
+        )
+    if end is not None:
+        hi = np.searchsorted(
+            timestamps, pd.Timestamp(end).to_datetime64().astype(f"M8[{unit}]")
+        )
+    return table.slice(lo, max(hi - lo, 0))
@@ -0,0 +1,114 @@
+import itertools
+import logging
+import numpy as np
+import pandas as pd
+from strategies.base import StrategyBase
+
+logger = logging.getLogger(__name__)
+
+
+def combination_label(names, values) -> str:
+    """Readable label of a parameter combination, e.g. "fast_period=5, slow_period=30"."""
+    return ", ".join(f"{name}={value}" for name, value in zip(names, values))
+
+
+def strategy_label(strategy: str, params: str = "") -> str:
+    """
+    Name under which results of a strategy are reported, e.g.
+    "SMACrossStrategySweep(fast_period=5)" for one sweep combination.
+    """
+    return f"{strategy}({params})" if params else strategy
+
+
+class ParameterSweep(StrategyBase):
+    """
+    Evaluate a strategy over a parameter grid in a single simulation.
+
+    Signals for every parameter combination are stacked side by side into one
+    int8 frame whose columns are a (param..., pair) MultiIndex. ``Backtester``
+    broadcasts the close prices to the same columns, so all combinations share
+    one ``vbt.Portfolio.from_signals`` call.
+    """
+
+    def __init__(self, price_data: pd.DataFrame, strategy_cls, param_grid: dict):
+        """
+        Initialize the parameter sweep.
+
+        Parameters
+        ----------
+        price_data : pd.DataFrame
+            The price data for all symbols.
+        strategy_cls : type
+            The StrategyBase subclass to sweep.
+        param_grid : dict
+            Mapping of constructor argument name to the values to try,
+            e.g. ``{"fast_period": [5, 10], "slow_period": [30, 50]}``.
+        """
+        super().__init__(price_data)
+        if not param_grid:
+            raise ValueError(f"Empty parameter grid for {strategy_cls.__name__}")
+        for param, values in param_grid.items():
+            if len(values) == 0:
+                raise ValueError(f"No values given for parameter '{param}'")
+
+        self.strategy_cls = strategy_cls
+        self.param_grid = {param: list(values) for param, values in param_grid.items()}
+        self.requires_ohlcv = strategy_cls.requires_ohlcv
+        self.required_fields = strategy_cls.required_fields
+
+    @property
+    def name(self) -> str:
+        return f"{self.strategy_cls.__name__}Sweep"
+
+    @property
+    def warmup_period(self) -> int:
+        return max(
+            self.strategy_cls(self.price_data, **params).warmup_period
+            for params in self.param_combinations()
+        )
+
+    def param_combinations(self) -> list[dict]:
+        """Return every parameter combination of the grid, last parameter fastest."""
+        names = list(self.param_grid)
+        return [
+            dict(zip(names, values))
+            for values in itertools.product(*self.param_grid.values())
+        ]
+
+    def generate_signals(self) -> pd.DataFrame:
+        """
+        Generate signals for every parameter combination.
+
+        Returns
+        -------
+        pd.DataFrame
+            int8 signals indexed like the price data, with one column per
+            (param..., pair) combination.
+        """
+        close = self.get_close_price()
+        n_rows, n_pairs = close.shape
+        combinations = self.param_combinations()
+        logger.info(
+            f"Sweeping {self.strategy_cls.__name__} over {len(combinations)} "
+            f"parameter combinations x {n_pairs} pairs"
+        )
+
+        data = np.empty((n_rows, n_pairs * len(combinations)), dtype=np.int8)
+        final_states = []
+        for i, params in enumerate(combinations):
+            strategy = self.strategy_cls(self.price_data, **params)
+            if self.initial_state is not None:
+                strategy.initial_state = self.initial_state[i]
+            block = strategy.generate_signals()
+            data[:, i * n_pairs : (i + 1) * n_pairs] = block.to_numpy()
+            final_states.append(strategy.final_state)
+
+        # Per-combination indicator states for the next block of a chunked run
+        if any(state is not None for state in final_states):
+            self.final_state = final_states
+
+        columns = pd.MultiIndex.from_product(
+            [*self.param_grid.values(), close.columns],
+            names=[*self.param_grid, close.columns.name],
+        )
+        return pd.DataFrame(data, index=close.index, columns=columns)
@@ -0,0 +1,240 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+import vectorbt as vbt
+from config import config
+from core.backtester import Backtester
+from core.parallel import SharedFrame
+from core.sweep import ParameterSweep
+
+logger = logging.getLogger(__name__)
+
+
+def walk_forward_splits(
+    n_rows: int, train_rows: int, test_rows: int, step_rows: int = None
+) -> list[tuple[slice, slice]]:
+    """
+    Rolling train/test windows over ``n_rows`` bars.
+
+    Every test window directly follows its train window. Windows advance by
+    ``step_rows``, by default the test length, so test windows tile the
+    history without overlapping; windows that would run past the end are
+    dropped.
+
+    Returns
+    -------
+    list[tuple[slice, slice]]
+        Positional (train, test) row slices.
+    """
+    if train_rows < 1 or test_rows < 1:
+        raise ValueError("train_rows and test_rows must be positive")
+    step_rows = test_rows if step_rows is None else step_rows
+    if step_rows < 1:
+        raise ValueError("step_rows must be positive")
+
+    splits = []
+    for start in range(0, n_rows - train_rows - test_rows + 1, step_rows):
+        test_start = start + train_rows
+        splits.append(
+            (slice(start, test_start), slice(test_start, test_start + test_rows))
+        )
+    if not splits:
+        raise ValueError(
+            f"{n_rows} rows do not fit a train window of {train_rows} "
+            f"and a test window of {test_rows}"
+        )
+    return splits
+
+
+def _simulate(close: pd.DataFrame, signals: pd.DataFrame, rows: slice):
+    values = signals.iloc[rows].to_numpy()
+    return vbt.Portfolio.from_signals(
+        close=Backtester._broadcast_close(close.iloc[rows], signals.columns),
+        entries=values == 1,
+        exits=values == -1,
+        fees=float(config.commission),
+        slippage=float(config.slippage),
+        freq=config.timeframe,
+    )
+
+
+def _finite_scores(portfolio, objective: str) -> np.ndarray:
+    """Per-column objective values with infinite scores replaced by NaN."""
+    scores = getattr(portfolio, objective)().to_numpy(dtype=float)
+    return np.where(np.isfinite(scores), scores, np.nan)
+
+
+def _evaluate_window(
+    close: pd.DataFrame,
+    signals: pd.DataFrame,
+    train: slice,
+    test: slice,
+    n_combinations: int,
+    objective: str,
+) -> dict:
+    """
+    Pick the combination with the best mean objective over the pairs of the
+    train window and score it on the test window.
+    """
+    n_pairs = signals.shape[1] // n_combinations
+
+    portfolio = _simulate(close, signals, train)
+    scores = _finite_scores(portfolio, objective).reshape(n_combinations, n_pairs)
+    trades = portfolio.trades.count().to_numpy().reshape(n_combinations, n_pairs)
+    # Combinations are laid out as contiguous blocks of pairs. Ratios of flat
+    # equity are infinite or undefined, so combinations that never trade are
+    # left without a score and only win if no combination has one
+    combo_scores = pd.DataFrame(scores).mean(axis=1)
+    combo_scores[trades.sum(axis=1) == 0] = np.nan
+    best = int(combo_scores.fillna(-np.inf).to_numpy().argmax())
+
+    columns = slice(best * n_pairs, (best + 1) * n_pairs)
+    portfolio = _simulate(close, signals.iloc[:, columns], test)
+    return {
+        "combination": best,
+        "train_score": combo_scores.iloc[best],
+        "test_score": pd.Series(_finite_scores(portfolio, objective)).mean(),
+        "Test Return [%]": portfolio.total_return().mean() * 100,
+    }
+
+
+# Per-process state populated by the pool initializer
+_worker_close = None
+_worker_signals = None
+_worker_handles = None
+
+
+def _init_worker(close_spec: dict, signals_spec: dict):
+    global _worker_close, _worker_signals, _worker_handles
+    from utils.utils import setup_logging
+
+    setup_logging()
+    _worker_close, close_handles = SharedFrame.attach(close_spec)
+    _worker_signals, signal_handles = SharedFrame.attach(signals_spec)
+    _worker_handles = close_handles + signal_handles
+
+
+def _evaluate_in_worker(train: slice, test: slice, n_combinations: int, objective):
+    return _evaluate_window(
+        _worker_close, _worker_signals, train, test, n_combinations, objective
+    )
+
+
+@dataclass
+class WalkForwardResult:
+    """Chosen parameters and scores of every walk-forward window."""
+
+    strategy_name: str
+    windows: pd.DataFrame
+
+    def save(self, results_dir: str = "results") -> str:
+        """Write the windows to ``<results_dir>/<strategy>_walk_forward.csv``."""
+        os.makedirs(results_dir, exist_ok=True)
+        path = os.path.join(
+            results_dir, f"{self.strategy_name.lower()}_walk_forward.csv"
+        )
+        self.windows.to_csv(path, index=False)
+        logger.info(f"Walk-forward results saved to {path}")
+        return path
+
+
+def run_walk_forward(
+    strategy_cls,
+    price_data: pd.DataFrame,
+    param_grid: dict,
+    train_rows: int,
+    test_rows: int,
+    step_rows: int = None,
+    objective: str = "sharpe_ratio",
+    max_workers: int = 1,
+) -> WalkForwardResult:
+    """
+    Optimize parameters on rolling train windows and evaluate them out of
+    sample on the windows that follow.
+
+    Signals for the whole grid are generated once over the full history, so
+    indicators are computed a single time through the shared indicator cache
+    and are already warmed up at the start of every window; each window only
+    slices them and runs its two simulations. Windows are independent and
+    are spread over worker processes that attach the close prices and
+    signals from shared memory.
+
+    Parameters
+    ----------
+    strategy_cls : type
+        StrategyBase subclass to optimize.
+    price_data : pd.DataFrame
+        Validated OHLCV data with the strategy's required fields.
+    param_grid : dict
+        Parameter grid as for ``ParameterSweep``.
+    train_rows, test_rows : int
+        Length of the train and test windows in bars.
+    step_rows : int, optional
+        Bars between window starts. Defaults to ``test_rows``.
+    objective : str, optional
+        ``vbt.Portfolio`` method returning one score per column, averaged
+        over pairs and maximized, e.g. "sharpe_ratio" or "total_return".
+        Infinite per-pair scores are ignored and combinations without a
+        trade in the train window are never picked over ones with trades.
+    max_workers : int, optional
+        Worker processes; 1 evaluates the windows in this process and None
+        uses one per CPU.
+
+    Returns
+    -------
+    WalkForwardResult
+        One row per window with its bounds, chosen parameters and scores.
+    """
+    if not callable(getattr(vbt.Portfolio, objective, None)):
+        raise ValueError(f"Unknown objective '{objective}'")
+
+    splits = walk_forward_splits(len(price_data), train_rows, test_rows, step_rows)
+    sweep = ParameterSweep(price_data, strategy_cls, param_grid)
+    combinations = sweep.param_combinations()
+    signals = sweep.generate_signals()
+    close = price_data.xs("close", level="ohlcv", axis=1)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(splits)))
+    logger.info(
+        f"Walk-forward {strategy_cls.__name__}: {len(splits)} windows x "
+        f"{len(combinations)} combinations on {max_workers} processes"
+    )
+
+    tasks = [(train, test, len(combinations), objective) for train, test in splits]
+    if max_workers == 1:
+        evaluations = [_evaluate_window(close, signals, *task) for task in tasks]
+    else:
+        shared_close = SharedFrame(close)
+        shared_signals = SharedFrame(signals)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_init_worker,
+                initargs=(shared_close.spec, shared_signals.spec),
+            ) as pool:
+                evaluations = list(pool.map(_evaluate_in_worker, *zip(*tasks)))
+        finally:
+            shared_close.close()
+            shared_signals.close()
+
+    index = price_data.index
+    rows = []
+    for (train, test), evaluation in zip(splits, evaluations):
+        rows.append(
+            {
+                "train_start": index[train.start],
+                "train_end": index[train.stop - 1],
+                "test_start": index[test.start],
+                "test_end": index[test.stop - 1],
+                **combinations[evaluation.pop("combination")],
+                **evaluation,
+            }
+        )
+    return WalkForwardResult(strategy_cls.__name__, pd.DataFrame(rows))
@@ -1,17 +1,30 @@
 import pandas as pd
 import ccxt
+import ccxt.async_support as ccxt_async
 from core.exchange import ExchangeBase
+from core.ohlcv_buffer import OHLCVBuffer
 import logging
 import time
 
-
 logger = logging.getLogger(__name__)
 
 
 class BinanceExchange(ExchangeBase):
+    # Candles per fetch_ohlcv request, the maximum of Binance's klines endpoint
+    page_limit = 1000
+
     def __init__(self):
         self.exchange = ccxt.binance()
 
+    def create_async_client(self):
+        """
+        Create an async Binance client for AsyncOHLCVFetcher.
+
+        ccxt's built-in throttling is disabled because the fetcher applies its
+        own global token bucket across all concurrent requests.
+        """
+        return ccxt_async.binance({"enableRateLimit": False})
+
     def _validate_ohlcv_data(self, df: pd.DataFrame, symbol: str) -> None:
         """
         Validate that the given OHLCV data is not empty and contains all required columns with no missing values.
@@ -81,13 +94,19 @@ class BinanceExchange(ExchangeBase):
 
     def fetch_full_ohlcv(self, pair, timeframe, start, end, delay_seconds=1):
         """
-        Paginated OHLCV fetch using 'since' timestamps.
+        Paginated OHLCV fetch of ``[start, end)`` using 'since' timestamps.
+
+        Each page starts one candle of ``timeframe`` after the last candle of
+        the previous one. Raw rows are collected in a single ``OHLCVBuffer``
+        and converted to a DataFrame once, without duplicate boundary candles
+        or candles at or after ``end``. Network errors are retried; any other
+        error raises ``ValueError``, so an empty frame always means the
+        exchange has no candles from ``start`` on.
         """
-        import ccxt
-
-        all_data = []
-        since = pd.Timestamp(start).timestamp() * 1000
-        end_ts = pd.Timestamp(end).timestamp() * 1000
+        step = ccxt.Exchange.parse_timeframe(timeframe) * 1000
+        since = int(pd.Timestamp(start).timestamp() * 1000)
+        end_ts = int(pd.Timestamp(end).timestamp() * 1000)
+        buffer = OHLCVBuffer(since, end_ts, step)
 
         logger.info(
             f"[{pair}] Starting paginated fetch from {start} to {end} (timeframe={timeframe})"
@@ -100,23 +119,13 @@ class BinanceExchange(ExchangeBase):
                 )
 
                 ohlcv = self.exchange.fetch_ohlcv(
-                    pair, timeframe, since=int(since), limit=1000
+                    pair, timeframe, since=since, limit=self.page_limit
                 )
                 if not ohlcv:
                     logger.warning(f"[{pair}] Empty fetch. Stopping.")
                     break
 
-                df = pd.DataFrame(
-                    ohlcv,
-                    columns=["timestamp", "open", "high", "low", "close", "volume"],
-                )
-                df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-                df.set_index("timestamp", inplace=True)
-
-                all_data.append(df)
-
-                last_ts = df.index.max().value // 10**6
-                next_since = last_ts + 60_000
+                next_since = buffer.append(ohlcv) + step
                 if next_since <= since:
                     logger.warning(
                         f"[{pair}] Stuck pagination at {pd.to_datetime(since, unit='ms')}. Breaking."
@@ -124,17 +133,19 @@ class BinanceExchange(ExchangeBase):
                     break
 
                 since = next_since
-                time.sleep(delay_seconds)
+                if since < end_ts:
+                    time.sleep(delay_seconds)
 
             except ccxt.NetworkError as e:
                 logger.warning(f"[{pair}] Network error: {e}")
                 time.sleep(5)
             except Exception as e:
-                logger.warning(f"[{pair}] Unexpected error: {e}")
-                break
+                # Not an empty history: callers must not record the range
+                # as fetched
+                raise ValueError(f"Failed to fetch data for {pair}: {e}") from e
 
-        if all_data:
-            result = pd.concat(all_data)
+        if buffer.size:
+            result = buffer.to_frame()
             logger.info(
                 f"[{pair}] Finished fetch: {len(result)} rows from {result.index.min()} to {result.index.max()}"
             )
@@ -4,10 +4,18 @@ from utils.utils import (
     initialize_exchange,
     load_price_data,
     setup_directories,
+    build_strategy,
+    cached_data_path,
+    select_fields,
 )
 from core.backtester import run_strategy
+from core.batch import run_strategies_batched
+from core.chunked import run_strategy_chunked
 from config import config
-from core.backtester import Backtester
+from core.backtester import Backtester, wait_for_artifacts
+from core.parallel import run_strategies_parallel
+from core.walkforward import run_walk_forward
+from utils.profiling import get_run_report, stage
 
 logger = logging.getLogger(__name__)
 
@@ -17,24 +25,83 @@ def main():
     setup_logging()
     try:
         exchange = initialize_exchange()
-        price_data = load_price_data(exchange)
         setup_directories()
 
-        # Instantiate strategies with price data (full OHLCV for strategies)
-        strategies = []
-        for strategy_cls in config.strategies:
-            strategies.append(strategy_cls(price_data))  # Full OHLCV
+        # Batched runs hand their metrics over in memory; otherwise they are
+        # read back from the results directory
+        metrics = None
+        if config.chunk_rows:
+            # Stream the cached history block by block
+            data_path = cached_data_path(exchange)
+            for strategy_cls in config.strategies:
+                with stage("chunked_backtest", strategy=strategy_cls.__name__):
+                    run_strategy_chunked(strategy_cls, data_path)
+        elif config.walk_forward_train_rows:
+            # Rolling optimization of every strategy with a parameter grid
+            fields = set().union(*(cls.required_fields for cls in config.strategies))
+            price_data = load_price_data(exchange, fields)
+            for strategy_cls in config.strategies:
+                param_grid = config.param_grids.get(strategy_cls)
+                if not param_grid:
+                    logger.warning(
+                        f"No parameter grid for {strategy_cls.__name__}, "
+                        "skipping walk-forward"
+                    )
+                    continue
+                with stage("walk_forward", strategy=strategy_cls.__name__):
+                    result = run_walk_forward(
+                        strategy_cls,
+                        select_fields(price_data, strategy_cls.required_fields),
+                        param_grid,
+                        config.walk_forward_train_rows,
+                        config.walk_forward_test_rows,
+                        objective=config.walk_forward_objective,
+                        max_workers=config.max_workers,
+                    )
+                result.save(config.results_dir)
+        elif config.batch_strategies:
+            # One grouped simulation for all strategies, compared in memory
+            fields = set().union(*(cls.required_fields for cls in config.strategies))
+            price_data = load_price_data(exchange, fields)
+            with stage("batched_backtest", strategies=len(config.strategies)):
+                result = run_strategies_batched(config.strategies, price_data)
+            if result is not None:
+                logger.info(f"Strategy metrics:\n{result.strategy_metrics()}")
+                # Indexed by strategy with a pair column, like the store
+                metrics = result.pair_metrics().reset_index(level="pair")
+        elif config.max_workers == 1:
+            # Load the fields any strategy declares once, and hand each
+            # strategy only its own
+            fields = set().union(*(cls.required_fields for cls in config.strategies))
+            price_data = load_price_data(exchange, fields)
+            for strategy_cls in config.strategies:
+                strategy_data = select_fields(price_data, strategy_cls.required_fields)
+                run_strategy(build_strategy(strategy_cls, strategy_data))
+        else:
+            # Workers share one full OHLCV frame through shared memory
+            price_data = load_price_data(exchange)
+            results = run_strategies_parallel(
+                config.strategies, price_data, config.max_workers
+            )
+            failed = [result.name for result in results if not result.ok]
+            if failed:
+                logger.warning(f"Strategies failed in worker processes: {failed}")
 
-        for strategy in strategies:
-            run_strategy(strategy)
+        # Reports render in the background while the backtests run
+        with stage("wait_for_artifacts"):
+            wait_for_artifacts()
 
         # Compare strategies
-        Backtester.compare_strategies_metrics()
+        with stage("compare"):
+            Backtester.compare_strategies_metrics(metrics=metrics)
 
     except Exception as e:
         logger.error(
             f"Backtesting framework terminated due to an error: {e}", exc_info=True
         )
+    finally:
+        if config.run_report:
+            get_run_report().write(config.run_report)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,39 @@
 from abc import ABC, abstractmethod
 import pandas as pd
 import vectorbt as vbt
+from core.indicator_cache import get_indicator_cache
+from core.kernels import run_signal_kernel
 from core.metrics import calculate_metrics
 
 
 class StrategyBase(ABC):
     requires_ohlcv: bool = False
+    # OHLCV fields read by generate_signals; DataLoader only loads these
+    required_fields: tuple = ("close",)
 
     def __init__(self, price_data: pd.DataFrame):
         self.price_data = price_data
+        # State of recursive indicators carried between the time blocks of a
+        # chunked backtest: set from the previous block before
+        # generate_signals, which leaves the state at its last row in
+        # final_state. Strategies without recursive indicators ignore both.
+        self.initial_state = None
+        self.final_state = None
+
+    @property
+    def name(self) -> str:
+        """Name used for logs and result artifacts."""
+        return self.__class__.__name__
+
+    @property
+    def warmup_period(self) -> int:
+        """
+        Rows of history a signal depends on besides its own row. Chunked
+        backtests prepend this many rows to every block so indicators match a
+        full-history run. Indicators with unbounded memory carry their state
+        through ``initial_state`` and ``final_state`` instead.
+        """
+        return 0
 
     @abstractmethod
     def generate_signals(self) -> pd.DataFrame:
@@ -35,18 +60,29 @@ class StrategyBase(ABC):
         # Step 1: Ensure signals is a DataFrame with correct shape
         if isinstance(signals, pd.Series):
             signals = signals.to_frame()
-        signals = signals.copy()
 
-        # Step 2: Force reindex to close.index (DatetimeIndex) and columns (MultiIndex)
-        signals = signals.reindex(
-            index=close.index, columns=close.columns, fill_value=0
-        )
+        # Step 2: Force reindex to close.index (DatetimeIndex) and columns (MultiIndex),
+        # skipped when the signals are already aligned
+        if not (
+            signals.index.equals(close.index) and signals.columns.equals(close.columns)
+        ):
+            signals = signals.reindex(
+                index=close.index, columns=close.columns, fill_value=0
+            )
 
-        # Step 3: Ensure dtypes are numeric (int8 is optimal for signals)
+        # Step 3: Ensure dtypes are numeric (int8 is optimal for signals);
+        # a no-op when the strategy already produced int8
         signals = signals.astype("int8")
 
         return signals
 
+    def rolling(self, field: str, window: int, stat: str = "mean") -> pd.DataFrame:
+        """
+        Rolling statistic of an OHLCV field for all pairs, memoized in the
+        shared indicator cache. The returned frame must not be modified.
+        """
+        return get_indicator_cache().rolling(self.price_data, field, window, stat)
+
     def get_close_price(self) -> pd.DataFrame:
         """
         Extract close prices from self.price_data safely.
@@ -55,3 +91,51 @@ class StrategyBase(ABC):
             raise TypeError("price_data must have MultiIndex columns")
 
         return self.price_data.xs("close", level="ohlcv", axis=1)
+
+
+class KernelStrategy(StrategyBase):
+    """
+    Strategy whose signals come from a numba-compiled kernel.
+
+    Subclasses set ``signal_kernel`` to an ``@njit`` function
+    ``kernel(open, high, low, close, volume, params, out)`` that fills the
+    int8 ``out`` for a single pair, and return their parameters from
+    ``kernel_params``. The framework extracts the arrays of the fields in
+    ``required_fields``, runs the kernel on all pairs in parallel and wraps
+    the result into the normalized signal frame::
+
+        @njit(cache=True)
+        def momentum_kernel(open_, high, low, close, volume, params, out):
+            (lookback,) = params
+            for i in range(lookback, close.shape[0]):
+                if close[i] > close[i - lookback]:
+                    out[i] = 1
+                elif close[i] < close[i - lookback]:
+                    out[i] = -1
+
+        class MomentumStrategy(KernelStrategy):
+            signal_kernel = staticmethod(momentum_kernel)
+            ...
+    """
+
+    signal_kernel = None
+
+    def __init__(self, price_data: pd.DataFrame):
+        if self.signal_kernel is None:
+            raise TypeError(f"{type(self).__name__} does not define signal_kernel")
+        super().__init__(price_data)
+
+    def kernel_params(self) -> tuple:
+        """Parameters passed to ``signal_kernel``, in the order it unpacks them."""
+        return ()
+
+    def generate_signals(self) -> pd.DataFrame:
+        close = self.get_close_price()
+        data = run_signal_kernel(
+            self.signal_kernel,
+            self.price_data,
+            self.kernel_params(),
+            self.required_fields,
+        )
+        signals = pd.DataFrame(data, index=close.index, columns=close.columns)
+        return self.normalize_signals(signals)
@@ -1,6 +1,5 @@
+import numpy as np
 import pandas as pd
-import vectorbt as vbt
-import ta
 import logging
 from strategies.base import StrategyBase
 
@@ -27,16 +26,28 @@ class RSIBBStrategy(StrategyBase):
         self.rsi_period = rsi_period
         self.bb_period = bb_period
 
+    @property
+    def warmup_period(self) -> int:
+        # Wilder's RSI smoothing never forgets, so chunked runs carry its
+        # state instead; the RSI only needs the previous close
+        return max(self.bb_period, 1)
+
     def generate_signals(self) -> pd.DataFrame:
         """
         Generate trading signals based on RSI and Bollinger Bands.
 
-        This method calculates trading signals for each symbol in the price data using
-        the Relative Strength Index (RSI) and Bollinger Bands indicators. A buy signal
-        (1) is generated when the RSI is below 30 and the price is below the lower
-        Bollinger Band, indicating a potential entry point. A sell signal (-1) is
-        generated when the RSI is above 70 and the price is above the upper Bollinger
-        Band, suggesting a potential exit point. No signal (0) is assigned otherwise.
+        This method calculates trading signals for all symbols at once using
+        the Relative Strength Index (RSI) and Bollinger Bands indicators. The
+        RSI uses Wilder smoothing (an exponential moving average with
+        ``alpha = 1 / rsi_period``) and the bands are the rolling mean plus or
+        minus two population standard deviations, computed column-wise over
+        the whole close frame exactly like ``ta.momentum.RSIIndicator`` and
+        ``ta.volatility.BollingerBands``. A buy signal (1) is generated when
+        the RSI is below 30 and the price is below the lower Bollinger Band,
+        indicating a potential entry point. A sell signal (-1) is generated
+        when the RSI is above 70 and the price is above the upper Bollinger
+        Band, suggesting a potential exit point. No signal (0) is assigned
+        otherwise.
 
         Returns
         -------
@@ -45,23 +56,66 @@ class RSIBBStrategy(StrategyBase):
             the generated trading signals: 1 for buy, -1 for sell, and 0 for hold.
         """
         close_df = self.get_close_price()
-        signals = pd.DataFrame(index=close_df.index, columns=close_df.columns, data=0)
-
-        for symbol in close_df.columns:
-            close = close_df[symbol]
-            logger.debug(f"Processing {symbol}")
+        logger.debug(f"Processing {close_df.shape[1]} symbols")
 
-            rsi = ta.momentum.RSIIndicator(close, window=self.rsi_period).rsi()
-            bb = ta.volatility.BollingerBands(close, window=self.bb_period)
-            lower_band = bb.bollinger_lband()
-            upper_band = bb.bollinger_hband()
+        close = close_df.to_numpy()
+        rsi = self._rsi(close, close_df.index)
 
-            entries = (rsi < 30) & (close < lower_band)
-            exits = (rsi > 70) & (close > upper_band)
+        # Bollinger Bands: the mean is shared through the indicator cache
+        mavg = self.rolling("close", self.bb_period).to_numpy()
+        mstd = close_df.rolling(self.bb_period).std(ddof=0).to_numpy()
+        lower_band = mavg - 2 * mstd
+        upper_band = mavg + 2 * mstd
 
-            signals.loc[entries, symbol] = 1
-            signals.loc[exits, symbol] = -1
+        # NaN comparisons are False, so the warm-up rows stay at 0
+        data = ((rsi < 30) & (close < lower_band)).astype(np.int8)
+        data[(rsi > 70) & (close > upper_band)] = -1
 
-        logger.debug(f"Generated signals:\n{signals}")
+        signals = pd.DataFrame(data, index=close_df.index, columns=close_df.columns)
         signals = self.normalize_signals(signals)
         return signals
+
+    def _rsi(self, close: np.ndarray, index: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Wilder RSI of every column: smoothed average gains over average
+        losses, both smoothed side by side in a single ewm pass.
+
+        The smoothing is seeded with ``initial_state`` when a chunked
+        backtest hands it over from the previous block: rows up to the
+        state's timestamp are skipped (their RSI is NaN) and the recursion
+        continues exactly where the previous block stopped. The state at the
+        last row is left in ``final_state``.
+        """
+        n_rows, n_pairs = close.shape
+        start, seed, count = 0, np.full(2 * n_pairs, np.nan), 0
+        if self.initial_state is not None:
+            start = index.searchsorted(self.initial_state["timestamp"], side="right")
+            seed, count = self.initial_state["ema"], self.initial_state["count"]
+
+        diff = np.full((n_rows - start, n_pairs), np.nan)
+        lo = max(start, 1)
+        np.subtract(close[lo:], close[lo - 1 : -1], out=diff[lo - start :])
+        directions = np.hstack(
+            [np.where(diff > 0, diff, 0.0), -np.where(diff < 0, diff, 0.0)]
+        )
+        # The seed row reproduces the recursion state of a full-history run,
+        # so min_periods is applied by hand on the carried observation count
+        ema = (
+            pd.DataFrame(np.vstack([seed, directions]))
+            .ewm(alpha=1 / self.rsi_period, adjust=False)
+            .mean()
+            .to_numpy()[1:]
+        )
+        nobs = count + np.arange(1, len(ema) + 1)
+        self.final_state = {
+            "timestamp": index[-1],
+            "ema": ema[-1] if len(ema) else seed,
+            "count": int(nobs[-1]) if len(ema) else count,
+        }
+
+        emaup, emadn = ema[:, :n_pairs], ema[:, n_pairs:]
+        rsi = np.full((n_rows, n_pairs), np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi[start:] = np.where(emadn == 0, 100, 100 - (100 / (1 + emaup / emadn)))
+        rsi[start:][nobs < self.rsi_period] = np.nan
+        return rsi
@@ -1,6 +1,5 @@
+import numpy as np
 import pandas as pd
-import vectorbt as vbt
-import ta
 import logging
 from strategies.base import StrategyBase
 
@@ -27,15 +26,23 @@ class SMACrossStrategy(StrategyBase):
         self.fast_period = fast_period
         self.slow_period = slow_period
 
+    @property
+    def warmup_period(self) -> int:
+        return max(self.fast_period, self.slow_period)
+
     def generate_signals(self) -> pd.DataFrame:
         """
         Generate trading signals based on a moving average crossover.
 
-        This method calculates trading signals for each symbol in the price data
-        using the Simple Moving Average (SMA) indicator. A buy signal (1) is
-        generated when the fast SMA crosses above the slow SMA, and a sell signal
-        (-1) is generated when the fast SMA crosses below the slow SMA. No signal
-        (0) is assigned otherwise.
+        This method calculates trading signals for all symbols at once using
+        the Simple Moving Average (SMA). Both averages are computed with a
+        single rolling-mean pass over the whole close frame, which matches
+        ``ta.trend.SMAIndicator`` column by column, and are memoized in the
+        shared indicator cache so other strategies and sweep combinations
+        reuse them. A buy signal (1) is generated when the fast SMA is above
+        the slow SMA, and a sell signal (-1) is generated when the fast SMA is
+        below the slow SMA. No signal (0) is assigned otherwise, including the
+        warm-up period.
 
         Returns
         -------
@@ -45,24 +52,15 @@ class SMACrossStrategy(StrategyBase):
             0 for hold.
         """
         close_df = self.get_close_price()
-        signals = pd.DataFrame(index=close_df.index, columns=close_df.columns, data=0)
-
-        for symbol in close_df.columns:
-            close = close_df[symbol]
-            logger.debug(f"Processing {symbol}")
-
-            fast_sma = ta.trend.SMAIndicator(
-                close, window=self.fast_period
-            ).sma_indicator()
-            slow_sma = ta.trend.SMAIndicator(
-                close, window=self.slow_period
-            ).sma_indicator()
+        logger.debug(f"Processing {close_df.shape[1]} symbols")
 
-            entries = fast_sma > slow_sma
-            exits = fast_sma < slow_sma
+        fast_sma = self.rolling("close", self.fast_period).to_numpy()
+        slow_sma = self.rolling("close", self.slow_period).to_numpy()
 
-            signals.loc[entries, symbol] = 1
-            signals.loc[exits, symbol] = -1
+        # NaN comparisons are False, so the warm-up rows stay at 0
+        data = (fast_sma > slow_sma).astype(np.int8)
+        data -= (fast_sma < slow_sma).astype(np.int8)
 
+        signals = pd.DataFrame(data, index=close_df.index, columns=close_df.columns)
         signals = self.normalize_signals(signals)
         return signals
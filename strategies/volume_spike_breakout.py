@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import logging
 from strategies.base import StrategyBase
@@ -7,6 +8,7 @@ logger = logging.getLogger(__name__)
 
 class VolumeSpikeBreakoutStrategy(StrategyBase):
     requires_ohlcv = True
+    required_fields = ("close", "volume")
 
     def __init__(
         self, price_data: pd.DataFrame, window: int = 20, volume_multiplier: float = 2.0
@@ -15,33 +17,51 @@ class VolumeSpikeBreakoutStrategy(StrategyBase):
         self.window = window
         self.volume_multiplier = volume_multiplier
 
+    @property
+    def warmup_period(self) -> int:
+        # Rolling window plus the one-row shift of the breakout levels
+        return self.window + 1
+
     def generate_signals(self) -> pd.DataFrame:
-        signals = pd.DataFrame(index=self.price_data.index)
-        close_df = self.price_data.xs("close", level="ohlcv", axis=1)
-        volume_df = self.price_data.xs("volume", level="ohlcv", axis=1)
-
-        for pair in close_df.columns:
-            try:
-                close = close_df[pair]
-                volume = volume_df[pair]
-
-                avg_volume = volume.rolling(self.window).mean()
-                recent_high = close.rolling(self.window).max()
-                recent_low = close.rolling(self.window).min()
-
-                entry = (volume > avg_volume * self.volume_multiplier) & (
-                    close > recent_high.shift(1)
-                )
-                exit = close < recent_low.shift(1)
-
-                signal = pd.Series(0, index=close.index)
-                signal[entry] = 1
-                signal[exit] = -1
-
-                signals[pair] = signal
-            except KeyError as e:
-                logger.warning(f"Missing data for {pair}: {e}")
-                continue
-
-        signals = signals[close_df.columns]
+        """
+        Generate breakout signals confirmed by a volume spike.
+
+        All pairs are processed at once on the stacked close and volume
+        arrays. A buy signal (1) is generated when volume exceeds
+        ``volume_multiplier`` times its rolling mean and the close breaks
+        above the previous rolling high; a sell signal (-1), which takes
+        precedence, when the close falls below the previous rolling low.
+        Pairs missing a field get no signals.
+
+        Returns
+        -------
+        pd.DataFrame
+            int8 signals with the same index and columns as the close prices.
+        """
+        close_df = self.get_close_price()
+        logger.debug(f"Processing {close_df.shape[1]} symbols")
+        columns = close_df.columns
+        close = close_df.to_numpy()
+        volume = (
+            self.price_data.xs("volume", level="ohlcv", axis=1)
+            .reindex(columns=columns)
+            .to_numpy()
+        )
+        avg_volume = self.rolling("volume", self.window).reindex(columns=columns)
+        recent_high = self.rolling("close", self.window, "max").to_numpy()
+        recent_low = self.rolling("close", self.window, "min").to_numpy()
+
+        # Breakout levels of the previous bar
+        previous_high = np.full_like(recent_high, np.nan)
+        previous_high[1:] = recent_high[:-1]
+        previous_low = np.full_like(recent_low, np.nan)
+        previous_low[1:] = recent_low[:-1]
+
+        entry = (volume > avg_volume.to_numpy() * self.volume_multiplier) & (
+            close > previous_high
+        )
+        data = entry.astype(np.int8)
+        data[close < previous_low] = -1
+
+        signals = pd.DataFrame(data, index=close_df.index, columns=columns)
         return self.normalize_signals(signals)
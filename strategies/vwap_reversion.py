@@ -1,5 +1,5 @@
+import numpy as np
 import pandas as pd
-import ta
 import logging
 from strategies.base import StrategyBase
 
@@ -8,44 +8,57 @@ logger = logging.getLogger(__name__)
 
 class VWAPReversionStrategy(StrategyBase):
     requires_ohlcv = True
+    required_fields = ("high", "low", "close", "volume")
 
     def __init__(self, price_data: pd.DataFrame, vwap_period: int = 20):
         super().__init__(price_data)
         self.vwap_period = vwap_period
 
-    def generate_signals(self) -> pd.DataFrame:
-        if not isinstance(self.price_data.columns, pd.MultiIndex):
-            raise ValueError("price_data must have MultiIndex columns")
-
-        signals = pd.DataFrame(index=self.price_data.index)
+    @property
+    def warmup_period(self) -> int:
+        return self.vwap_period
 
-        close_columns = self.price_data.xs("close", level="ohlcv", axis=1)
+    def generate_signals(self) -> pd.DataFrame:
+        """
+        Generate mean-reversion signals around the rolling VWAP.
 
-        for pair in close_columns.columns:
-            try:
-                high = self.price_data[(pair, "high")]
-                low = self.price_data[(pair, "low")]
-                close = self.price_data[(pair, "close")]
-                volume = self.price_data[(pair, "volume")]
+        The VWAP of every pair is computed at once from the stacked
+        high/low/close/volume arrays: a rolling sum of typical price times
+        volume over a rolling sum of volume, the same arithmetic as
+        ``ta.volume.VolumeWeightedAveragePrice``. A buy signal (1) is
+        generated when the close is more than 2% below the VWAP and a sell
+        signal (-1) when it is above the VWAP. Pairs missing a field get no
+        signals.
 
-                vwap = ta.volume.VolumeWeightedAveragePrice(
-                    high=high,
-                    low=low,
-                    close=close,
-                    volume=volume,
-                    window=self.vwap_period,
-                ).volume_weighted_average_price()
+        Returns
+        -------
+        pd.DataFrame
+            int8 signals with the same index and columns as the close prices.
+        """
+        if not isinstance(self.price_data.columns, pd.MultiIndex):
+            raise ValueError("price_data must have MultiIndex columns")
 
-                signal = pd.Series(0, index=close.index)
-                signal[close < vwap * 0.98] = 1
-                signal[close > vwap] = -1
+        close_df = self.get_close_price()
+        logger.debug(f"Processing {close_df.shape[1]} symbols")
+        high, low, close, volume = (
+            self.price_data.xs(field, level="ohlcv", axis=1)
+            .reindex(columns=close_df.columns)
+            .to_numpy()
+            for field in ("high", "low", "close", "volume")
+        )
 
-                signals[pair] = signal
+        typical_price_volume = pd.DataFrame(
+            (high + low + close) / 3.0 * volume, index=close_df.index
+        )
+        total_pv = typical_price_volume.rolling(self.vwap_period).sum().to_numpy()
+        total_volume = self.rolling("volume", self.vwap_period, "sum")
+        total_volume = total_volume.reindex(columns=close_df.columns).to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwap = total_pv / total_volume
 
-            except KeyError as e:
-                logger.warning(f"Missing data for {pair}: {e}")
-                continue
+        # NaN comparisons are False, so warm-up rows and incomplete pairs stay 0
+        data = (close < vwap * 0.98).astype(np.int8)
+        data[close > vwap] = -1
 
-        # Ensure the same shape/order as close prices
-        signals = signals[close_columns.columns]  # exact order
+        signals = pd.DataFrame(data, index=close_df.index, columns=close_df.columns)
         return self.normalize_signals(signals)
@@ -160,3 +160,30 @@ def mock_price_data_volume_spike():
     df = pd.DataFrame(data, index=index)
     df.columns.names = ["pair", "ohlcv"]
     return df
+
+
+@pytest.fixture
+def mock_multi_pair_price_data():
+    """
+    A fixture that returns 300 bars of seeded random-walk OHLCV data for
+    three trading pairs, used for parity checks between vectorized and
+    per-symbol implementations.
+    """
+    rng = np.random.default_rng(42)
+    n_rows = 300
+    pairs = ["AAA/BTC", "BBB/BTC", "CCC/BTC"]
+    index = pd.date_range("2025-01-01", periods=n_rows, freq="1min")
+    columns = pd.MultiIndex.from_product(
+        [pairs, ["open", "high", "low", "close", "volume"]],
+        names=["pair", "ohlcv"],
+    )
+    df = pd.DataFrame(index=index, columns=columns, dtype=float)
+    for pair in pairs:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_rows)))
+        spread = np.abs(rng.normal(0, 0.5, n_rows))
+        df[(pair, "open")] = np.r_[close[0], close[:-1]]
+        df[(pair, "high")] = np.maximum(df[(pair, "open")], close) + spread
+        df[(pair, "low")] = np.minimum(df[(pair, "open")], close) - spread
+        df[(pair, "close")] = close
+        df[(pair, "volume")] = rng.integers(0, 1000, n_rows).astype(float)
+    return df
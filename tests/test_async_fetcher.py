@@ -0,0 +1,183 @@
+import asyncio
+import time
+import ccxt
+import numpy as np
+import pandas as pd
+import pytest
+from config import config
+from core.async_fetcher import AsyncOHLCVFetcher, TokenBucket
+from core.data_loader import DataLoader
+from core.exchange import ExchangeBase
+from exchanges.binance import BinanceExchange
+
+PAIRS = ["AAA/BTC", "BBB/BTC", "CCC/BTC"]
+
+
+def make_candles(pair: str, start: str, n_rows: int) -> list:
+    """Canned 1m candles for a pair, deterministic per pair name."""
+    rng = np.random.default_rng(sum(map(ord, pair)))
+    start_ms = int(pd.Timestamp(start).timestamp() * 1000)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_rows)))
+    return [
+        [start_ms + i * 60_000, c, c * 1.01, c * 0.99, c, float(rng.integers(1, 500))]
+        for i, c in enumerate(close)
+    ]
+
+
+class FakeSyncExchange:
+    """Serves canned candles like ccxt.binance.fetch_ohlcv."""
+
+    def __init__(self, candles: dict):
+        self.candles = candles
+        self.requests = []
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.requests.append((symbol, since, limit))
+        rows = [row for row in self.candles[symbol] if row[0] >= since]
+        return rows[:limit]
+
+
+class FakeAsyncExchange(FakeSyncExchange):
+    """
+    Async fake with simulated latency, optional transient failures and
+    tracking of how many pairs are requested at the same time.
+    """
+
+    def __init__(self, candles: dict, latency: float = 0.01, failures: int = 0):
+        super().__init__(candles)
+        self.latency = latency
+        self.failures = failures
+        self.calls = 0
+        self.in_flight = set()
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.calls += 1
+        self.in_flight.add(symbol)
+        self.max_in_flight = max(self.max_in_flight, len(self.in_flight))
+        try:
+            await asyncio.sleep(self.latency)
+            if self.failures > 0:
+                self.failures -= 1
+                raise ccxt.RequestTimeout("simulated timeout")
+            return super().fetch_ohlcv(symbol, timeframe, since, limit)
+        finally:
+            self.in_flight.discard(symbol)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def candles():
+    return {pair: make_candles(pair, "2025-01-01", 2500) for pair in PAIRS}
+
+
+@pytest.fixture
+def short_period(monkeypatch):
+    monkeypatch.setattr(config, "start_date", "2025-01-01")
+    monkeypatch.setattr(config, "end_date", "2025-01-02")
+    monkeypatch.setattr(config, "fetch_delay_seconds", 0)
+    monkeypatch.setattr(config, "fetch_rate_limit", 1000.0)
+    monkeypatch.setattr(config, "fetch_backoff_seconds", 0.001)
+
+
+def test_async_fetch_matches_sync_combined_frame(candles, short_period, monkeypatch):
+    """
+    The async mode must produce exactly the same combined MultiIndex frame as
+    the sequential paginated fetch.
+    """
+    exchange = BinanceExchange()
+    exchange.exchange = FakeSyncExchange(candles)
+    fake_async = FakeAsyncExchange(candles)
+    monkeypatch.setattr(exchange, "create_async_client", lambda: fake_async)
+    loader = DataLoader(exchange)
+
+    expected = loader._combine_pairs(loader._fetch_pairs(PAIRS))
+    result = loader._combine_pairs(loader._fetch_pairs_async(PAIRS))
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert fake_async.closed
+
+
+def test_sync_and_async_fetch_request_the_same_pages(
+    candles, short_period, monkeypatch
+):
+    """Both modes page with the exchange's page_limit from the same 'since'."""
+    exchange = BinanceExchange()
+    exchange.exchange = FakeSyncExchange(candles)
+    exchange.page_limit = 500
+    fake_async = FakeAsyncExchange(candles)
+    monkeypatch.setattr(exchange, "create_async_client", lambda: fake_async)
+    loader = DataLoader(exchange)
+
+    loader._fetch_pairs(PAIRS)
+    loader._fetch_pairs_async(PAIRS)
+
+    assert len(exchange.exchange.requests) == len(PAIRS) * 3
+    assert {limit for _, _, limit in exchange.exchange.requests} == {500}
+    assert sorted(fake_async.requests) == sorted(exchange.exchange.requests)
+
+
+def test_async_mode_falls_back_to_sync_without_async_client(
+    candles, short_period, monkeypatch
+):
+    """Exchanges without an async client are fetched page by page instead."""
+    exchange = BinanceExchange()
+    exchange.exchange = FakeSyncExchange(candles)
+    monkeypatch.setattr(
+        exchange,
+        "create_async_client",
+        lambda: ExchangeBase.create_async_client(exchange),
+    )
+    loader = DataLoader(exchange)
+
+    expected = loader._combine_pairs(loader._fetch_pairs(PAIRS))
+    result = loader._combine_pairs(loader._fetch_pairs_async(PAIRS))
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_async_fetch_bounds_concurrency(candles):
+    client = FakeAsyncExchange(candles, latency=0.02)
+    fetcher = AsyncOHLCVFetcher(client, rate_limit=1000.0, max_concurrency=2)
+    data = fetcher.run(PAIRS, "1m", "2025-01-01", "2025-01-02")
+
+    assert list(data) == PAIRS
+    assert client.max_in_flight == 2
+
+
+def test_async_fetch_retries_network_errors(candles):
+    client = FakeAsyncExchange(candles, failures=3)
+    fetcher = AsyncOHLCVFetcher(
+        client, rate_limit=1000.0, max_retries=3, backoff_seconds=0.001
+    )
+    data = fetcher.run(PAIRS[:1], "1m", "2025-01-01", "2025-01-02")
+
+    assert len(data[PAIRS[0]]) == 1440  # one day of 1m candles, end excluded
+    assert client.calls == 3 + 2  # three failures, then two pages
+
+
+def test_async_fetch_skips_pair_after_exhausting_retries(candles):
+    client = FakeAsyncExchange(candles, failures=10)
+    fetcher = AsyncOHLCVFetcher(
+        client,
+        rate_limit=1000.0,
+        max_concurrency=1,
+        max_retries=2,
+        backoff_seconds=0.001,
+    )
+    data = fetcher.run(PAIRS[:1], "1m", "2025-01-01", "2025-01-02")
+
+    assert data == {}
+
+
+def test_token_bucket_limits_request_rate():
+    async def consume(n):
+        bucket = TokenBucket(rate=100.0, capacity=1)
+        for _ in range(n):
+            await bucket.acquire()
+
+    start = time.monotonic()
+    asyncio.run(consume(11))
+    assert time.monotonic() - start >= 0.09
@@ -10,7 +10,7 @@ import os
 @pytest.mark.parametrize(
     "strategy_class", [SMACrossStrategy, RSIBBStrategy, VWAPReversionStrategy]
 )
-def test_backtester_run(mock_price_data1, strategy_class):
+def test_backtester_run(mock_price_data1, strategy_class, tmp_path, monkeypatch):
     """
     Test the Backtester run method for multiple strategy classes.
 
@@ -34,6 +34,7 @@ def test_backtester_run(mock_price_data1, strategy_class):
     - The portfolio has a non-null value.
     """
 
+    monkeypatch.chdir(tmp_path)
     strategy = strategy_class(mock_price_data1)
 
     backtester = Backtester(strategy, mock_price_data1)
@@ -43,3 +44,113 @@ def test_backtester_run(mock_price_data1, strategy_class):
     assert portfolio is not None
     assert portfolio.stats() is not None
     assert portfolio.value() is not None
+
+
+def test_backtester_run_compact_dtypes(
+    mock_multi_pair_price_data, tmp_path, monkeypatch
+):
+    """
+    In compact mode the validated prices are float32, signals stay int8 and
+    the simulation matches the float64 run up to float32 precision.
+    """
+    monkeypatch.chdir(tmp_path)
+    from config import config
+    from core.data_loader import DataLoader
+
+    expected = Backtester(
+        SMACrossStrategy(mock_multi_pair_price_data), mock_multi_pair_price_data
+    ).run()
+
+    monkeypatch.setattr(config, "compact_dtypes", True)
+    price_data = DataLoader(exchange=None)._validate_data(
+        mock_multi_pair_price_data.copy()
+    )
+    assert price_data.dtypes.eq("float32").all()
+
+    strategy = SMACrossStrategy(price_data)
+    assert strategy.generate_signals().dtypes.eq("int8").all()
+
+    portfolio = Backtester(strategy, price_data).run()
+    pd.testing.assert_series_equal(
+        portfolio.total_return(), expected.total_return(), rtol=1e-4
+    )
+
+
+def test_signal_dump_is_opt_in(mock_multi_pair_price_data, tmp_path, monkeypatch):
+    """Signals are only written when enabled, as compressed parquet."""
+    from config import config
+
+    monkeypatch.chdir(tmp_path)
+    strategy = SMACrossStrategy(mock_multi_pair_price_data)
+    Backtester(strategy, mock_multi_pair_price_data).run()
+    assert not (tmp_path / "logs").exists()
+
+    monkeypatch.setattr(config, "dump_signals", True)
+    Backtester(strategy, mock_multi_pair_price_data).run()
+    path = tmp_path / "logs" / "smacrossstrategy_signals.parquet"
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(path), strategy.generate_signals(), check_freq=False
+    )
+
+
+def test_save_results_renders_requested_artifacts(
+    mock_multi_pair_price_data, tmp_path, monkeypatch
+):
+    """
+    Only requested artifacts are rendered, in the background, and the
+    equity series is computed once for the PNG and the HTML report.
+    """
+    monkeypatch.chdir(tmp_path)
+    from core import backtester as backtester_module
+
+    strategy = SMACrossStrategy(mock_multi_pair_price_data)
+    backtester = Backtester(strategy, mock_multi_pair_price_data)
+    portfolio = backtester.run()
+
+    metrics = backtester.save_results(portfolio, "none", artifacts=())
+    backtester_module.wait_for_artifacts()
+    assert metrics is not None
+    assert os.listdir("results") == ["results.db"]
+    assert not os.path.exists("results/screenshots")
+    assert not os.path.exists("results/html")
+
+    calls = []
+    total_equity = Backtester._total_equity
+    monkeypatch.setattr(
+        Backtester,
+        "_total_equity",
+        staticmethod(lambda pf: calls.append(pf) or total_equity(pf)),
+    )
+    backtester.save_results(portfolio, "sma", artifacts=("equity", "html"))
+    backtester_module.wait_for_artifacts()
+    assert os.path.exists("results/screenshots/sma_equity.png")
+    assert os.path.exists("results/html/sma_report.html")
+    assert not os.path.exists("results/screenshots/sma_heatmap.png")
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError, match="Unknown report artifacts"):
+        backtester.save_results(portfolio, "sma", artifacts=("pdf",))
+
+
+def test_interactive_report_downsamples_equity(
+    mock_multi_pair_price_data, tmp_path, monkeypatch
+):
+    """The HTML equity trace respects the point budget and the WebGL switch."""
+    monkeypatch.chdir(tmp_path)
+    from config import config
+    from core.backtester import PortfolioSeries
+
+    monkeypatch.setattr(config, "report_max_points", 4)
+    monkeypatch.setattr(config, "report_webgl", True)
+    strategy = SMACrossStrategy(mock_multi_pair_price_data)
+    backtester = Backtester(strategy, mock_multi_pair_price_data)
+    series = PortfolioSeries(backtester.run())
+
+    traces = []
+    monkeypatch.setattr(
+        "plotly.io.write_html", lambda fig, **kwargs: traces.extend(fig.data)
+    )
+    backtester._save_interactive_report(series, "sma")
+
+    assert [trace.type for trace in traces] == ["scattergl"]
+    assert len(traces[0].x) <= 4 < len(series.total_equity)
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+from config import config
+from core.backtester import Backtester, run_strategy
+from core.batch import run_strategies_batched
+from core.results_store import ResultsStore
+from core.sweep import ParameterSweep
+from strategies.rsi_bb import RSIBBStrategy
+from strategies.sma_cross import SMACrossStrategy
+from strategies.vwap_reversion import VWAPReversionStrategy
+
+
+def test_batched_run_matches_individual_backtests(
+    mock_multi_pair_price_data, tmp_path, monkeypatch
+):
+    """
+    Every (strategy, pair) column of the grouped portfolio reproduces the
+    individual backtest, and groups aggregate the value of their pairs.
+    """
+    monkeypatch.chdir(tmp_path)
+    grid = {"rsi_period": [3, 14]}
+    monkeypatch.setattr(config, "param_grids", {RSIBBStrategy: grid})
+    strategy_classes = [SMACrossStrategy, RSIBBStrategy, VWAPReversionStrategy]
+
+    result = run_strategies_batched(strategy_classes, mock_multi_pair_price_data)
+
+    groups = [
+        "SMACrossStrategy",
+        "RSIBBStrategySweep(rsi_period=3)",
+        "RSIBBStrategySweep(rsi_period=14)",
+        "VWAPReversionStrategy",
+    ]
+    strategy_metrics = result.strategy_metrics()
+    assert strategy_metrics.index.tolist() == groups
+
+    pair_metrics = result.pair_metrics()
+    for strategy, labels in [
+        (SMACrossStrategy(mock_multi_pair_price_data), groups[:1]),
+        (ParameterSweep(mock_multi_pair_price_data, RSIBBStrategy, grid), groups[1:3]),
+        (VWAPReversionStrategy(mock_multi_pair_price_data), groups[3:]),
+    ]:
+        portfolio = Backtester(strategy, mock_multi_pair_price_data).run()
+        np.testing.assert_allclose(
+            pair_metrics.loc[labels, "Total Return [%]"].to_numpy(),
+            portfolio.total_return().to_numpy() * 100,
+        )
+
+    # Sweep combinations carry the labels of the results store, so batched
+    # rows join the per-strategy output on (strategy, pair)
+    monkeypatch.setattr(config, "report_artifacts", ())
+    run_strategy(ParameterSweep(mock_multi_pair_price_data, RSIBBStrategy, grid))
+    stored = ResultsStore.in_dir("results").load()
+    pd.testing.assert_index_equal(
+        stored.set_index("pair", append=True).index,
+        pair_metrics.loc[groups[1:3]].index,
+        check_names=False,
+    )
+
+    value = result.portfolio.regroup(False).value()["SMACrossStrategy"].sum(axis=1)
+    init_cash = 100.0 * mock_multi_pair_price_data.columns.levshape[0]
+    np.testing.assert_allclose(
+        strategy_metrics.loc["SMACrossStrategy", "Total Return [%]"],
+        (value.iloc[-1] / init_cash - 1) * 100,
+    )
+
+    # Group metrics follow the selection and equal vbt's grouped methods
+    portfolio = result.portfolio
+    expected = {
+        "Sharpe Ratio": portfolio.sharpe_ratio(),
+        "Max Drawdown [%]": -portfolio.max_drawdown() * 100,
+        "Win Rate [%]": portfolio.trades.win_rate() * 100,
+        "Expectancy": portfolio.trades.expectancy(),
+        "Exposure Time [%]": portfolio.position_coverage() * 100,
+    }
+    monkeypatch.setattr(config, "metrics", tuple(expected))
+    strategy_metrics = result.strategy_metrics()
+    assert strategy_metrics.columns.tolist() == list(expected)
+    for name, values in expected.items():
+        np.testing.assert_allclose(
+            strategy_metrics[name].to_numpy(), values.to_numpy(dtype=float)
+        )
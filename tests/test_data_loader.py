@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+import pytest
+from core.data_loader import DataLoader
+
+
+@pytest.fixture
+def loader():
+    return DataLoader(exchange=None)
+
+
+def test_validate_data_cleans_and_filters(loader, mock_multi_pair_price_data, caplog):
+    """
+    Validation replaces inf values, fills gaps, drops rows with negative close
+    and removes low-price and zero-volume pairs in vectorized passes.
+    """
+    df = mock_multi_pair_price_data.copy()
+    df.iloc[3, df.columns.get_loc(("AAA/BTC", "close"))] = np.inf
+    df.iloc[0:4, df.columns.get_loc(("AAA/BTC", "open"))] = np.nan
+    df.iloc[10, df.columns.get_loc(("AAA/BTC", "close"))] = -1.0
+    df[("BBB/BTC", "volume")] = 0.0
+    df.iloc[50, df.columns.get_loc(("CCC/BTC", "close"))] = 1e-9
+    df.iloc[60:62, df.columns.get_loc(("BBB/BTC", "close"))] = np.nan
+
+    with caplog.at_level("INFO", logger="core.data_loader"):
+        result = loader._validate_data(df)
+
+    assert list(result.columns.get_level_values("pair").unique()) == ["AAA/BTC"]
+    assert len(result) == len(df) - 1
+    assert not result.isna().any().any()
+    assert np.isfinite(result.to_numpy()).all()
+    assert result[("AAA/BTC", "close")].iloc[3] == df[("AAA/BTC", "close")].iloc[2]
+    assert any(
+        "[VALIDATION] fill_missing_values" in message for message in caplog.messages
+    )
+
+
+def test_filter_low_quality_assets_matches_per_pair_rules(
+    loader, mock_multi_pair_price_data
+):
+    df = mock_multi_pair_price_data.copy()
+    df.iloc[: int(len(df) * 0.95), df.columns.get_loc(("BBB/BTC", "volume"))] = 0.0
+
+    result = loader._filter_low_quality_assets(df, zero_volume_ratio=0.9)
+    assert list(result.columns.get_level_values("pair").unique()) == [
+        "AAA/BTC",
+        "CCC/BTC",
+    ]
+
+    # Nothing to drop: the frame is returned untouched
+    clean = mock_multi_pair_price_data
+    assert loader._filter_low_quality_assets(clean) is clean
+
+
+@pytest.mark.parametrize("use_snapshot", [True, False], ids=["snapshot", "parquet"])
+def test_load_data_projects_pairs_fields_and_window(
+    tmp_path, mock_multi_pair_price_data, monkeypatch, use_snapshot
+):
+    """
+    Projected loads return only the requested pairs, fields and [start, end)
+    rows, whether they come from the snapshot or the parquet pushdown.
+    """
+    from config import config
+
+    monkeypatch.setattr(config, "data_dir", str(tmp_path))
+    monkeypatch.setattr(config, "cache_mode", "file")
+    monkeypatch.setattr(config, "use_snapshot", use_snapshot)
+    loader = DataLoader(exchange=None)
+    mock_multi_pair_price_data.to_parquet(loader.data_path, row_group_size=50)
+    full = loader.load_data()
+
+    start, end = "2025-01-01 01:00", "2025-01-01 02:30"
+    result = loader.load_data(
+        pairs=["AAA/BTC", "CCC/BTC"], fields=("close",), start=start, end=end
+    )
+
+    assert result.columns.tolist() == [("AAA/BTC", "close"), ("CCC/BTC", "close")]
+    assert result.index.min() == pd.Timestamp(start)
+    assert result.index.max() < pd.Timestamp(end)
+    pd.testing.assert_frame_equal(
+        result,
+        full.loc[start:"2025-01-01 02:29", result.columns],
+        check_freq=False,
+    )
+
+
+def test_read_parquet_pushes_down_columns_and_time_filter(
+    tmp_path, mock_multi_pair_price_data, monkeypatch
+):
+    from config import config
+
+    monkeypatch.setattr(config, "data_dir", str(tmp_path))
+    loader = DataLoader(exchange=None)
+    mock_multi_pair_price_data.to_parquet(loader.data_path, row_group_size=50)
+
+    df = loader._read_parquet(
+        pairs=["BBB/BTC"], fields=("open",), start="2025-01-01 03:00"
+    )
+
+    assert df.columns.tolist() == [("BBB/BTC", "open")]
+    assert df.index.min() == pd.Timestamp("2025-01-01 03:00")
+    assert len(df) == len(mock_multi_pair_price_data) - 180
+
+
+@pytest.mark.parametrize("use_snapshot", [True, False], ids=["snapshot", "parquet"])
+def test_projected_load_applies_full_history_validation(
+    tmp_path, mock_multi_pair_price_data, monkeypatch, use_snapshot
+):
+    """
+    Pair and row filters judge the whole history, not just the loaded
+    window: a bad close before the window still drops its pair, and a
+    negative close inside it still drops the row.
+    """
+    from config import config
+
+    monkeypatch.setattr(config, "data_dir", str(tmp_path))
+    monkeypatch.setattr(config, "cache_mode", "file")
+    monkeypatch.setattr(config, "use_snapshot", use_snapshot)
+    df = mock_multi_pair_price_data.copy()
+    df.iloc[10, df.columns.get_loc(("BBB/BTC", "close"))] = 1e-9
+    df.iloc[150, df.columns.get_loc(("CCC/BTC", "close"))] = -1.0
+
+    loader = DataLoader(exchange=None)
+    df.to_parquet(loader.data_path, row_group_size=50)
+    full = loader.load_data()
+    assert full.columns.get_level_values("pair").unique().tolist() == [
+        "AAA/BTC",
+        "CCC/BTC",
+    ]
+
+    start = "2025-01-01 02:00"
+    result = loader.load_data(fields=("close",), start=start)
+    assert result.columns.tolist() == [("AAA/BTC", "close"), ("CCC/BTC", "close")]
+    assert len(result) == len(df) - 120 - 1
+    pd.testing.assert_frame_equal(
+        result, full.loc[start:, result.columns], check_freq=False
+    )
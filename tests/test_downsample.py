@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+from core.downsample import minmax_downsample, minmax_indices
+
+
+def test_minmax_downsample_keeps_budget_and_extremes():
+    """The budget holds, and the endpoints and every extreme survive."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=100_003).cumsum()
+    values[12_345] = 1e6
+    values[54_321] = -1e6
+    series = pd.Series(
+        values, index=pd.date_range("2025-01-01", periods=len(values), freq="1min")
+    )
+
+    downsampled = minmax_downsample(series, 1_000)
+
+    assert len(downsampled) <= 1_000
+    assert downsampled.index.is_monotonic_increasing
+    assert downsampled.index[0] == series.index[0]
+    assert downsampled.index[-1] == series.index[-1]
+    assert downsampled.max() == series.max()
+    assert downsampled.min() == series.min()
+    pd.testing.assert_series_equal(downsampled, series.loc[downsampled.index])
+
+
+def test_minmax_indices_short_series_untouched():
+    values = np.arange(10.0)
+    np.testing.assert_array_equal(minmax_indices(values, 10), np.arange(10))
+    np.testing.assert_array_equal(minmax_indices(values, None), np.arange(10))
+    assert len(minmax_indices(values, 5)) <= 5
+    with pytest.raises(ValueError):
+        minmax_indices(values, 3)
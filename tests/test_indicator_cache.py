@@ -0,0 +1,86 @@
+import pytest
+import numpy as np
+from core.indicator_cache import IndicatorCache, data_fingerprint
+from core.sweep import ParameterSweep
+from strategies.sma_cross import SMACrossStrategy
+
+
+def test_rolling_is_computed_once_per_key(mock_multi_pair_price_data):
+    """A repeated request returns the memoized frame without recomputing."""
+    cache = IndicatorCache(max_bytes=10 * 1024**2)
+    first = cache.rolling(mock_multi_pair_price_data, "close", 20)
+    second = cache.rolling(mock_multi_pair_price_data, "close", 20)
+
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    expected = (
+        mock_multi_pair_price_data.xs("close", level="ohlcv", axis=1).rolling(20).max()
+    )
+    np.testing.assert_array_equal(
+        cache.rolling(mock_multi_pair_price_data, "close", 20, "max").to_numpy(),
+        expected.to_numpy(),
+    )
+
+    with pytest.raises(ValueError, match="Unsupported rolling statistic"):
+        cache.rolling(mock_multi_pair_price_data, "close", 20, "median")
+
+
+def test_lru_eviction_respects_memory_budget(mock_multi_pair_price_data):
+    """Least recently used entries are evicted once the budget is exceeded."""
+    entry_bytes = 300 * 3 * 8
+    cache = IndicatorCache(max_bytes=2 * entry_bytes)
+
+    cache.rolling(mock_multi_pair_price_data, "close", 5)
+    cache.rolling(mock_multi_pair_price_data, "close", 10)
+    cache.rolling(mock_multi_pair_price_data, "close", 5)  # refresh window 5
+    cache.rolling(mock_multi_pair_price_data, "close", 15)
+
+    windows = sorted(key[2] for key in cache._entries)
+    assert windows == [5, 15]
+    assert cache.nbytes == 2 * entry_bytes
+
+
+def test_cache_is_persisted_to_disk(mock_multi_pair_price_data, tmp_path):
+    """A fresh cache with the same directory reloads instead of recomputing."""
+    IndicatorCache(10 * 1024**2, cache_dir=str(tmp_path)).rolling(
+        mock_multi_pair_price_data, "volume", 20
+    )
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+
+    cache = IndicatorCache(10 * 1024**2, cache_dir=str(tmp_path))
+    frame = cache.get(
+        (
+            "rolling_mean",
+            "volume",
+            20,
+            data_fingerprint(mock_multi_pair_price_data, "volume"),
+        ),
+        lambda: pytest.fail("persisted indicator was recomputed"),
+    )
+    assert frame.shape == (300, 3)
+
+
+def test_fingerprint_follows_content(mock_multi_pair_price_data):
+    """Equal data shares a fingerprint; a changed value gets a new one."""
+    copy = mock_multi_pair_price_data.copy()
+    fingerprint = data_fingerprint(mock_multi_pair_price_data, "close")
+    assert data_fingerprint(copy, "close") == fingerprint
+
+    changed = mock_multi_pair_price_data.copy()
+    changed.iloc[-1, 3] += 1.0
+    assert data_fingerprint(changed, "close") != fingerprint
+    assert data_fingerprint(changed, "open") == data_fingerprint(copy, "open")
+
+
+def test_sweep_reuses_rolling_means(mock_multi_pair_price_data, monkeypatch):
+    """Sweep combinations compute each distinct SMA window only once."""
+    cache = IndicatorCache(max_bytes=10 * 1024**2)
+    monkeypatch.setattr("strategies.base.get_indicator_cache", lambda: cache)
+
+    grid = {"fast_period": [3, 5], "slow_period": [10, 20, 30]}
+    ParameterSweep(
+        mock_multi_pair_price_data, SMACrossStrategy, grid
+    ).generate_signals()
+
+    assert cache.misses == 5
+    assert cache.hits == 2 * 3 * 2 - 5
@@ -0,0 +1,132 @@
+import pytest
+import numpy as np
+import numba
+import pandas as pd
+from numba import njit
+from numba.core.caching import NullCache
+from config import config
+from core import kernels
+from core.kernels import get_dispatcher, run_signal_kernel
+from strategies.base import KernelStrategy
+
+
+@pytest.fixture(autouse=True)
+def dispatcher_cache(tmp_path, monkeypatch):
+    """Generated dispatchers go to a temporary data directory."""
+    monkeypatch.setattr(config, "data_dir", str(tmp_path))
+    monkeypatch.setattr(numba.config, "CACHE_DIR", "")
+    monkeypatch.setattr(kernels, "_dispatchers", {})
+    return tmp_path / "numba_cache" / "kernel_dispatchers"
+
+
+@njit(cache=True)
+def momentum_kernel(open_, high, low, close, volume, params, out):
+    (lookback,) = params
+    for i in range(lookback, close.shape[0]):
+        if close[i] > close[i - lookback]:
+            out[i] = 1
+        elif close[i] < close[i - lookback]:
+            out[i] = -1
+
+
+@njit(cache=True)
+def volume_kernel(open_, high, low, close, volume, params, out):
+    threshold, use_open = params
+    for i in range(close.shape[0]):
+        if volume[i] > threshold:
+            out[i] = 1
+    if use_open and open_.shape[0] == 0:
+        out[:] = -1
+
+
+class MomentumStrategy(KernelStrategy):
+    signal_kernel = staticmethod(momentum_kernel)
+
+    def __init__(self, price_data: pd.DataFrame, lookback: int = 5):
+        super().__init__(price_data)
+        self.lookback = lookback
+
+    def kernel_params(self) -> tuple:
+        return (self.lookback,)
+
+
+def test_kernel_strategy_matches_pandas(mock_multi_pair_price_data):
+    """Kernel signals equal the same rule written with pandas."""
+    signals = MomentumStrategy(
+        mock_multi_pair_price_data, lookback=5
+    ).generate_signals()
+
+    close = mock_multi_pair_price_data.xs("close", level="ohlcv", axis=1)
+    previous = close.shift(5)
+    expected = (close > previous).astype("int8") - (close < previous).astype("int8")
+
+    pd.testing.assert_frame_equal(signals, expected)
+    assert signals.dtypes.eq("int8").all()
+
+
+def test_kernel_receives_only_required_fields(mock_multi_pair_price_data):
+    """Fields outside required_fields arrive as empty arrays."""
+    data = run_signal_kernel(
+        volume_kernel,
+        mock_multi_pair_price_data,
+        (500.0, True),
+        fields=("close", "volume"),
+    )
+    expected = mock_multi_pair_price_data.xs("volume", level="ohlcv", axis=1) > 500
+    assert (data == -1).all()
+
+    data = run_signal_kernel(
+        volume_kernel, mock_multi_pair_price_data, (500.0, False), ("volume",)
+    )
+    np.testing.assert_array_equal(data, expected.to_numpy().astype(np.int8))
+
+
+def test_kernel_runs_on_compact_prices(mock_multi_pair_price_data):
+    """float32 prices go through the same kernel without conversion."""
+    compact = mock_multi_pair_price_data.astype("float32")
+    signals = MomentumStrategy(compact, lookback=3).generate_signals()
+    expected = MomentumStrategy(
+        compact.astype("float64"), lookback=3
+    ).generate_signals()
+    pd.testing.assert_frame_equal(signals, expected)
+
+
+def test_dispatcher_is_built_once_per_kernel():
+    assert get_dispatcher(momentum_kernel) is get_dispatcher(momentum_kernel)
+    assert get_dispatcher(momentum_kernel) is not get_dispatcher(volume_kernel)
+
+
+def test_kernel_must_be_jitted(mock_multi_pair_price_data):
+    with pytest.raises(TypeError, match="numba.njit"):
+        run_signal_kernel(momentum_kernel.py_func, mock_multi_pair_price_data, (5,))
+
+    with pytest.raises(TypeError, match="signal_kernel"):
+        KernelStrategy(mock_multi_pair_price_data)
+
+
+def test_module_level_kernels_get_a_cached_dispatcher(
+    mock_multi_pair_price_data, tmp_path, dispatcher_cache
+):
+    """
+    Importable kernels get a dispatcher numba caches under the data
+    directory; kernels defined in a function fall back to a dispatcher
+    compiled per process.
+    """
+    # A module left by an earlier version of the kernel is replaced
+    directory = dispatcher_cache
+    directory.mkdir(parents=True)
+    stale = directory / "test_kernel_strategy__momentum_kernel__0000.py"
+    stale.write_text("")
+
+    dispatcher = get_dispatcher(momentum_kernel)
+    assert not isinstance(dispatcher._cache, NullCache)
+    assert not stale.exists()
+    assert [path.parent for path in tmp_path.rglob("*.py")] == [directory]
+
+    @njit
+    def local_kernel(open_, high, low, close, volume, params, out):
+        out[:] = 1
+
+    assert isinstance(get_dispatcher(local_kernel)._cache, NullCache)
+    data = run_signal_kernel(local_kernel, mock_multi_pair_price_data)
+    assert (data == 1).all()
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+from core.backtester import Backtester
+from core.metrics import METRICS, calculate_metrics
+from core.sweep import ParameterSweep
+from strategies.sma_cross import SMACrossStrategy
+
+
+@pytest.fixture
+def sweep_portfolio(mock_multi_pair_price_data):
+    sweep = ParameterSweep(
+        mock_multi_pair_price_data,
+        SMACrossStrategy,
+        {"fast_period": [3, 5], "slow_period": [10, 20]},
+    )
+    return Backtester(sweep, mock_multi_pair_price_data).run()
+
+
+def test_calculate_metrics_matches_vectorbt(sweep_portfolio):
+    """Every metric equals its vectorbt counterpart for every column."""
+    portfolio = sweep_portfolio
+    metrics = calculate_metrics(portfolio, list(METRICS))
+
+    assert metrics.index.equals(portfolio.wrapper.columns)
+    assert (metrics.dtypes == np.float64).all()
+    expected = {
+        "Total Return [%]": portfolio.total_return() * 100,
+        "Sharpe Ratio": portfolio.sharpe_ratio(),
+        "Max Drawdown [%]": -portfolio.max_drawdown() * 100,
+        "Win Rate [%]": portfolio.trades.win_rate() * 100,
+        "Expectancy": portfolio.trades.expectancy(),
+        "Exposure Time [%]": portfolio.position_coverage() * 100,
+        "Total Trades": portfolio.trades.count(),
+        "Profit Factor": portfolio.trades.profit_factor(),
+    }
+    for name, values in expected.items():
+        np.testing.assert_allclose(
+            metrics[name].to_numpy(), values.to_numpy(dtype=float), rtol=1e-9
+        )
+
+
+def test_calculate_metrics_selection(sweep_portfolio, monkeypatch):
+    """Only the selected metrics are returned, by default those of the config."""
+    from config import config
+
+    monkeypatch.setattr(config, "metrics", ("Sharpe Ratio", "Total Trades"))
+    assert calculate_metrics(sweep_portfolio).columns.tolist() == [
+        "Sharpe Ratio",
+        "Total Trades",
+    ]
+    with pytest.raises(ValueError, match="Unknown metrics"):
+        calculate_metrics(sweep_portfolio, ["Calmar Ratio"])
+
+
+def test_calculate_metrics_without_trades(mock_price_data_no_signals):
+    """Trade metrics are NaN for pairs that never trade."""
+    strategy = SMACrossStrategy(mock_price_data_no_signals)
+    strategy.generate_signals = lambda: pd.DataFrame(
+        0,
+        index=mock_price_data_no_signals.index,
+        columns=strategy.get_close_price().columns,
+        dtype=np.int8,
+    )
+    portfolio = Backtester(strategy, mock_price_data_no_signals).run()
+    metrics = calculate_metrics(portfolio)
+
+    assert (metrics["Total Return [%]"] == 0).all()
+    assert (metrics["Exposure Time [%]"] == 0).all()
+    assert metrics[["Win Rate [%]", "Expectancy"]].isna().all().all()
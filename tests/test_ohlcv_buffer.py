@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+from core.ohlcv_buffer import OHLCVBuffer
+from exchanges.binance import BinanceExchange
+
+START_MS = int(pd.Timestamp("2025-01-01").timestamp() * 1000)
+STEP_MS = 5 * 60_000
+
+
+def make_rows(start_ms: int, n_rows: int, step_ms: int = STEP_MS) -> list:
+    return [
+        [start_ms + i * step_ms, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 10.0 * i]
+        for i in range(n_rows)
+    ]
+
+
+class PagingExchange:
+    """
+    Serves 5m candles like ccxt.binance.fetch_ohlcv, repeating the candle
+    before ``since`` at the start of every page like exchanges that round
+    ``since`` down.
+    """
+
+    def __init__(self, rows: list, overlap: int = 0):
+        self.rows = rows
+        self.overlap = overlap
+        self.requests = []
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.requests.append(since)
+        first = next(i for i, row in enumerate(self.rows) if row[0] >= since)
+        first = max(first - self.overlap, 0)
+        return self.rows[first : first + limit]
+
+
+def test_buffer_drops_rows_outside_range_and_duplicates():
+    buffer = OHLCVBuffer(START_MS, START_MS + 10 * STEP_MS, STEP_MS)
+    rows = make_rows(START_MS - STEP_MS, 13)
+    buffer.append(rows[:6])
+    last_ts = buffer.append(rows[5:])
+
+    frame = buffer.to_frame()
+    assert last_ts == rows[-1][0]
+    assert len(frame) == 10
+    assert frame.index.is_unique and frame.index.is_monotonic_increasing
+    assert frame.index[0] == pd.Timestamp("2025-01-01")
+    assert frame.index[-1] == pd.Timestamp("2025-01-01 00:45")
+    assert frame.index.name == "timestamp"
+    assert list(frame.columns) == ["open", "high", "low", "close", "volume"]
+
+
+def test_buffer_keeps_latest_copy_of_a_candle():
+    buffer = OHLCVBuffer(START_MS, START_MS + 2 * STEP_MS, STEP_MS)
+    rows = make_rows(START_MS, 2)
+    buffer.append(rows)
+    updated = [rows[1][0], 9.0, 9.0, 9.0, 9.0, 99.0]
+    buffer.append([updated])
+
+    frame = buffer.to_frame()
+    assert len(frame) == 2
+    np.testing.assert_array_equal(frame.iloc[1].to_numpy(), updated[1:])
+
+
+def test_buffer_grows_past_expected_candles():
+    buffer = OHLCVBuffer(START_MS, START_MS + 2 * STEP_MS, STEP_MS)
+    buffer.append(make_rows(START_MS, 10, step_ms=60_000))
+
+    assert len(buffer.to_frame()) == 10
+
+
+def test_fetch_full_ohlcv_steps_by_timeframe(monkeypatch):
+    monkeypatch.setattr(BinanceExchange, "page_limit", 100)
+    exchange = BinanceExchange()
+    exchange.exchange = PagingExchange(make_rows(START_MS, 1000), overlap=1)
+
+    frame = exchange.fetch_full_ohlcv(
+        "AAA/BTC", "5m", "2025-01-01", "2025-01-02", delay_seconds=0
+    )
+
+    # 288 candles of 5m in one day, end excluded, boundary repeats dropped
+    assert len(frame) == 288
+    assert frame.index.is_unique
+    assert frame.index[-1] == pd.Timestamp("2025-01-01 23:55")
+    # Every page starts one 5m candle after the last candle of the previous one
+    assert exchange.exchange.requests == [
+        START_MS,
+        START_MS + 100 * STEP_MS,
+        START_MS + 199 * STEP_MS,
+    ]
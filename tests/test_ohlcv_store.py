@@ -0,0 +1,183 @@
+import os
+import ccxt
+import numpy as np
+import pandas as pd
+import pytest
+from config import config
+from core.data_loader import DataLoader
+from core.exchange import ExchangeBase
+from core.ohlcv_store import OHLCVStore
+from exchanges.binance import BinanceExchange
+
+
+def make_ohlcv(start: str, end: str, seed: int = 0) -> pd.DataFrame:
+    index = pd.date_range(start, end, freq="1min", inclusive="left", name="timestamp")
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(1, 500, len(index)).astype(float),
+        },
+        index=index,
+    )
+
+
+class FakeExchange(ExchangeBase):
+    """Serves slices of canned history and records every requested range."""
+
+    def __init__(self, history: dict):
+        self.history = history
+        self.requests = []
+        self.markets_loaded = 0
+
+    def fetch_ohlcv(self, symbol, timeframe, start_date, end_date):
+        raise NotImplementedError
+
+    def fetch_full_ohlcv(self, pair, timeframe, start, end, delay_seconds=1):
+        self.requests.append((pair, pd.Timestamp(start), pd.Timestamp(end)))
+        df = self.history[pair]
+        return df[(df.index >= start) & (df.index < end)].copy()
+
+    def get_top_pairs(self, base_currency, limit):
+        self.markets_loaded += 1
+        return list(self.history)[:limit]
+
+
+@pytest.fixture
+def history():
+    return {
+        "AAA/BTC": make_ohlcv("2025-01-30", "2025-02-05", seed=1),
+        "BBB/BTC": make_ohlcv("2025-01-30", "2025-02-05", seed=2),
+    }
+
+
+@pytest.fixture
+def incremental_config(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "data_dir", str(tmp_path))
+    monkeypatch.setattr(config, "cache_mode", "incremental")
+    monkeypatch.setattr(config, "fetch_mode", "sync")
+    monkeypatch.setattr(config, "timeframe", "1m")
+    monkeypatch.setattr(config, "start_date", "2025-01-31")
+    monkeypatch.setattr(config, "end_date", "2025-02-02")
+    monkeypatch.setattr(config, "num_pairs", 1)
+
+
+def test_store_tracks_coverage_and_partitions_by_month(tmp_path, history):
+    store = OHLCVStore(str(tmp_path), "1m")
+    pair = "AAA/BTC"
+    df = history[pair]
+    start, end = pd.Timestamp("2025-01-31"), pd.Timestamp("2025-02-02")
+
+    assert store.missing_ranges(pair, start, end) == [(start, end)]
+    store.write(pair, df[(df.index >= start) & (df.index < end)], start, end)
+
+    assert store.missing_ranges(pair, start, end) == []
+    assert store.missing_ranges(pair, start, "2025-02-03") == [
+        (end, pd.Timestamp("2025-02-03"))
+    ]
+    assert sorted(p.name for p in (tmp_path / "1m" / "AAA-BTC").iterdir()) == [
+        "2025-01.parquet",
+        "2025-02.parquet",
+    ]
+
+    window = store.read(pair, "2025-01-31 12:00", "2025-02-01 12:00")
+    expected = df[(df.index >= "2025-01-31 12:00") & (df.index < "2025-02-01 12:00")]
+    pd.testing.assert_frame_equal(window, expected, check_freq=False)
+
+    # Coverage survives reopening the store
+    assert OHLCVStore(str(tmp_path), "1m").coverage(pair) == [(start, end)]
+
+
+def test_store_records_empty_fetches_of_finished_ranges(tmp_path):
+    """A pair without candles in a past range is not requested again."""
+    store = OHLCVStore(str(tmp_path), "1m")
+    start, end = pd.Timestamp("2025-01-31"), pd.Timestamp("2025-02-02")
+    store.write("NEW/BTC", pd.DataFrame(), start, end)
+    assert store.missing_ranges("NEW/BTC", start, end) == []
+    assert not (tmp_path / "1m" / "NEW-BTC").exists()
+
+    # A range reaching into the future may still receive candles
+    future = pd.Timestamp.now().normalize() + pd.Timedelta(days=2)
+    store.write("NEW/BTC", pd.DataFrame(), end, future)
+    assert store.missing_ranges("NEW/BTC", start, future) == [(end, future)]
+
+
+def test_incremental_load_fetches_only_missing_ranges(
+    history, incremental_config, monkeypatch
+):
+    exchange = FakeExchange(history)
+    first = DataLoader(exchange).load_data()
+    assert exchange.requests == [
+        ("AAA/BTC", pd.Timestamp("2025-01-31"), pd.Timestamp("2025-02-02"))
+    ]
+
+    # Moving end_date forward only fetches the new day
+    exchange.requests.clear()
+    monkeypatch.setattr(config, "end_date", "2025-02-03")
+    extended = DataLoader(exchange).load_data()
+    assert exchange.requests == [
+        ("AAA/BTC", pd.Timestamp("2025-02-02"), pd.Timestamp("2025-02-03"))
+    ]
+    pd.testing.assert_frame_equal(
+        extended.loc[: first.index.max()], first, check_freq=False
+    )
+
+    # Adding a pair only fetches the new pair
+    exchange.requests.clear()
+    monkeypatch.setattr(config, "num_pairs", 2)
+    widened = DataLoader(exchange).load_data()
+    assert [pair for pair, _, _ in exchange.requests] == ["BBB/BTC"]
+    assert list(widened.columns.get_level_values("pair").unique()) == [
+        "AAA/BTC",
+        "BBB/BTC",
+    ]
+
+    # Everything is stored now, nothing is fetched, and the stored pair
+    # list answers without loading the markets
+    exchange.requests.clear()
+    exchange.markets_loaded = 0
+    DataLoader(exchange).load_data()
+    assert exchange.requests == []
+    assert exchange.markets_loaded == 0
+
+
+class FlakyCcxtExchange:
+    """Serves canned candles like ccxt.binance.fetch_ohlcv after some failures."""
+
+    def __init__(self, df: pd.DataFrame, failures: int):
+        self.failures = failures
+        self.rows = [
+            [int(ts.timestamp() * 1000), *values]
+            for ts, values in zip(df.index, df.to_numpy().tolist())
+        ]
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        if self.failures:
+            self.failures -= 1
+            raise ccxt.ExchangeError("simulated server error")
+        return [row for row in self.rows if row[0] >= since][:limit]
+
+
+def test_failed_fetch_is_not_recorded_as_covered(
+    history, incremental_config, monkeypatch
+):
+    """A range whose first page fails is fetched again on the next load."""
+    monkeypatch.setattr(config, "fetch_delay_seconds", 0)
+    exchange = BinanceExchange()
+    exchange.exchange = FlakyCcxtExchange(history["AAA/BTC"], failures=1)
+    monkeypatch.setattr(exchange, "get_top_pairs", lambda base, limit: ["AAA/BTC"])
+
+    with pytest.raises(ValueError, match="No valid data"):
+        DataLoader(exchange).load_data()
+    store = OHLCVStore(os.path.join(config.data_dir, "store"), "1m")
+    start, end = pd.Timestamp(config.start_date), pd.Timestamp(config.end_date)
+    assert store.missing_ranges("AAA/BTC", start, end) == [(start, end)]
+
+    df = DataLoader(exchange).load_data()
+    assert len(df) == 2 * 1440
+    store = OHLCVStore(os.path.join(config.data_dir, "store"), "1m")
+    assert store.coverage("AAA/BTC") == [(start, end)]
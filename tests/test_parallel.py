@@ -0,0 +1,61 @@
+import sqlite3
+import pandas as pd
+from core.parallel import SharedFrame, run_strategies_parallel
+from core.results_store import STORE_FILE, ResultsStore, current_run_id
+from strategies.base import StrategyBase
+from strategies.sma_cross import SMACrossStrategy
+from strategies.vwap_reversion import VWAPReversionStrategy
+
+
+class FailingStrategy(StrategyBase):
+    def generate_signals(self) -> pd.DataFrame:
+        raise RuntimeError("boom")
+
+
+def test_shared_frame_roundtrip(mock_multi_pair_price_data):
+    """A frame attached from shared memory must equal the published frame."""
+    shared = SharedFrame(mock_multi_pair_price_data)
+    try:
+        attached, handles = SharedFrame.attach(shared.spec)
+        pd.testing.assert_frame_equal(attached, mock_multi_pair_price_data)
+        for handle in handles:
+            handle.close()
+    finally:
+        shared.close()
+
+
+def test_run_strategies_parallel_collects_results_and_errors(
+    mock_multi_pair_price_data, tmp_path, monkeypatch
+):
+    """
+    Every strategy gets a result: metrics for successful runs and a traceback
+    for failures, without aborting the other workers.
+    """
+    monkeypatch.chdir(tmp_path)
+    results = run_strategies_parallel(
+        [SMACrossStrategy, VWAPReversionStrategy, FailingStrategy, SMACrossStrategy],
+        mock_multi_pair_price_data,
+        max_workers=2,
+    )
+
+    # One result per submitted class, duplicates included, in submission order
+    assert [result.name for result in results] == [
+        "SMACrossStrategy",
+        "VWAPReversionStrategy",
+        "FailingStrategy",
+        "SMACrossStrategy",
+    ]
+    sma, vwap, failing, sma_again = results
+    assert sma.ok and sma_again.ok
+    assert sma.metrics is not None
+    assert vwap.ok
+    assert not failing.ok
+    assert "boom" in failing.error
+    stored = ResultsStore.in_dir(tmp_path / "results").load()
+    assert set(stored.index) == {"SMACrossStrategy", "VWAPReversionStrategy"}
+
+    # Every worker stores its rows under the run id of the parent
+    with sqlite3.connect(tmp_path / "results" / STORE_FILE) as connection:
+        run_ids = connection.execute("SELECT DISTINCT run_id FROM metrics").fetchall()
+    connection.close()
+    assert run_ids == [(current_run_id(),)]
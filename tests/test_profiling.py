@@ -0,0 +1,46 @@
+import json
+import pstats
+from config import config
+from core.backtester import backtest_strategy, wait_for_artifacts
+from strategies.sma_cross import SMACrossStrategy
+from utils.profiling import reset_run_report
+
+
+def test_run_report_records_backtest_stages(
+    mock_multi_pair_price_data, tmp_path, monkeypatch
+):
+    """
+    A backtest records its stages with timings and sizes, the report is
+    written as JSON, and the configured strategy is captured by cProfile.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "report_artifacts", ("equity",))
+    monkeypatch.setattr(config, "profile_strategy", "SMACrossStrategy")
+    report = reset_run_report()
+
+    backtest_strategy(SMACrossStrategy(mock_multi_pair_price_data))
+    wait_for_artifacts()
+
+    stages = {record["step"]: record for record in report.stages}
+    assert set(stages) == {
+        "generate_signals",
+        "simulate",
+        "metrics",
+        "artifact_equity",
+    }
+    simulate = stages["simulate"]
+    assert simulate["strategy"] == "SMACrossStrategy"
+    assert (simulate["rows"], simulate["pairs"], simulate["columns"]) == (300, 3, 3)
+    assert simulate["wall_s"] >= 0 and simulate["cpu_s"] >= 0
+    assert simulate["process_cpu_s"] >= 0
+
+    report.write("logs/run_report.json")
+    with open("logs/run_report.json") as f:
+        written = json.load(f)
+    assert [record["step"] for record in written["stages"]] == [
+        record["step"] for record in report.stages
+    ]
+    assert written["peak_rss_mb"] > 0
+
+    stats = pstats.Stats("logs/SMACrossStrategy.prof")
+    assert any(func[2] == "generate_signals" for func in stats.stats)
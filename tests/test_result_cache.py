@@ -0,0 +1,86 @@
+import os
+import shutil
+import pandas as pd
+from config import config
+from core.backtester import Backtester, run_strategy
+from core import result_cache
+from core.result_cache import get_result_cache
+from core.results_store import ResultsStore
+from strategies.sma_cross import SMACrossStrategy
+
+
+def test_run_strategy_reuses_cached_results(
+    mock_multi_pair_price_data, tmp_path, monkeypatch
+):
+    """
+    A rerun with unchanged data, parameters and costs skips the backtest
+    and returns the stored metrics; changing any of them runs it again.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "result_cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setattr(config, "report_artifacts", ())
+
+    runs = []
+    run = Backtester.run
+    monkeypatch.setattr(
+        Backtester, "run", lambda self: runs.append(self.strategy.name) or run(self)
+    )
+
+    expected = run_strategy(SMACrossStrategy(mock_multi_pair_price_data))
+    assert len(runs) == 1
+    key = get_result_cache().key(SMACrossStrategy(mock_multi_pair_price_data))
+    assert sorted(os.listdir(tmp_path / "cache" / key)) == [
+        "metrics.parquet",
+        "orders.parquet",
+        "signals.parquet",
+    ]
+
+    os.remove("results/results.db")
+    cached = run_strategy(SMACrossStrategy(mock_multi_pair_price_data))
+    assert len(runs) == 1
+    pd.testing.assert_frame_equal(cached, expected)
+    assert len(ResultsStore.in_dir("results").load()) == len(expected)
+
+    signals = get_result_cache().load_signals(key)
+    pd.testing.assert_frame_equal(
+        signals,
+        SMACrossStrategy(mock_multi_pair_price_data).generate_signals(),
+        check_freq=False,
+    )
+
+    run_strategy(SMACrossStrategy(mock_multi_pair_price_data, fast_period=5))
+    assert len(runs) == 2
+
+    monkeypatch.setattr(config, "commission", 0.002)
+    run_strategy(SMACrossStrategy(mock_multi_pair_price_data))
+    assert len(runs) == 3
+
+    monkeypatch.setattr(config, "metrics", ("Total Trades",))
+    selected = run_strategy(SMACrossStrategy(mock_multi_pair_price_data))
+    assert len(runs) == 4
+    assert selected.columns.tolist() == ["Total Trades"]
+
+    changed = mock_multi_pair_price_data.copy()
+    changed.iloc[-1, changed.columns.get_loc(("AAA/BTC", "close"))] *= 1.01
+    run_strategy(SMACrossStrategy(changed))
+    assert len(runs) == 5
+
+
+def test_result_cache_key_covers_metric_code(
+    mock_multi_pair_price_data, tmp_path, monkeypatch
+):
+    """A change to the metric or simulation code misses the cache."""
+    metrics_copy = tmp_path / "metrics.py"
+    shutil.copy(result_cache._ENGINE_SOURCES[-1], metrics_copy)
+    monkeypatch.setattr(
+        result_cache,
+        "_ENGINE_SOURCES",
+        (*result_cache._ENGINE_SOURCES[:-1], str(metrics_copy)),
+    )
+    cache = result_cache.ResultCache(str(tmp_path / "cache"))
+    strategy = SMACrossStrategy(mock_multi_pair_price_data)
+    key = cache.key(strategy)
+
+    with open(metrics_copy, "a") as f:
+        f.write("\n# changed formula\n")
+    assert cache.key(strategy) != key
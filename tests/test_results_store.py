@@ -0,0 +1,100 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+from core.backtester import Backtester
+from core.results_store import ResultsStore
+
+
+def _metrics(index, total_return):
+    return pd.DataFrame(
+        {"Total Return [%]": total_return, "Sharpe Ratio": np.nan}, index=index
+    )
+
+
+def test_results_store_returns_latest_run_per_strategy(tmp_path):
+    """
+    Runs are appended; loading keeps the latest run of every strategy and
+    parameter combination, labels sweep combinations and filters strategies.
+    """
+    store = ResultsStore.in_dir(tmp_path)
+    pairs = pd.Index(["AAA/BTC", "BBB/BTC"], name="pair")
+    sweep_index = pd.MultiIndex.from_product(
+        [[5, 10], pairs], names=["fast_period", "pair"]
+    )
+
+    store.append(_metrics(pairs, [1.0, 2.0]), "SMACrossStrategy", run_id="run-1")
+    store.append(_metrics(pairs, [3.0, 4.0]), "VWAPReversionStrategy", run_id="run-1")
+    store.append(_metrics(pairs, [5.0, 6.0]), "SMACrossStrategy", run_id="run-2")
+    store.append(
+        _metrics(sweep_index, [7.0, 8.0, 9.0, 10.0]),
+        "RSIBBStrategySweep",
+        run_id="run-2",
+    )
+
+    latest = store.load()
+    assert latest.index.tolist() == [
+        "VWAPReversionStrategy",
+        "VWAPReversionStrategy",
+        "SMACrossStrategy",
+        "SMACrossStrategy",
+        "RSIBBStrategySweep(fast_period=5)",
+        "RSIBBStrategySweep(fast_period=5)",
+        "RSIBBStrategySweep(fast_period=10)",
+        "RSIBBStrategySweep(fast_period=10)",
+    ]
+    assert latest.columns.tolist() == ["pair", "Total Return [%]", "Sharpe Ratio"]
+    assert latest["Total Return [%]"].tolist() == [3, 4, 5, 6, 7, 8, 9, 10]
+    assert latest["Sharpe Ratio"].isna().all()
+
+    first = store.load(run_id="run-1", strategies=["SMACrossStrategy"])
+    assert first["Total Return [%]"].tolist() == [1.0, 2.0]
+    assert first["pair"].tolist() == ["AAA/BTC", "BBB/BTC"]
+
+
+def test_compare_strategies_queries_store(tmp_path):
+    store = ResultsStore.in_dir(tmp_path)
+    pairs = pd.Index(["AAA/BTC"], name="pair")
+    store.append(_metrics(pairs, [1.0]), "SMACrossStrategy")
+
+    compared = Backtester.compare_strategies_metrics(results_dir=str(tmp_path))
+
+    assert compared.index.tolist() == ["SMACrossStrategy"]
+    assert (tmp_path / "strategy_comparison.csv").exists()
+    assert (tmp_path / "screenshots" / "strategy_comparison_total_return.png").exists()
+    assert Backtester.compare_strategies_metrics(
+        results_dir=str(tmp_path / "empty")
+    ).empty
+
+
+def test_results_store_closes_connection_on_failure(tmp_path, monkeypatch):
+    """A failing insert rolls back and still closes the SQLite handle."""
+    store = ResultsStore.in_dir(tmp_path)
+    connect = store._connect
+    opened = []
+
+    def tracking_connect():
+        connection = connect()
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(store, "_connect", tracking_connect)
+    with store._connect() as connection:
+        connection.execute(
+            "CREATE TRIGGER reject BEFORE INSERT ON metrics "
+            "BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+        )
+    connection.close()
+    pairs = pd.Index(["AAA/BTC"], name="pair")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        store.append(_metrics(pairs, [1.0]), "SMACrossStrategy", run_id="run-1")
+
+    assert opened
+    for connection in opened:
+        try:
+            connection.execute("SELECT 1")
+        except sqlite3.ProgrammingError:
+            continue
+        raise AssertionError("connection left open")
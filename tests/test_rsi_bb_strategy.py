@@ -1,4 +1,6 @@
 import pytest
+import pandas as pd
+import ta
 from strategies.rsi_bb import RSIBBStrategy
 
 
@@ -49,3 +51,37 @@ def test_rsi_bb_generate_signals(
     assert (
         signal_values.tolist() == expected_signals
     ), f"Expected signals {expected_signals}, but got {signal_values.tolist()}"
+
+
+def legacy_rsi_bb_signals(close: pd.Series, rsi_period: int, bb_period: int):
+    """Per-symbol reference built from ta indicator objects."""
+    rsi = ta.momentum.RSIIndicator(close, window=rsi_period).rsi()
+    bb = ta.volatility.BollingerBands(close, window=bb_period)
+    expected = pd.Series(0, index=close.index, dtype="int8")
+    expected[(rsi < 30) & (close < bb.bollinger_lband())] = 1
+    expected[(rsi > 70) & (close > bb.bollinger_hband())] = -1
+    return expected
+
+
+@pytest.mark.parametrize("rsi_period,bb_period", [(14, 20), (2, 20), (6, 10)])
+def test_rsi_bb_matches_ta_per_symbol(
+    mock_multi_pair_price_data, rsi_period, bb_period
+):
+    """
+    The vectorized RSI and Bollinger Bands must reproduce the per-symbol
+    ta.momentum.RSIIndicator / ta.volatility.BollingerBands signals exactly.
+    """
+    strategy = RSIBBStrategy(
+        price_data=mock_multi_pair_price_data,
+        rsi_period=rsi_period,
+        bb_period=bb_period,
+    )
+    signals = strategy.generate_signals()
+
+    close_df = strategy.get_close_price()
+    for symbol in close_df.columns:
+        expected = legacy_rsi_bb_signals(close_df[symbol], rsi_period, bb_period)
+        pd.testing.assert_series_equal(signals[symbol], expected, check_names=False)
+
+    assert signals.dtypes.eq("int8").all()
+    assert (signals != 0).any().any()
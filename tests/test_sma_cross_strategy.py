@@ -1,4 +1,6 @@
 import pytest
+import pandas as pd
+import ta
 from strategies.sma_cross import SMACrossStrategy
 
 
@@ -45,3 +47,26 @@ def test_sma_cross_generate_signals(
     assert (
         signal_values.tolist() == expected_signals
     ), f"Expected signals {expected_signals}, but got {signal_values.tolist()}"
+
+
+def test_sma_cross_matches_ta_per_symbol(mock_multi_pair_price_data):
+    """
+    The vectorized implementation must reproduce the per-symbol
+    ta.trend.SMAIndicator signals exactly for every pair.
+    """
+    strategy = SMACrossStrategy(
+        price_data=mock_multi_pair_price_data, fast_period=5, slow_period=20
+    )
+    signals = strategy.generate_signals()
+
+    close_df = strategy.get_close_price()
+    for symbol in close_df.columns:
+        close = close_df[symbol]
+        fast_sma = ta.trend.SMAIndicator(close, window=5).sma_indicator()
+        slow_sma = ta.trend.SMAIndicator(close, window=20).sma_indicator()
+        expected = pd.Series(0, index=close.index, dtype="int8")
+        expected[fast_sma > slow_sma] = 1
+        expected[fast_sma < slow_sma] = -1
+        pd.testing.assert_series_equal(signals[symbol], expected, check_names=False)
+
+    assert signals.dtypes.eq("int8").all()
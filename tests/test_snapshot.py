@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+from config import config
+from core.data_loader import DataLoader
+from core.snapshot import make_checksum, read_snapshot, write_snapshot
+
+
+def test_snapshot_roundtrip_is_memory_mapped(tmp_path, mock_multi_pair_price_data):
+    path = str(tmp_path / "prices.validated.arrow")
+    checksum = make_checksum("source")
+    write_snapshot(mock_multi_pair_price_data, path, checksum)
+
+    df = read_snapshot(path, checksum)
+    pd.testing.assert_frame_equal(
+        df, mock_multi_pair_price_data, check_freq=False, check_index_type=False
+    )
+
+    # Float columns are views of the mapped file, not private copies
+    values = df[("AAA/BTC", "close")].to_numpy()
+    assert not values.flags.owndata
+    assert not values.flags.writeable
+
+    assert read_snapshot(path, make_checksum("other source")) is None
+    assert read_snapshot(str(tmp_path / "missing.arrow")) is None
+
+
+def test_load_data_skips_validation_when_snapshot_matches(
+    tmp_path, mock_multi_pair_price_data, monkeypatch
+):
+    monkeypatch.setattr(config, "data_dir", str(tmp_path))
+    monkeypatch.setattr(config, "cache_mode", "file")
+    monkeypatch.setattr(config, "use_snapshot", True)
+    loader = DataLoader(exchange=None)
+    mock_multi_pair_price_data.to_parquet(loader.data_path)
+
+    first = loader.load_data()
+    assert (tmp_path / f"{config.data_file.rsplit('.', 1)[0]}.validated.arrow").exists()
+
+    def fail(df):
+        raise AssertionError("validation should be skipped")
+
+    monkeypatch.setattr(loader, "_validate_data", fail)
+    second = loader.load_data()
+    pd.testing.assert_frame_equal(second, first, check_freq=False)
+
+    # Rewriting the cached parquet invalidates the snapshot
+    mock_multi_pair_price_data.iloc[:100].to_parquet(loader.data_path)
+    with pytest.raises(AssertionError, match="validation should be skipped"):
+        loader.load_data()
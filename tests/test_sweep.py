@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+from core.backtester import Backtester
+from core.sweep import ParameterSweep
+from strategies.sma_cross import SMACrossStrategy
+
+
+def test_sweep_signals_stack_parameter_combinations(mock_multi_pair_price_data):
+    """
+    Each (param..., pair) column of the sweep must equal the signals of the
+    strategy instantiated with that parameter combination.
+    """
+    grid = {"fast_period": [3, 5], "slow_period": [10, 20, 30]}
+    sweep = ParameterSweep(mock_multi_pair_price_data, SMACrossStrategy, grid)
+    signals = sweep.generate_signals()
+
+    assert signals.columns.names == ["fast_period", "slow_period", "pair"]
+    assert signals.shape == (len(mock_multi_pair_price_data), 2 * 3 * 3)
+    assert signals.dtypes.eq("int8").all()
+
+    for params in sweep.param_combinations():
+        expected = SMACrossStrategy(mock_multi_pair_price_data, **params)
+        block = signals[(params["fast_period"], params["slow_period"])]
+        np.testing.assert_array_equal(
+            block.to_numpy(), expected.generate_signals().to_numpy()
+        )
+
+
+def test_sweep_runs_in_single_simulation(
+    mock_multi_pair_price_data, tmp_path, monkeypatch
+):
+    """
+    The sweep portfolio must contain every combination and reproduce the
+    returns of the individual backtests.
+    """
+    monkeypatch.chdir(tmp_path)
+    grid = {"fast_period": [3, 5], "slow_period": [20]}
+    sweep = ParameterSweep(mock_multi_pair_price_data, SMACrossStrategy, grid)
+    portfolio = Backtester(sweep, mock_multi_pair_price_data).run()
+
+    total_return = portfolio.total_return()
+    assert len(total_return) == 2 * 3
+
+    single = SMACrossStrategy(mock_multi_pair_price_data, fast_period=5, slow_period=20)
+    expected = Backtester(single, mock_multi_pair_price_data).run().total_return()
+    np.testing.assert_allclose(
+        total_return.xs((5, 20), level=["fast_period", "slow_period"]).to_numpy(),
+        expected.to_numpy(),
+    )
+
+
+def test_sweep_equity_is_summed_per_combination(
+    mock_multi_pair_price_data, tmp_path, monkeypatch
+):
+    """Equity plots sum pairs within a combination, never across combinations."""
+    monkeypatch.chdir(tmp_path)
+    grid = {"fast_period": [3, 5], "slow_period": [20]}
+    sweep = ParameterSweep(mock_multi_pair_price_data, SMACrossStrategy, grid)
+    portfolio = Backtester(sweep, mock_multi_pair_price_data).run()
+
+    total_equity = Backtester._total_equity(portfolio)
+    assert list(total_equity.columns) == [
+        "fast_period=3, slow_period=20",
+        "fast_period=5, slow_period=20",
+    ]
+    np.testing.assert_allclose(
+        total_equity.iloc[:, 1],
+        portfolio.value()[(5, 20)].sum(axis=1),
+    )
+
+
+def test_sweep_rejects_empty_grid(mock_multi_pair_price_data):
+    with pytest.raises(ValueError):
+        ParameterSweep(mock_multi_pair_price_data, SMACrossStrategy, {})
+    with pytest.raises(ValueError):
+        ParameterSweep(
+            mock_multi_pair_price_data, SMACrossStrategy, {"fast_period": []}
+        )
@@ -1,4 +1,5 @@
 import pytest
+import pandas as pd
 from strategies.volume_spike_breakout import VolumeSpikeBreakoutStrategy
 
 
@@ -25,3 +26,40 @@ def test_volume_spike_breakout_generate_signals(
     assert (
         signal_values == expected_signals
     ), f"Expected {expected_signals}, got {signal_values}"
+
+
+def legacy_volume_spike_signals(price_data, pair, window, volume_multiplier):
+    """Per-pair reference of the breakout rules on pandas Series."""
+    close = price_data[(pair, "close")]
+    volume = price_data[(pair, "volume")]
+    avg_volume = volume.rolling(window).mean()
+    entry = (volume > avg_volume * volume_multiplier) & (
+        close > close.rolling(window).max().shift(1)
+    )
+    exit = close < close.rolling(window).min().shift(1)
+    expected = pd.Series(0, index=close.index, dtype="int8")
+    expected[entry] = 1
+    expected[exit] = -1
+    return expected
+
+
+@pytest.mark.parametrize("window,volume_multiplier", [(20, 2.0), (5, 1.2)])
+def test_volume_spike_breakout_matches_per_pair(
+    mock_multi_pair_price_data, window, volume_multiplier
+):
+    """The matrix-wide rules must reproduce the per-pair signals exactly."""
+    strategy = VolumeSpikeBreakoutStrategy(
+        price_data=mock_multi_pair_price_data,
+        window=window,
+        volume_multiplier=volume_multiplier,
+    )
+    signals = strategy.generate_signals()
+
+    for pair in signals.columns:
+        expected = legacy_volume_spike_signals(
+            mock_multi_pair_price_data, pair, window, volume_multiplier
+        )
+        pd.testing.assert_series_equal(signals[pair], expected, check_names=False)
+
+    assert signals.dtypes.eq("int8").all()
+    assert (signals == 1).any().any() and (signals == -1).any().any()
@@ -1,6 +1,7 @@
 import pytest
 from strategies.vwap_reversion import VWAPReversionStrategy
 import pandas as pd
+import ta
 
 
 @pytest.mark.parametrize(
@@ -35,3 +36,38 @@ def test_vwap_reversion_generate_signals(
         signal_values = [0] * len(signals)
 
     assert signal_values == expected_signals
+
+
+def legacy_vwap_signals(price_data: pd.DataFrame, pair: str, vwap_period: int):
+    """Per-pair reference built from ta.volume.VolumeWeightedAveragePrice."""
+    close = price_data[(pair, "close")]
+    vwap = ta.volume.VolumeWeightedAveragePrice(
+        high=price_data[(pair, "high")],
+        low=price_data[(pair, "low")],
+        close=close,
+        volume=price_data[(pair, "volume")],
+        window=vwap_period,
+    ).volume_weighted_average_price()
+    expected = pd.Series(0, index=close.index, dtype="int8")
+    expected[close < vwap * 0.98] = 1
+    expected[close > vwap] = -1
+    return expected
+
+
+@pytest.mark.parametrize("vwap_period", [3, 20])
+def test_vwap_reversion_matches_per_pair(mock_multi_pair_price_data, vwap_period):
+    """
+    The matrix-wide VWAP must reproduce the per-pair ta implementation
+    exactly, including pairs with zero-volume windows.
+    """
+    price_data = mock_multi_pair_price_data.copy()
+    price_data.iloc[100:110, 4] = 0.0  # AAA/BTC volume gap
+    strategy = VWAPReversionStrategy(price_data=price_data, vwap_period=vwap_period)
+    signals = strategy.generate_signals()
+
+    for pair in signals.columns:
+        expected = legacy_vwap_signals(price_data, pair, vwap_period)
+        pd.testing.assert_series_equal(signals[pair], expected, check_names=False)
+
+    assert signals.dtypes.eq("int8").all()
+    assert (signals == 1).any().any() and (signals == -1).any().any()
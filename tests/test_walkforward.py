@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+from core.backtester import Backtester
+from core.walkforward import run_walk_forward, walk_forward_splits
+from strategies.sma_cross import SMACrossStrategy
+
+
+def test_walk_forward_splits_tile_test_windows():
+    splits = walk_forward_splits(100, train_rows=40, test_rows=20)
+    assert [
+        (train.start, train.stop, test.start, test.stop) for train, test in splits
+    ] == [
+        (0, 40, 40, 60),
+        (20, 60, 60, 80),
+        (40, 80, 80, 100),
+    ]
+    assert len(walk_forward_splits(100, 40, 20, step_rows=10)) == 5
+    with pytest.raises(ValueError):
+        walk_forward_splits(50, 40, 20)
+
+
+def test_walk_forward_picks_best_train_combination(
+    mock_multi_pair_price_data, tmp_path, monkeypatch
+):
+    """
+    Each window keeps the combination with the best mean train return, and
+    parallel windows give the same result as sequential ones.
+    """
+    monkeypatch.chdir(tmp_path)
+    grid = {"fast_period": [3, 5], "slow_period": [10, 20]}
+    price_data = mock_multi_pair_price_data
+
+    result = run_walk_forward(
+        SMACrossStrategy,
+        price_data,
+        grid,
+        train_rows=120,
+        test_rows=60,
+        objective="total_return",
+    )
+    windows = result.windows
+    assert len(windows) == 3
+
+    # Signals are generated over the full history, so a combination's
+    # train score is its full-history backtest restricted to the window
+    for _, window in windows.iterrows():
+        rows = slice(
+            price_data.index.get_loc(window["train_start"]),
+            price_data.index.get_loc(window["train_end"]) + 1,
+        )
+        scores = {}
+        for fast in grid["fast_period"]:
+            for slow in grid["slow_period"]:
+                strategy = SMACrossStrategy(price_data, fast, slow)
+                signals = strategy.generate_signals().iloc[rows]
+                strategy.generate_signals = lambda signals=signals: signals
+                portfolio = Backtester(strategy, price_data.iloc[rows]).run()
+                scores[(fast, slow)] = portfolio.total_return().mean()
+        best = max(scores, key=scores.get)
+        assert (window["fast_period"], window["slow_period"]) == best
+        assert window["train_score"] == pytest.approx(scores[best])
+
+    parallel = run_walk_forward(
+        SMACrossStrategy,
+        price_data,
+        grid,
+        train_rows=120,
+        test_rows=60,
+        objective="total_return",
+        max_workers=2,
+    )
+    pd.testing.assert_frame_equal(parallel.windows, windows)
+
+    assert result.save() == "results/smacrossstrategy_walk_forward.csv"
+
+
+def test_walk_forward_default_objective_skips_combinations_without_trades(
+    mock_multi_pair_price_data,
+):
+    """
+    Flat equity has an infinite Sharpe ratio, so a combination whose fast
+    and slow SMA coincide (and never trades) must not win a window.
+    """
+    result = run_walk_forward(
+        SMACrossStrategy,
+        mock_multi_pair_price_data,
+        {"fast_period": [3, 10], "slow_period": [10]},
+        train_rows=120,
+        test_rows=60,
+    )
+    windows = result.windows
+    assert (windows["fast_period"] == 3).all()
+    assert np.isfinite(windows["train_score"]).all()
+    assert not np.isinf(windows["test_score"]).any()
@@ -0,0 +1,176 @@
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+def current_rss() -> int:
+    """Return the current resident set size of the process in bytes (0 if unknown)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize()
+    except (OSError, AttributeError, ValueError):
+        return 0
+
+
+def peak_rss() -> int:
+    """Return the peak resident set size of the process in bytes (0 if unknown)."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@contextmanager
+def measure(step: str, log=None, prefix: str = "[PROFILE]"):
+    """
+    Measure wall time, CPU time and memory of a block of code.
+
+    Yields a dict that is filled in when the block exits, so callers can add
+    their own fields (e.g. rows processed) and keep the record. ``cpu_s`` is
+    the CPU time of the calling thread, so background render threads are not
+    charged to the open stage; ``process_cpu_s`` counts all threads,
+    including numba and BLAS workers the block may start.
+
+    Parameters
+    ----------
+    step : str
+        Name of the measured step.
+    log : logging.Logger, optional
+        Logger that receives a one-line summary. Defaults to this module's logger.
+    prefix : str, optional
+        Tag prepended to the summary line. Defaults to "[PROFILE]".
+    """
+    record = {"step": step}
+    rss_before = current_rss()
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    process_cpu_start = time.process_time()
+    try:
+        yield record
+    finally:
+        record["wall_s"] = time.perf_counter() - wall_start
+        record["cpu_s"] = time.thread_time() - cpu_start
+        record["process_cpu_s"] = time.process_time() - process_cpu_start
+        record["rss_delta_mb"] = (current_rss() - rss_before) / 2**20
+        record["peak_rss_mb"] = peak_rss() / 2**20
+        (log or logger).info(
+            f"{prefix} {step}: {record['wall_s']:.3f}s wall, "
+            f"{record['cpu_s']:.3f}s thread cpu, "
+            f"{record['process_cpu_s']:.3f}s process cpu, RSS {record['rss_delta_mb']:+.1f} MiB, "
+            f"peak RSS {record['peak_rss_mb']:.1f} MiB"
+        )
+
+
+class RunReport:
+    """
+    Stage records of one run, written as a structured JSON report.
+
+    Every stage is measured with ``measure`` and may carry extra fields
+    such as the strategy name and the rows and pairs it processed.
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name: str, **fields):
+        """Measure a block of code as a stage of this run."""
+        with measure(name) as record:
+            record.update(fields)
+            try:
+                yield record
+            finally:
+                self.stages.append(record)
+
+    def to_dict(self) -> dict:
+        return {
+            "started": self.started,
+            "wall_s": time.time() - self.started,
+            "peak_rss_mb": peak_rss() / 2**20,
+            "stages": self.stages,
+        }
+
+    def write(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+        logger.info(f"Run report saved to {path}")
+
+
+_run_report = None
+
+
+def get_run_report() -> RunReport:
+    """Report of the current process, created on first use."""
+    global _run_report
+    if _run_report is None:
+        _run_report = RunReport()
+    return _run_report
+
+
+def reset_run_report() -> RunReport:
+    """Start a new report for the current process, e.g. per worker task."""
+    global _run_report
+    _run_report = RunReport()
+    return _run_report
+
+
+def stage(name: str, **fields):
+    """Measure a block of code as a stage of the current run report."""
+    return get_run_report().stage(name, **fields)
+
+
+@contextmanager
+def profile(name: str, profiler: str = "cprofile", output_dir: str = "logs"):
+    """
+    Capture a profile of a block of code.
+
+    "cprofile" writes ``<output_dir>/<name>.prof`` for ``pstats`` or
+    snakeviz; "pyinstrument" writes ``<output_dir>/<name>_profile.html`` and
+    needs the optional pyinstrument package.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if profiler == "cprofile":
+        import cProfile
+
+        capture = cProfile.Profile()
+        capture.enable()
+        try:
+            yield
+        finally:
+            capture.disable()
+            path = os.path.join(output_dir, f"{name}.prof")
+            capture.dump_stats(path)
+    elif profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError as e:
+            raise ImportError(
+                "profiler='pyinstrument' requires the pyinstrument package"
+            ) from e
+
+        capture = Profiler()
+        capture.start()
+        try:
+            yield
+        finally:
+            capture.stop()
+            path = os.path.join(output_dir, f"{name}_profile.html")
+            with open(path, "w") as f:
+                f.write(capture.output_html())
+    else:
+        raise ValueError(f"Unknown profiler '{profiler}'")
+    logger.info(f"Profile of {name} saved to {path}")
@@ -1,6 +1,7 @@
 import os
 import logging
 from config import config
+from utils.profiling import stage
 
 
 def setup_logging():
@@ -27,13 +28,24 @@ def initialize_exchange():
         raise
 
 
-def load_price_data(exchange):
-    """Load price data from exchange."""
+def load_price_data(exchange, fields=None):
+    """
+    Load price data from exchange, restricted to the configured pairs and
+    window and, if given, to the OHLCV fields a strategy needs.
+    """
     from core.data_loader import DataLoader
 
     data_loader = DataLoader(exchange)
     try:
-        price_data = data_loader.load_data()
+        with stage("load_data") as record:
+            price_data = data_loader.load_data(
+                pairs=config.pairs,
+                fields=fields,
+                start=config.window_start,
+                end=config.window_end,
+            )
+            record["rows"] = price_data.shape[0]
+            record["pairs"] = price_data.columns.get_level_values(0).nunique()
         logging.info(f"Data loaded successfully: {price_data.shape[1]} symbols")
         return price_data
     except ValueError as e:
@@ -41,6 +53,39 @@ def load_price_data(exchange):
         raise
 
 
+def select_fields(price_data, fields):
+    """Columns of the given OHLCV fields, for every pair."""
+    return price_data.loc[
+        :, price_data.columns.get_level_values("ohlcv").isin(list(fields))
+    ]
+
+
+def cached_data_path(exchange) -> str:
+    """
+    Path of the validated parquet cache that chunked backtests stream from,
+    fetching the data first if the cache does not exist yet.
+    """
+    from core.data_loader import DataLoader
+
+    if config.cache_mode != "file" or config.data_format != "parquet":
+        raise ValueError("Chunked backtests need the parquet file cache")
+
+    data_loader = DataLoader(exchange)
+    if not os.path.exists(data_loader.data_path):
+        data_loader.load_data()
+    return data_loader.data_path
+
+
+def build_strategy(strategy_cls, price_data):
+    """Instantiate a strategy, wrapping it in a sweep if it has a parameter grid."""
+    from core.sweep import ParameterSweep
+
+    param_grid = config.param_grids.get(strategy_cls)
+    if param_grid:
+        return ParameterSweep(price_data, strategy_cls, param_grid)
+    return strategy_cls(price_data)
+
+
 def setup_directories():
     """Create required directories."""
     os.makedirs(config.results_dir, exist_ok=True)